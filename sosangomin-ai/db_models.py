@@ -2,7 +2,7 @@
 import os
 import logging
 import datetime
-from sqlalchemy import create_engine, event, Column, String, DateTime, Integer, Text, ForeignKey, Date, Enum, Float, BigInteger, INTEGER, Boolean
+from sqlalchemy import create_engine, event, Column, String, DateTime, Integer, Text, ForeignKey, Date, Enum, Float, BigInteger, INTEGER, Boolean, JSON, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -394,3 +394,54 @@ class Facilities(Base):
 
     created_at = Column(DateTime, default=datetime.datetime.now, comment="데이터 수집 시점")
 
+class AreaAnalysisSnapshot(Base):
+    __tablename__ = "area_analysis_snapshots"
+    __table_args__ = (
+        UniqueConstraint("region_name", "industry_name", name="uq_area_snapshot_region_industry"),
+    )
+
+    snapshot_id = Column(Integer, primary_key=True, autoincrement=True)
+    region_name = Column(String(100), nullable=False, comment="행정동")
+    industry_name = Column(String(100), nullable=False, comment="업종명")
+
+    # 스냅샷 생성 기준 데이터 분기 (매출 데이터 기준)
+    year = Column(Integer, nullable=True)
+    quarter = Column(Integer, nullable=True)
+
+    # /api/area-analysis 응답 페이로드
+    summary = Column(JSON, nullable=True, comment="요약 분석")
+    population = Column(JSON, nullable=True, comment="인구 분석")
+    category = Column(JSON, nullable=True, comment="업종 분석")
+    sales = Column(JSON, nullable=True, comment="매출 분석")
+
+    created_at = Column(DateTime, default=datetime.datetime.now, comment="스냅샷 생성 시점")
+    updated_at = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
+
+class DatasetVersion(Base):
+    __tablename__ = "dataset_versions"
+
+    dataset = Column(String(50), primary_key=True, comment="데이터셋 이름 (population, sales_data 등)")
+    version = Column(Integer, nullable=False, default=0, comment="수집 작업 커밋마다 증가하는 버전")
+    updated_at = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
+
+class IngestionCheckpoint(Base):
+    __tablename__ = "ingestion_checkpoints"
+
+    dataset = Column(String(50), primary_key=True, comment="수집 데이터셋 (서울 열린데이터 서비스명)")
+    quarter = Column(String(10), nullable=True, comment="수집 중/완료된 기준 분기 (STDR_YYQU_CD)")
+    status = Column(String(20), nullable=False, default="running", comment="running / completed")
+    total_pages = Column(Integer, nullable=True, comment="전체 페이지 수")
+    updated_at = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
+
+class IngestionCheckpointPage(Base):
+    __tablename__ = "ingestion_checkpoint_pages"
+    __table_args__ = (
+        UniqueConstraint("dataset", "quarter", "page", name="uq_ingestion_page"),
+    )
+
+    page_id = Column(Integer, primary_key=True, autoincrement=True)
+    dataset = Column(String(50), nullable=False, comment="수집 데이터셋")
+    quarter = Column(String(10), nullable=False, comment="기준 분기 (STDR_YYQU_CD)")
+    page = Column(Integer, nullable=False, comment="페이지 번호 (0부터)")
+    rows = Column(JSON, nullable=False, comment="페이지 원본 행")
+    created_at = Column(DateTime, default=datetime.datetime.now)
@@ -16,6 +16,9 @@ from schedulers.area_analysis_scheduler import start_area_scheduler
 from schedulers.transport_scheduler import start_subway_station_scheduler
 from schedulers.weather_scheduler import start_weather_scheduler
 
+from services.webdriver_pool_service import webdriver_pool_service
+from services.llm_client import llm_client
+
 is_windows = platform.system() == "Windows"
 if not is_windows:
     import fcntl
@@ -114,6 +117,11 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    # 풀에 남아 있는 Chrome 프로세스 종료
+    webdriver_pool_service.shutdown()
+    # Claude API 커넥션 풀 정리
+    await llm_client.close()
+
     if is_windows:
         logger.info("Windows 환경에서 애플리케이션 종료")
         return
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException, Path, Query, Form
 from database.connector import database_instance
 from services.area_analysis_service import area_analysis_service
+from services.area_snapshot_service import area_snapshot_service
+from services.aggregate_cache_service import aggregate_cache_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ router = APIRouter(
 def summary_view(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
     db = database_instance.pre_session()
     try:
+        snapshot = area_snapshot_service.get_snapshot(db, region_name, industry_name)
+        if snapshot and snapshot.summary:
+            return snapshot.summary
         return area_analysis_service.get_summary_analysis(db, region_name, industry_name)
     finally:
         db.close()
@@ -23,12 +28,10 @@ def summary_view(region_name: str = Query(..., description="행정동 이름"),
 def population_analysis(region_name: str = Query(..., description="행정동 이름")):
     db = database_instance.pre_session()
     try:
-        result = {
-            "resident_pop": area_analysis_service.get_resident_population_analysis(db, region_name),
-            "working_pop": area_analysis_service.get_working_population_analysis(db, region_name),
-            "floating_pop": area_analysis_service.get_floating_population_analysis(db, region_name)
-        }
-        return result
+        population = area_snapshot_service.get_population_snapshot(db, region_name)
+        if population:
+            return population
+        return area_analysis_service.get_population_analysis(db, region_name)
     finally:
         db.close()
 
@@ -36,13 +39,10 @@ def population_analysis(region_name: str = Query(..., description="행정동 이
 def category_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
     db = database_instance.pre_session()
     try:
-        result = {
-            "main_category_store_count": area_analysis_service.get_main_category_store_count(db, region_name),
-            "food_category_stats": area_analysis_service.get_food_store_category_stats(db, region_name, industry_name),
-            "store_open_close": area_analysis_service.get_store_open_close_trend(db, region_name, industry_name),
-            "operation_duration_summary": area_analysis_service.get_store_operation_duration_summary(db, region_name)
-        }
-        return result
+        snapshot = area_snapshot_service.get_snapshot(db, region_name, industry_name)
+        if snapshot and snapshot.category:
+            return snapshot.category
+        return area_analysis_service.get_category_payload(db, region_name, industry_name)
     finally:
         db.close()
 
@@ -50,16 +50,18 @@ def category_analysis(region_name: str = Query(..., description="행정동 이
 def sales_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
     db = database_instance.pre_session()
     try:
-        result = {
-            "main_category_sales_count": area_analysis_service.get_main_category_sales_count(db, region_name),
-            "food_sales_stats": area_analysis_service.get_food_store_sales_stats(db, region_name, industry_name),
-            "sales_comparison": area_analysis_service.get_industry_sales_comparison(db, industry_name, region_name),
-            "sales_detail": area_analysis_service.get_sales_detail(db, region_name, industry_name)
-        }
-        return result
+        snapshot = area_snapshot_service.get_snapshot(db, region_name, industry_name)
+        if snapshot and snapshot.sales:
+            return snapshot.sales
+        return area_analysis_service.get_sales_payload(db, region_name, industry_name)
     finally:
         db.close()
 
+@router.get("/cache-stats")
+def cache_stats():
+    """서울시 집계값 캐시 적중/미스 통계 (워커 프로세스 단위)"""
+    return aggregate_cache_service.get_stats()
+
 # 테스트 전용 실행 
 if __name__ == "__main__":
     from fastapi import FastAPI
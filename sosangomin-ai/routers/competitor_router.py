@@ -1,7 +1,9 @@
 # routers/competitor_router.py
 
 from fastapi import APIRouter, HTTPException, Path, Body, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
+import json
 import logging
 from pydantic import BaseModel
 from services.competitor_service import competitor_service
@@ -23,6 +25,11 @@ class CompetitorComparisonRequest(BaseModel):
     competitor_place_id: str
     analysis_id: Optional[str] = None  
 
+class CompetitorStreamRequest(BaseModel):
+    store_id: int
+    competitor_name: str
+    analysis_id: Optional[str] = None
+
 @router.post("/search")
 async def search_competitor(request: CompetitorAnalysisRequest):
     """
@@ -95,6 +102,26 @@ async def compare_with_competitor(request: CompetitorComparisonRequest):
         logger.error(f"리뷰 비교 분석 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"리뷰 비교 분석 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/compare/stream")
+async def stream_competitor_comparison(request: CompetitorStreamRequest):
+    """
+    경쟁사 비교 분석 스트리밍 API
+    
+    경쟁사 검색/리뷰 분석과 내 분석 결과 조회를 동시에 진행하고,
+    단계별 결과를 한 줄에 하나씩 JSON(NDJSON)으로 전달.
+    (competitor_info → comparison_data → comparison_insight, 실패 시 error)
+    비교 통계는 LLM 인사이트 생성 전에 먼저 전달되며, 분석 결과는 DB에 저장.
+    """
+    async def event_stream():
+        async for event in competitor_service.stream_comparison(
+            request.store_id,
+            request.competitor_name,
+            request.analysis_id
+        ):
+            yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
 @router.get("/comparison/{comparison_id}")
 async def get_comparison_result(comparison_id: str = Path(..., description="비교 분석 결과 ID")):
     """
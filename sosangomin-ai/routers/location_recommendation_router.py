@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Request, Response
 from database.connector import database_instance
 from services.location_recommendation_service  import location_recommendation_service 
 from typing import List
+from pydantic import BaseModel, Field
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,17 +13,41 @@ router = APIRouter(
     responses={404: {"description": "찾을 수 없음"}},
 )
 
+class RecommendProfile(BaseModel):
+    industry_name: str
+    target_age: str
+    priority: List[str]
+
+class BatchRecommendRequest(BaseModel):
+    profiles: List[RecommendProfile]
+    top_n: int = Field(3, ge=1, le=100, description="프로필별 추천받을 상위 행정동 개수")
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 목록, W/ 약한 검사기, *)가 ETag와 일치하는지"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
 @router.get('/heatmap')
-def prepare_initial_heatmap_data():
-    db = database_instance.pre_session()
+def prepare_initial_heatmap_data(request: Request):
     try:
-        result = location_recommendation_service.prepare_initial_heatmap_data()
-        return result
+        payload = location_recommendation_service.get_heatmap_payload()
     except Exception as e:
         logger.error(f"히트맵 데이터 호출 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail="히트맵 데이터 호출 중 오류가 발생했습니다.")
-    finally:
-        db.close()
+
+    headers = {"ETag": payload["etag"], "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), payload["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload["body"], media_type="application/json", headers=headers)
 
 @router.post("/recommend")
 def recommend_location(
@@ -67,6 +92,33 @@ def recommend_map_locations(
         raise HTTPException(status_code=500, detail="입지 등급 맵 호출 중 오류가 발생했습니다.")
 
 
+@router.post("/recommend/batch")
+def recommend_location_batch(request: BatchRecommendRequest):
+    """여러 추천 프로필을 한 번에 점수화하여 프로필별 상위 행정동 반환"""
+    if not request.profiles:
+        raise HTTPException(status_code=400, detail="추천 프로필이 비어 있습니다.")
+
+    # 점수 항목에 없는 우선순위는 가중치에 반영되지 않으므로 거부
+    score_labels = location_recommendation_service.SCORE_LABELS
+    unknown = sorted({label for profile in request.profiles for label in profile.priority if label not in score_labels})
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 우선순위 항목입니다: {unknown}. 가능한 항목: {score_labels}"
+        )
+
+    try:
+        return location_recommendation_service.recommend_locations_batch(
+            profiles=[profile.model_dump() for profile in request.profiles],
+            top_n=request.top_n
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 입지 추천 중 오류 발생: {e}")
+        raise HTTPException(status_code=500, detail="일괄 입지 추천 중 오류가 발생했습니다.")
+
+
 # 테스트 전용 실행 
 # PYTHON=. python -m routers.location_recommendation_router
 import asyncio
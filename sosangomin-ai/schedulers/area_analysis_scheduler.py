@@ -6,9 +6,28 @@ from services.resident_population_service import resident_population_service
 from services.working_population_service import working_population_service
 from services.store_category_service import store_category_service
 from services.sales_service import sales_service
+from services.area_snapshot_service import area_snapshot_service
+from services.ingestion_checkpoint_service import ingestion_checkpoint_service
 
 logger = logging.getLogger(__name__)
 
+# 수집 실패 시 재시도 간격 - 체크포인트에서 이어서 수집하므로 짧게 재시도
+RETRY_INTERVAL = 60 * 60
+
+async def run_ingestion(name: str, update_func) -> bool:
+    """수집 작업 실행 후 성공 여부 반환 (새 데이터가 반영된 경우에만 스냅샷 재생성)"""
+    logger.info(f"{name} 데이터 업데이트 시작")
+    result = await update_func()
+
+    if result == ingestion_checkpoint_service.FAILED:
+        logger.warning(f"{name} 데이터 업데이트 실패 - {RETRY_INTERVAL // 60}분 후 체크포인트에서 재개")
+        return False
+
+    logger.info(f"{name} 데이터 업데이트 완료 ({result})")
+    if result == ingestion_checkpoint_service.UPDATED:
+        await area_snapshot_service.refresh_snapshots()
+    return True
+
 # =====================
 #  인구 데이터 스케줄링
 # =====================
@@ -16,25 +35,25 @@ async def schedule_resident_population_updates():
     """상주 인구 데이터 월별 갱신 스케줄러"""
     while True:
         try:
-            logger.info("상주 인구 데이터 업데이트 시작")
-            await resident_population_service.update_population_data()
-            logger.info("상주 인구 데이터 업데이트 완료")
+            if not await run_ingestion("상주 인구", resident_population_service.update_population_data):
+                await asyncio.sleep(RETRY_INTERVAL)
+                continue
             await asyncio.sleep(60 * 60 * 24 * 30)  # 한 달 후 재실행
         except Exception as e:
             logger.error(f"상주 인구 스케줄 오류: {e}")
-            await asyncio.sleep(60 * 60 * 24)
+            await asyncio.sleep(RETRY_INTERVAL)
 
 async def schedule_working_population_updates():
     """직장 인구 데이터 월별 갱신 스케줄러"""
     while True:
         try:
-            logger.info("직장 인구 데이터 업데이트 시작")
-            await working_population_service.update_population_data()
-            logger.info("직장 인구 데이터 업데이트 완료")
+            if not await run_ingestion("직장 인구", working_population_service.update_population_data):
+                await asyncio.sleep(RETRY_INTERVAL)
+                continue
             await asyncio.sleep(60 * 60 * 24 * 30)
         except Exception as e:
             logger.error(f"직장 인구 스케줄 오류: {e}")
-            await asyncio.sleep(60 * 60 * 24)
+            await asyncio.sleep(RETRY_INTERVAL)
 
 # ========================
 # 업종 분석 데이터 스케줄링
@@ -43,13 +62,13 @@ async def schedule_store_category_updates():
     """점포/변화지표 데이터 3개월 주기 갱신"""
     while True:
         try:
-            logger.info("업종 분석 데이터 업데이트 시작")
-            await store_category_service.update_store_data()
-            logger.info("업종 분석 데이터 업데이트 완료")
+            if not await run_ingestion("업종 분석", store_category_service.update_store_data):
+                await asyncio.sleep(RETRY_INTERVAL)
+                continue
             await asyncio.sleep(60 * 60 * 24 * 30 * 3)  # 3개월 주기
         except Exception as e:
             logger.error(f"업종 분석 스케줄 오류: {e}")
-            await asyncio.sleep(60 * 60 * 24 * 3)
+            await asyncio.sleep(RETRY_INTERVAL)
 
 # ========================
 # 매출 분석 데이터 스케줄링
@@ -58,13 +77,13 @@ async def schedule_sales_updates():
     """매출 데이터 3개월 주기 갱신"""
     while True:
         try:
-            logger.info("매출 데이터 업데이트 시작")
-            await sales_service.update_sales_data()
-            logger.info("매출 데이터 업데이트 완료")
+            if not await run_ingestion("매출", sales_service.update_sales_data):
+                await asyncio.sleep(RETRY_INTERVAL)
+                continue
             await asyncio.sleep(60 * 60 * 24 * 30 * 3)  # 3개월 주기
         except Exception as e:
             logger.error(f"매출 스케줄 오류: {e}")
-            await asyncio.sleep(60 * 60 * 24 * 3)
+            await asyncio.sleep(RETRY_INTERVAL)
 
 
 # ========================
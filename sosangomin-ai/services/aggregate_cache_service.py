@@ -0,0 +1,208 @@
+# services/aggregate_cache_service.py
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, desc
+from db_models import DatasetVersion, Population, StoreCategories, SalesData, Facilities, RentInfo
+
+logger = logging.getLogger(__name__)
+
+class AggregateCacheService:
+    """서울시 전체 집계값을 데이터셋 버전 단위로 캐싱하는 프로세스 내 캐시
+
+    수집 서비스가 데이터를 커밋할 때 bump_version()으로 dataset_versions 테이블의
+    버전을 올리면, 각 워커는 버전이 바뀐 데이터셋의 집계값만 다시 계산한다.
+    """
+
+    POPULATION = "population"
+    STORE_CATEGORIES = "store_categories"
+    SALES_DATA = "sales_data"
+    FACILITIES = "facilities"
+    RENT_INFO = "rent_info"
+
+    def __init__(self, version_check_interval: int = 60):
+        # 버전 테이블 조회 주기(초) - 요청마다 버전을 조회하지 않도록 제한
+        self.version_check_interval = version_check_interval
+
+        # 수집 서비스가 없어 bump_version이 호출되지 않는 데이터셋은 TTL(초) 주기로 다시 계산
+        # (임대료 데이터는 DB에 직접 적재됨)
+        self.ttl_datasets = {
+            self.RENT_INFO: int(os.getenv("AGGREGATE_CACHE_RENT_INFO_TTL", 60 * 60 * 6))
+        }
+
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._versions_checked_at = 0.0
+        self._cache: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        logger.info("AggregateCacheService 초기화 완료")
+
+    # =====================
+    #  데이터셋 버전 관리
+    # =====================
+
+    def bump_version(self, db: Session, dataset: str) -> None:
+        """데이터셋 버전 증가 (수집 서비스의 commit 직전에 같은 세션으로 호출)"""
+        try:
+            DatasetVersion.__table__.create(bind=db.get_bind(), checkfirst=True)
+
+            row = db.query(DatasetVersion).filter(DatasetVersion.dataset == dataset).first()
+            if row:
+                row.version = (row.version or 0) + 1
+            else:
+                db.add(DatasetVersion(dataset=dataset, version=1))
+
+            # 현재 프로세스는 다음 조회 시 바로 새 버전을 읽도록 함
+            with self._lock:
+                self._versions_checked_at = 0.0
+
+        except Exception as e:
+            logger.warning(f"{dataset} 데이터셋 버전 갱신 실패: {e}")
+
+    def get_versions(self, db: Session) -> Dict[str, int]:
+        """데이터셋 버전 조회 (version_check_interval 동안은 메모리 값 사용)"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._versions_checked_at < self.version_check_interval:
+                return dict(self._versions)
+
+        try:
+            versions = {row.dataset: row.version for row in db.query(DatasetVersion).all()}
+        except Exception as e:
+            # 버전 테이블이 아직 없으면 버전 0으로 간주
+            logger.debug(f"데이터셋 버전 조회 실패: {e}")
+            versions = {}
+
+        with self._lock:
+            self._versions = versions
+            self._versions_checked_at = now
+            return dict(versions)
+
+    def _version_of(self, versions: Dict[str, int], dataset: str) -> Tuple[int, int]:
+        """데이터셋 버전 + TTL 구간 번호 (TTL 대상이 아니면 구간은 0)"""
+        ttl = self.ttl_datasets.get(dataset)
+        period = int(time.time() // ttl) if ttl else 0
+        return (versions.get(dataset, 0), period)
+
+    # =====================
+    #  캐시 조회
+    # =====================
+
+    def get_or_compute(self, db: Session, name: str, datasets: Iterable[str], compute: Callable[[], Any]) -> Any:
+        """name 키의 집계값을 조회하고, 의존 데이터셋 버전이 바뀌었으면 다시 계산"""
+        versions = self.get_versions(db)
+        version_key = tuple(self._version_of(versions, dataset) for dataset in datasets)
+
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == version_key:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._cache[name] = (version_key, value)
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "entries": len(self._cache),
+                "versions": dict(self._versions)
+            }
+
+    def clear(self) -> None:
+        """캐시 전체 초기화"""
+        with self._lock:
+            self._cache.clear()
+            self._versions_checked_at = 0.0
+
+    # =====================
+    #  공통 집계값
+    # =====================
+
+    def get_seoul_population_averages(self, db: Session) -> Dict[str, Any]:
+        """서울시 전체 평균 상주/직장/유동 인구"""
+        def compute():
+            row = db.query(
+                func.avg(Population.tot_repop),
+                func.avg(Population.tot_wrpop),
+                func.avg(Population.tot_fpop)
+            ).one()
+            return {"repop": row[0], "wrpop": row[1], "fpop": row[2]}
+
+        return self.get_or_compute(db, "seoul_population_averages", [self.POPULATION], compute)
+
+    def get_latest_quarters(self, db: Session, model, limit: int = 1) -> List[Tuple[int, int]]:
+        """StoreCategories/SalesData/Facilities의 최신 (year, quarter) 목록 (최신순)"""
+        dataset = {
+            StoreCategories: self.STORE_CATEGORIES,
+            SalesData: self.SALES_DATA,
+            Facilities: self.FACILITIES
+        }[model]
+
+        def compute():
+            rows = (
+                db.query(model.year, model.quarter)
+                .distinct()
+                .order_by(desc(model.year), desc(model.quarter))
+                .limit(limit)
+                .all()
+            )
+            return [(row.year, row.quarter) for row in rows]
+
+        return self.get_or_compute(db, f"latest_quarters:{model.__tablename__}:{limit}", [dataset], compute)
+
+    def get_latest_quarter(self, db: Session, model) -> Optional[Tuple[int, int]]:
+        """최신 (year, quarter), 데이터가 없으면 None"""
+        quarters = self.get_latest_quarters(db, model, 1)
+        return quarters[0] if quarters else None
+
+    def get_latest_rent_quarter(self, db: Session) -> Optional[Tuple[str, str]]:
+        """RentInfo의 최신 (기준년코드, 기준분기코드)"""
+        def compute():
+            row = (
+                db.query(RentInfo.STRD_YR_CD, RentInfo.STRD_QTR_CD)
+                .order_by(RentInfo.STRD_YR_CD.desc(), RentInfo.STRD_QTR_CD.desc())
+                .first()
+            )
+            return (row.STRD_YR_CD, row.STRD_QTR_CD) if row else None
+
+        return self.get_or_compute(db, "latest_quarter:rent_info", [self.RENT_INFO], compute)
+
+    def get_dong_to_district(self, db: Session, model=StoreCategories) -> Dict[str, str]:
+        """행정동 → 자치구 매핑"""
+        dataset = {
+            StoreCategories: self.STORE_CATEGORIES,
+            SalesData: self.SALES_DATA
+        }[model]
+
+        def compute():
+            rows = (
+                db.query(model.region_name, model.district_name)
+                .filter(model.district_name.isnot(None))
+                .distinct()
+                .all()
+            )
+            mapping = {}
+            for row in rows:
+                mapping.setdefault(row.region_name, row.district_name)
+            return mapping
+
+        return self.get_or_compute(db, f"dong_to_district:{model.__tablename__}", [dataset], compute)
+
+aggregate_cache_service = AggregateCacheService()
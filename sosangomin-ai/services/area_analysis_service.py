@@ -4,6 +4,7 @@ from collections import defaultdict
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, tuple_
 from db_models import StoreCategories, Population, SalesData
+from services.aggregate_cache_service import aggregate_cache_service
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -20,121 +21,150 @@ class AreaAnalysisService:
         """상권분석 요약: 인구 + 업종 주요 정보"""
         try:
             # 인구분석
-            resident = self.get_resident_population_analysis(db, region_name)
-            working = self.get_working_population_analysis(db, region_name)
-            floating = self.get_floating_population_analysis(db, region_name)
+            population = self.get_population_analysis(db, region_name)
+            resident = population["resident_pop"]
+            working = population["working_pop"]
+            floating = population["floating_pop"]
 
             # 업종분석
             category_stats = self.get_food_store_category_stats(db, region_name, industry_name)
             trend = self.get_store_open_close_trend(db, region_name, industry_name)
 
-            # 최근 분기 추출 (trend는 오름차순 정렬된 4개 분기 리스트)
-            if trend and trend.get("기준 연도") and trend.get("업소수"):
-                recent_index = -1  # 가장 최근 분기
-                recent_year = trend["기준 연도"][recent_index]
-                recent_quarter = trend["기준 분기"][recent_index]
-                store_count = trend["업소수"][recent_index]
-                open_rate = trend["개업률"][recent_index]
-                close_rate = trend["폐업률"][recent_index]
-                open_count = int(round(store_count * open_rate))
-                close_count = int(round(store_count * close_rate))
-            else:
-                recent_year, recent_quarter, store_count, open_count, close_count = (None,) * 5
-
             # 매출분석
             sales_stats = self.get_food_store_sales_stats(db, region_name, industry_name)
             detail = self.get_sales_detail(db, region_name, industry_name)
 
-            return {
-                "인구분석": {
-                    "가장_많은_거주_연령대": resident.get("가장_많은_성별_연령대"),
-                    "가장_많은_직장_연령대": working.get("가장_많은_성별_연령대"),
-                    "가장_많은_유동_연령대": floating.get("가장_많은_성별_연령대"),
-                    "가장_많은_요일": floating.get("가장_많은_요일"),
-                    "평일_주말_비교": {
-                        "평일": floating.get("평일_평균_유동인구"),
-                        "주말": floating.get("주말_평균_유동인구")
-                    },
-                    "가장_많은_시간대": floating.get("가장_많은_시간대")
+            return self.build_summary(resident, working, floating, category_stats, trend, sales_stats, detail)
+
+        except Exception as e:
+            logger.error(f"상권 요약 분석 중 오류 발생: {e}")
+            return {}
+
+    def build_summary(
+        self,
+        resident: Dict[str, Any],
+        working: Dict[str, Any],
+        floating: Dict[str, Any],
+        category_stats: Dict[str, Any],
+        trend: Dict[str, Any],
+        sales_stats: Dict[str, Any],
+        detail: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """이미 계산된 인구/업종/매출 분석 결과로 요약 응답 구성"""
+        # 최근 분기 추출 (trend는 오름차순 정렬된 4개 분기 리스트)
+        if trend and trend.get("기준 연도") and trend.get("업소수"):
+            recent_index = -1  # 가장 최근 분기
+            recent_year = trend["기준 연도"][recent_index]
+            recent_quarter = trend["기준 분기"][recent_index]
+            store_count = trend["업소수"][recent_index]
+            open_rate = trend["개업률"][recent_index]
+            close_rate = trend["폐업률"][recent_index]
+            open_count = int(round(store_count * open_rate))
+            close_count = int(round(store_count * close_rate))
+        else:
+            recent_year, recent_quarter, store_count, open_count, close_count = (None,) * 5
+
+        return {
+            "인구분석": {
+                "가장_많은_거주_연령대": resident.get("가장_많은_성별_연령대"),
+                "가장_많은_직장_연령대": working.get("가장_많은_성별_연령대"),
+                "가장_많은_유동_연령대": floating.get("가장_많은_성별_연령대"),
+                "가장_많은_요일": floating.get("가장_많은_요일"),
+                "평일_주말_비교": {
+                    "평일": floating.get("평일_평균_유동인구"),
+                    "주말": floating.get("주말_평균_유동인구")
                 },
-                "업종분석": {
-                    "요식업_도넛_및_순위": {
-                        "도넛": category_stats.get("행정동", {}).get("donut"),
-                        "top3": category_stats.get("행정동", {}).get("top3"),
-                        "내_업종_순위": category_stats.get("행정동", {}).get("industry_rank")
-                    },
-                    "내_업종_최근_분기": {
-                        "기준 연도": recent_year,
-                        "기준 분기": recent_quarter,
-                        "업소수": store_count,
-                        "개업수": open_count,
-                        "폐업수": close_count
-                    }
+                "가장_많은_시간대": floating.get("가장_많은_시간대")
+            },
+            "업종분석": {
+                "요식업_도넛_및_순위": {
+                    "도넛": category_stats.get("행정동", {}).get("donut"),
+                    "top3": category_stats.get("행정동", {}).get("top3"),
+                    "내_업종_순위": category_stats.get("행정동", {}).get("industry_rank")
                 },
-                "매출분석": {
-                    "요식업_도넛_및_순위": {
-                        "도넛": sales_stats.get("행정동", {}).get("donut"),
-                        "top3": sales_stats.get("행정동", {}).get("top3"),
-                        "내_업종_순위": sales_stats.get("행정동", {}).get("industry_rank")
-                    },
-                    "매출_금액_많은_요일": detail.get("요약", {}).get("매출_금액_많은_요일"),
-                    "매출_금액_많은_시간대": detail.get("요약", {}).get("매출_금액_많은_시간대"),
-                    "매출_금액_많은_연령대": detail.get("요약", {}).get("매출_금액_많은_연령대"), 
-                    "매출_건수_많은_요일": detail.get("요약", {}).get("매출_건수_많은_요일"),
-                    "매출_건수_많은_시간대": detail.get("요약", {}).get("매출_건수_많은_시간대"),
-                    "매출_건수_많은_연령대": detail.get("요약", {}).get("매출_건수_많은_연령대"),
-
+                "내_업종_최근_분기": {
+                    "기준 연도": recent_year,
+                    "기준 분기": recent_quarter,
+                    "업소수": store_count,
+                    "개업수": open_count,
+                    "폐업수": close_count
                 }
+            },
+            "매출분석": {
+                "요식업_도넛_및_순위": {
+                    "도넛": sales_stats.get("행정동", {}).get("donut"),
+                    "top3": sales_stats.get("행정동", {}).get("top3"),
+                    "내_업종_순위": sales_stats.get("행정동", {}).get("industry_rank")
+                },
+                "매출_금액_많은_요일": detail.get("요약", {}).get("매출_금액_많은_요일"),
+                "매출_금액_많은_시간대": detail.get("요약", {}).get("매출_금액_많은_시간대"),
+                "매출_금액_많은_연령대": detail.get("요약", {}).get("매출_금액_많은_연령대"), 
+                "매출_건수_많은_요일": detail.get("요약", {}).get("매출_건수_많은_요일"),
+                "매출_건수_많은_시간대": detail.get("요약", {}).get("매출_건수_많은_시간대"),
+                "매출_건수_많은_연령대": detail.get("요약", {}).get("매출_건수_많은_연령대"),
+
             }
+        }
 
-        except Exception as e:
-            logger.error(f"상권 요약 분석 중 오류 발생: {e}")
-            return {}
+    # =====================
+    #  라우터 응답 페이로드
+    # =====================
+
+    def get_category_payload(self, db: Session, region_name: str, industry_name: str) -> Dict[str, Any]:
+        """/category 응답 : 업종 분석"""
+        return {
+            "main_category_store_count": self.get_main_category_store_count(db, region_name),
+            "food_category_stats": self.get_food_store_category_stats(db, region_name, industry_name),
+            "store_open_close": self.get_store_open_close_trend(db, region_name, industry_name),
+            "operation_duration_summary": self.get_store_operation_duration_summary(db, region_name)
+        }
+
+    def get_sales_payload(self, db: Session, region_name: str, industry_name: str) -> Dict[str, Any]:
+        """/sales 응답 : 매출 분석"""
+        return {
+            "main_category_sales_count": self.get_main_category_sales_count(db, region_name),
+            "food_sales_stats": self.get_food_store_sales_stats(db, region_name, industry_name),
+            "sales_comparison": self.get_industry_sales_comparison(db, industry_name, region_name),
+            "sales_detail": self.get_sales_detail(db, region_name, industry_name)
+        }
         
     # =====================
     #  인구 데이터 분석 
     # =====================
-    
-    def get_resident_population_analysis(self, db: Session, region_name: str) -> Dict[str, Any]:
-        """인구 분석(상주인구) : 성별/연령대, 총인구, 서울 평균, 최대 인구 성별/연령대"""
-        try:
-            # 지역별 상주 인구 정보 조회
-            region_row = (
-                db.query(Population)
-                .filter(Population.region_name == region_name)
-                .order_by(desc(Population.created_at))
-                .first()
-            )
 
+    AGE_GENDER_KEYS = [
+        "male_10", "male_20", "male_30", "male_40", "male_50", "male_60",
+        "female_10", "female_20", "female_30", "female_40", "female_50", "female_60"
+    ]
+
+    def get_population_analysis(self, db: Session, region_name: str) -> Dict[str, Any]:
+        """인구 분석(상주/직장/유동) : Population 행 1회 조회 + 서울 평균 3종 1회 집계(데이터셋 버전별 캐시)"""
+        try:
+            region_row = self._get_latest_population_row(db, region_name)
             if not region_row:
-                return {}
+                return {"resident_pop": {}, "working_pop": {}, "floating_pop": {}}
 
-            # 서울시 전체 평균 상주 인구 계산
-            seoul_avg = db.query(func.avg(Population.tot_repop)).scalar()
+            seoul_avg = aggregate_cache_service.get_seoul_population_averages(db)
 
-            # 성별/연령대별 값 딕셔너리 구성
-            age_gender_keys = [
-                "male_10", "male_20", "male_30", "male_40", "male_50", "male_60",
-                "female_10", "female_20", "female_30", "female_40", "female_50", "female_60"
-            ]
+            return {
+                "resident_pop": self._build_resident_population(region_row, seoul_avg["repop"]),
+                "working_pop": self._build_working_population(region_row, seoul_avg["wrpop"]),
+                "floating_pop": self._build_floating_population(region_row, seoul_avg["fpop"])
+            }
 
-            pop_by_age_gender = {}
-            for key in age_gender_keys:
-                col_name = f"{key}_repop"
-                pop_by_age_gender[key] = getattr(region_row, col_name, 0) or 0
+        except Exception as e:
+            logger.error(f"인구 분석 중 오류 발생: {e}")
+            return {"resident_pop": {}, "working_pop": {}, "floating_pop": {}}
 
-            # 가장 높은 인구를 가진 성별/연령대
-            max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
+    def get_resident_population_analysis(self, db: Session, region_name: str) -> Dict[str, Any]:
+        """인구 분석(상주인구) : 성별/연령대, 총인구, 서울 평균, 최대 인구 성별/연령대"""
+        try:
+            region_row = self._get_latest_population_row(db, region_name)
+            if not region_row:
+                return {}
 
-            return {
-                "성별_연령별_상주인구": pop_by_age_gender,  # 막대그래프용
-                "총_상주인구": region_row.tot_repop,
-                "서울시_평균_상주인구": int(round(seoul_avg, 0)) if seoul_avg else None,
-                "가장_많은_성별_연령대": {
-                    "구분": region_row.dominant_age_gender_repop,
-                    "인구수": max_age_gender[1]
-                }
-            }
+            seoul_avg = aggregate_cache_service.get_seoul_population_averages(db)
+            return self._build_resident_population(region_row, seoul_avg["repop"])
 
         except Exception as e:
             logger.error(f"상주 인구 분석 중 오류 발생: {e}")
@@ -143,120 +173,130 @@ class AreaAnalysisService:
     def get_working_population_analysis(self, db: Session, region_name: str) -> Dict[str, Any]:
         """인구 분석(직장인구) : 성별/연령대, 총인구, 서울 평균, 최대 인구 성별/연령대"""
         try:
-            region_row = (
-                db.query(Population)
-                .filter(Population.region_name == region_name)
-                .order_by(desc(Population.created_at))
-                .first()
-            )
-
+            region_row = self._get_latest_population_row(db, region_name)
             if not region_row:
                 return {}
 
-            seoul_avg = db.query(func.avg(Population.tot_wrpop)).scalar()
-
-            age_gender_keys = [
-                "male_10", "male_20", "male_30", "male_40", "male_50", "male_60",
-                "female_10", "female_20", "female_30", "female_40", "female_50", "female_60"
-            ]
-
-            pop_by_age_gender = {}
-            for key in age_gender_keys:
-                col_name = f"{key}_wrpop"
-                pop_by_age_gender[key] = getattr(region_row, col_name, 0) or 0
-
-            max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
-
-            return {
-                "성별_연령별_직장인구": pop_by_age_gender,  
-                "총_직장인구": region_row.tot_wrpop,
-                "서울시_평균_직장인구": int(round(seoul_avg, 0)) if seoul_avg else None,
-                "가장_많은_성별_연령대": {
-                    "구분": region_row.dominant_age_gender_wrpop,
-                    "인구수": max_age_gender[1]
-                }
-            }
+            seoul_avg = aggregate_cache_service.get_seoul_population_averages(db)
+            return self._build_working_population(region_row, seoul_avg["wrpop"])
 
         except Exception as e:
             logger.error(f"직장 인구 분석 중 오류 발생: {e}")
             return {}
-        
 
     def get_floating_population_analysis(self, db: Session, region_name: str) -> Dict[str, Any]:
         """인구 분석(유동인구) : 성별/연령대, 총인구, 서울 평균, 최대 인구 성별/연령대"""
         try:
-            region_row = (
-                db.query(Population)
-                .filter(Population.region_name == region_name)
-                .order_by(desc(Population.created_at))
-                .first()
-            )
-
+            region_row = self._get_latest_population_row(db, region_name)
             if not region_row:
                 return {}
 
-            seoul_avg = db.query(func.avg(Population.tot_fpop)).scalar()
+            seoul_avg = aggregate_cache_service.get_seoul_population_averages(db)
+            return self._build_floating_population(region_row, seoul_avg["fpop"])
 
-            age_gender_keys = [
-                "male_10", "male_20", "male_30", "male_40", "male_50", "male_60",
-                "female_10", "female_20", "female_30", "female_40", "female_50", "female_60"
-            ]
+        except Exception as e:
+            logger.error(f"유동 인구 분석 중 오류 발생: {e}")
+            return {}
 
-            pop_by_age_gender = {}
-            for key in age_gender_keys:
-                col_name = f"{key}_fpop"
-                pop_by_age_gender[key] = getattr(region_row, col_name, 0) or 0
-
-            # 70대 포함해서 60대로 합산
-            pop_by_age_gender["male_60"] += getattr(region_row, "male_70_fpop", 0) or 0
-            pop_by_age_gender["female_60"] += getattr(region_row, "female_70_fpop", 0) or 0
-
-            max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
-
-            # 요일별 유동 인구
-            weekday_data = {
-                "monday": region_row.monday_fpop,
-                "tuesday": region_row.tuesday_fpop,
-                "wednesday": region_row.wednesday_fpop,
-                "thursday": region_row.thursday_fpop,
-                "friday": region_row.friday_fpop,
-                "saturday": region_row.saturday_fpop,
-                "sunday": region_row.sunday_fpop
+    def _get_latest_population_row(self, db: Session, region_name: str):
+        """행정동의 최신 Population 행 조회"""
+        return (
+            db.query(Population)
+            .filter(Population.region_name == region_name)
+            .order_by(desc(Population.created_at))
+            .first()
+        )
+
+    def _get_age_gender_population(self, region_row, suffix: str) -> Dict[str, int]:
+        """성별/연령대별 인구 딕셔너리 구성"""
+        return {
+            key: getattr(region_row, f"{key}_{suffix}", 0) or 0
+            for key in self.AGE_GENDER_KEYS
+        }
+
+    def _build_resident_population(self, region_row, seoul_avg) -> Dict[str, Any]:
+        """상주인구 분석 결과 구성"""
+        pop_by_age_gender = self._get_age_gender_population(region_row, "repop")
+
+        # 가장 높은 인구를 가진 성별/연령대
+        max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
+
+        return {
+            "성별_연령별_상주인구": pop_by_age_gender,  # 막대그래프용
+            "총_상주인구": region_row.tot_repop,
+            "서울시_평균_상주인구": int(round(seoul_avg, 0)) if seoul_avg else None,
+            "가장_많은_성별_연령대": {
+                "구분": region_row.dominant_age_gender_repop,
+                "인구수": max_age_gender[1]
             }
+        }
 
-            # 시간대별 유동 인구
-            time_data = {
-                "심야": region_row.late_night_fpop, # 00시~06시 
-                "이른 아침": region_row.early_morning_fpop, # 06시~09시
-                "오전": region_row.morning_peak_fpop, # 09시~12시
-                "점심": region_row.midday_fpop,  #12시~15시
-                "오후": region_row.afternoon_fpop,  #15시~18시
-                "퇴근 시간": region_row.evening_peak_fpop, #18시~21시
-                "밤": region_row.night_fpop,  #21시~00시
-            }
+    def _build_working_population(self, region_row, seoul_avg) -> Dict[str, Any]:
+        """직장인구 분석 결과 구성"""
+        pop_by_age_gender = self._get_age_gender_population(region_row, "wrpop")
 
-            return {
-                "성별_연령별_유동인구": pop_by_age_gender,  
-                "총_유동인구": region_row.tot_fpop,
-                "서울시_평균_유동인구": round(seoul_avg, 1) if seoul_avg else None,
-                "가장_많은_성별_연령대": {
-                    "구분": region_row.dominant_age_gender_fpop,
-                    "인구수": max_age_gender[1]
-                },
-                "요일별_유동인구": weekday_data,  # 막대 그래프
-                "가장_많은_요일": region_row.busiest_day_fpop,
-                "가장_적은_요일": region_row.quietest_day_fpop,
-                "평일_평균_유동인구": round(region_row.weekday_avg_fpop, 1) if region_row.weekday_avg_fpop else None,
-                "주말_평균_유동인구": round(region_row.weekend_avg_fpop, 1) if region_row.weekend_avg_fpop else None,
-
-                "시간대별_유동인구": time_data,  # 선 그래프
-                "가장_많은_시간대": region_row.busiest_hour_fpop,
-                "가장_적은_시간대": region_row.quietest_hour_fpop            
-            }
+        max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
 
-        except Exception as e:
-            logger.error(f"유동 인구 분석 중 오류 발생: {e}")
-            return {}
+        return {
+            "성별_연령별_직장인구": pop_by_age_gender,  
+            "총_직장인구": region_row.tot_wrpop,
+            "서울시_평균_직장인구": int(round(seoul_avg, 0)) if seoul_avg else None,
+            "가장_많은_성별_연령대": {
+                "구분": region_row.dominant_age_gender_wrpop,
+                "인구수": max_age_gender[1]
+            }
+        }
+
+    def _build_floating_population(self, region_row, seoul_avg) -> Dict[str, Any]:
+        """유동인구 분석 결과 구성"""
+        pop_by_age_gender = self._get_age_gender_population(region_row, "fpop")
+
+        # 70대 포함해서 60대로 합산
+        pop_by_age_gender["male_60"] += getattr(region_row, "male_70_fpop", 0) or 0
+        pop_by_age_gender["female_60"] += getattr(region_row, "female_70_fpop", 0) or 0
+
+        max_age_gender = max(pop_by_age_gender.items(), key=lambda x: x[1])
+
+        # 요일별 유동 인구
+        weekday_data = {
+            "monday": region_row.monday_fpop,
+            "tuesday": region_row.tuesday_fpop,
+            "wednesday": region_row.wednesday_fpop,
+            "thursday": region_row.thursday_fpop,
+            "friday": region_row.friday_fpop,
+            "saturday": region_row.saturday_fpop,
+            "sunday": region_row.sunday_fpop
+        }
+
+        # 시간대별 유동 인구
+        time_data = {
+            "심야": region_row.late_night_fpop, # 00시~06시 
+            "이른 아침": region_row.early_morning_fpop, # 06시~09시
+            "오전": region_row.morning_peak_fpop, # 09시~12시
+            "점심": region_row.midday_fpop,  #12시~15시
+            "오후": region_row.afternoon_fpop,  #15시~18시
+            "퇴근 시간": region_row.evening_peak_fpop, #18시~21시
+            "밤": region_row.night_fpop,  #21시~00시
+        }
+
+        return {
+            "성별_연령별_유동인구": pop_by_age_gender,  
+            "총_유동인구": region_row.tot_fpop,
+            "서울시_평균_유동인구": round(seoul_avg, 1) if seoul_avg else None,
+            "가장_많은_성별_연령대": {
+                "구분": region_row.dominant_age_gender_fpop,
+                "인구수": max_age_gender[1]
+            },
+            "요일별_유동인구": weekday_data,  # 막대 그래프
+            "가장_많은_요일": region_row.busiest_day_fpop,
+            "가장_적은_요일": region_row.quietest_day_fpop,
+            "평일_평균_유동인구": round(region_row.weekday_avg_fpop, 1) if region_row.weekday_avg_fpop else None,
+            "주말_평균_유동인구": round(region_row.weekend_avg_fpop, 1) if region_row.weekend_avg_fpop else None,
+
+            "시간대별_유동인구": time_data,  # 선 그래프
+            "가장_많은_시간대": region_row.busiest_hour_fpop,
+            "가장_적은_시간대": region_row.quietest_hour_fpop            
+        }
 
 
     # =====================
@@ -266,13 +306,9 @@ class AreaAnalysisService:
         """업종 분석 : 특정 행정동 기준 최신 4개 분기의 main_category별 점포 수 증감률(%) 조회 (직전 분기와 비교, 0일 경우 None 처리, 최초 분기 제외)"""
         try:
             # 최신 4개 (year, quarter) 조합
-            subquery = (
-                db.query(StoreCategories.year, StoreCategories.quarter)
-                .distinct()
-                .order_by(desc(StoreCategories.year), desc(StoreCategories.quarter))
-                .limit(4)
-                .subquery()
-            )
+            latest_quarters = aggregate_cache_service.get_latest_quarters(db, StoreCategories, 4)
+            if not latest_quarters:
+                return {"growth_rate_trend": [], "summary": None}
 
             result = (
                 db.query(
@@ -282,7 +318,7 @@ class AreaAnalysisService:
                     func.sum(StoreCategories.store_count).label("store_count")
                 )
                 .filter(StoreCategories.region_name == region_name)
-                .join(subquery, tuple_(StoreCategories.year, StoreCategories.quarter) == tuple_(subquery.c.year, subquery.c.quarter))
+                .filter(tuple_(StoreCategories.year, StoreCategories.quarter).in_(latest_quarters))
                 .group_by(StoreCategories.year, StoreCategories.quarter, StoreCategories.main_category)
                 .order_by(desc(StoreCategories.year), desc(StoreCategories.quarter))
                 .all()
@@ -362,24 +398,15 @@ class AreaAnalysisService:
     def get_food_store_category_stats(self, db: Session, region_name: str, industry_name: str) -> Dict[str, Any]:
         """업종 분석 : 외식업 세부 업종 도넛 차트 + 상위 3개 업종 + 대상 업종 순위"""
         try:
-            latest = db.query(
-                StoreCategories.year,
-                StoreCategories.quarter
-            ).order_by(desc(StoreCategories.year), desc(StoreCategories.quarter)).first()
-
+            latest = aggregate_cache_service.get_latest_quarter(db, StoreCategories)
             if not latest:
                 return {}
 
-            year, quarter = latest.year, latest.quarter
+            year, quarter = latest
             filters = (StoreCategories.year == year) & (StoreCategories.quarter == quarter)
 
             # district_name 매핑
-            district_name_row = (
-                db.query(StoreCategories.district_name)
-                .filter(StoreCategories.region_name == region_name)
-                .first()
-            )
-            district_name = district_name_row.district_name if district_name_row else None
+            district_name = aggregate_cache_service.get_dong_to_district(db, StoreCategories).get(region_name)
 
             # 통계 + 순위 계산 함수
             def get_area_stats(area_field: str = None, area_value: str = None) -> Dict[str, Any]:
@@ -476,24 +503,15 @@ class AreaAnalysisService:
         """업종 분석 : 운영/폐업 영업 개월 평균 (행정동 + 자치구 + 서울시 전체 기준)"""
         try:
             # 최신 연도/분기 구하기
-            latest = db.query(
-                StoreCategories.year,
-                StoreCategories.quarter
-            ).order_by(desc(StoreCategories.year), desc(StoreCategories.quarter)).first()
-
+            latest = aggregate_cache_service.get_latest_quarter(db, StoreCategories)
             if not latest:
                 return {}
 
-            year, quarter = latest.year, latest.quarter
+            year, quarter = latest
             filters = (StoreCategories.year == year) & (StoreCategories.quarter == quarter)
 
             # district_name 매핑 
-            district_name_row = (
-                db.query(StoreCategories.district_name)
-                .filter(StoreCategories.region_name == region_name)
-                .first()
-            )
-            district_name = district_name_row.district_name if district_name_row else None
+            district_name = aggregate_cache_service.get_dong_to_district(db, StoreCategories).get(region_name)
 
             # 행정동 기준 평균
             region_row = (
@@ -606,13 +624,9 @@ class AreaAnalysisService:
     def get_main_category_sales_count(self, db: Session, region_name: str) -> List[Dict[str, Any]]:
         """대분류별 매출 건수 증감률 추세 (최근 4개 분기 기준, 직전 분기와 비교, 0일 경우 None, 최초 분기 제외)"""
         try:
-            subquery = (
-                db.query(SalesData.year, SalesData.quarter)
-                .distinct()
-                .order_by(desc(SalesData.year), desc(SalesData.quarter))
-                .limit(4)
-                .subquery()
-            )
+            latest_quarters = aggregate_cache_service.get_latest_quarters(db, SalesData, 4)
+            if not latest_quarters:
+                return {"growth_rate_trend": [], "summary": None}
 
             results = (
                 db.query(
@@ -622,7 +636,7 @@ class AreaAnalysisService:
                     func.sum(SalesData.sales_count).label("total_sales_count")
                 )
                 .filter(SalesData.region_name == region_name)
-                .join(subquery, tuple_(SalesData.year, SalesData.quarter) == tuple_(subquery.c.year, subquery.c.quarter))
+                .filter(tuple_(SalesData.year, SalesData.quarter).in_(latest_quarters))
                 .group_by(SalesData.year, SalesData.quarter, SalesData.main_category)
                 .order_by(desc(SalesData.year), desc(SalesData.quarter))
                 .all()
@@ -695,15 +709,14 @@ class AreaAnalysisService:
     def get_food_store_sales_stats(self, db: Session, region_name: str, industry_name: str) -> Dict[str, Any]:
         """외식업 매출 건수 기준 상위 업종 및 내 업종 순위 (서울시/자치구/행정동 기준)"""
         try:
-            latest = db.query(SalesData.year, SalesData.quarter).order_by(desc(SalesData.year), desc(SalesData.quarter)).first()
+            latest = aggregate_cache_service.get_latest_quarter(db, SalesData)
             if not latest:
                 return {}
             year, quarter = latest
             filters = (SalesData.year == year) & (SalesData.quarter == quarter) & (SalesData.main_category == "외식업")
 
             # 자치구 추출
-            district_name_row = db.query(SalesData.district_name).filter(SalesData.region_name == region_name).first()
-            district_name = district_name_row.district_name if district_name_row else None
+            district_name = aggregate_cache_service.get_dong_to_district(db, SalesData).get(region_name)
 
             def get_area_sales(area_field=None, area_value=None):
                 query = db.query(
@@ -742,7 +755,7 @@ class AreaAnalysisService:
     def get_industry_sales_comparison(self, db: Session, industry_name: str, region_name: str) -> Dict[str, Any]:
         """내 업종에서 가장 매출이 많은 동과 나의 동 비교"""
         try:
-            latest = db.query(SalesData.year, SalesData.quarter).order_by(desc(SalesData.year), desc(SalesData.quarter)).first()
+            latest = aggregate_cache_service.get_latest_quarter(db, SalesData)
             if not latest:
                 return {}
             year, quarter = latest
@@ -785,7 +798,7 @@ class AreaAnalysisService:
     def get_sales_detail(self, db: Session, region_name: str, industry_name: str) -> Dict[str, Any]:
         """요일/시간대/성별/연령대별 매출 금액 & 건수 + 가장 많은 요일/시간대/연령대 추출"""
         try:
-            latest = db.query(SalesData.year, SalesData.quarter).order_by(desc(SalesData.year), desc(SalesData.quarter)).first()
+            latest = aggregate_cache_service.get_latest_quarter(db, SalesData)
             if not latest:
                 return {}
             year, quarter = latest
@@ -0,0 +1,215 @@
+# services/area_snapshot_service.py
+
+import os
+import json
+import logging
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+from sqlalchemy import desc
+from db_models import AreaAnalysisSnapshot, Population, SalesData
+from services.area_analysis_service import area_analysis_service
+
+logger = logging.getLogger(__name__)
+
+class AreaSnapshotService:
+    """상권 분석 결과를 (행정동, 업종) 단위로 미리 계산해 저장하는 스냅샷 서비스"""
+
+    def __init__(self):
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        json_dir = os.path.join(base_dir, "..", "data")
+
+        with open(os.path.join(json_dir, "industry_to_main_category.json"), "r", encoding="utf-8") as f:
+            industry_to_main_category = json.load(f)
+
+        # 상권 분석 화면은 외식업 세부 업종 기준
+        self.industry_names: List[str] = industry_to_main_category.get("외식업", [])
+
+        self._rebuild_lock = asyncio.Lock()
+        self._rebuild_pending = False
+
+        logger.info("AreaSnapshotService 초기화 완료")
+
+    # =====================
+    #  스냅샷 조회
+    # =====================
+
+    def get_snapshot(self, db: Session, region_name: str, industry_name: str) -> Optional[AreaAnalysisSnapshot]:
+        """(행정동, 업종) 스냅샷 조회"""
+        try:
+            return (
+                db.query(AreaAnalysisSnapshot)
+                .filter(AreaAnalysisSnapshot.region_name == region_name)
+                .filter(AreaAnalysisSnapshot.industry_name == industry_name)
+                .first()
+            )
+        except Exception as e:
+            logger.warning(f"상권 분석 스냅샷 조회 실패: {e}")
+            return None
+
+    def get_population_snapshot(self, db: Session, region_name: str) -> Optional[Dict[str, Any]]:
+        """행정동 인구 분석 스냅샷 조회 (인구 분석은 업종과 무관)"""
+        try:
+            row = (
+                db.query(AreaAnalysisSnapshot.population)
+                .filter(AreaAnalysisSnapshot.region_name == region_name)
+                .first()
+            )
+            return row.population if row else None
+        except Exception as e:
+            logger.warning(f"인구 분석 스냅샷 조회 실패: {e}")
+            return None
+
+    # =====================
+    #  스냅샷 생성
+    # =====================
+
+    def build_region_snapshots(self, db: Session, region_name: str) -> List[Dict[str, Any]]:
+        """한 행정동의 업종별 스냅샷 페이로드 계산 (행정동 공통 분석은 한 번만 수행)"""
+        svc = area_analysis_service
+
+        # 행정동 단위 분석 (업종 무관)
+        population = svc.get_population_analysis(db, region_name)
+        main_category_store_count = svc.get_main_category_store_count(db, region_name)
+        operation_duration_summary = svc.get_store_operation_duration_summary(db, region_name)
+        main_category_sales_count = svc.get_main_category_sales_count(db, region_name)
+
+        snapshots = []
+        for industry_name in self.industry_names:
+            food_category_stats = svc.get_food_store_category_stats(db, region_name, industry_name)
+            store_open_close = svc.get_store_open_close_trend(db, region_name, industry_name)
+            food_sales_stats = svc.get_food_store_sales_stats(db, region_name, industry_name)
+            sales_detail = svc.get_sales_detail(db, region_name, industry_name)
+
+            category = {
+                "main_category_store_count": main_category_store_count,
+                "food_category_stats": food_category_stats,
+                "store_open_close": store_open_close,
+                "operation_duration_summary": operation_duration_summary
+            }
+            sales = {
+                "main_category_sales_count": main_category_sales_count,
+                "food_sales_stats": food_sales_stats,
+                "sales_comparison": svc.get_industry_sales_comparison(db, industry_name, region_name),
+                "sales_detail": sales_detail
+            }
+            summary = svc.build_summary(
+                population["resident_pop"],
+                population["working_pop"],
+                population["floating_pop"],
+                food_category_stats,
+                store_open_close,
+                food_sales_stats,
+                sales_detail
+            )
+
+            # Decimal 등 DB 집계 타입을 API 응답과 동일한 JSON 형태로 변환
+            snapshots.append({
+                "region_name": region_name,
+                "industry_name": industry_name,
+                "summary": jsonable_encoder(summary),
+                "population": jsonable_encoder(population),
+                "category": jsonable_encoder(category),
+                "sales": jsonable_encoder(sales)
+            })
+
+        return snapshots
+
+    def rebuild_snapshots(self) -> Dict[str, int]:
+        """전체 행정동 x 외식업 업종 스냅샷 재생성 (수집 작업 이후 실행)"""
+        from database.connector import database_instance as mariadb
+
+        AreaAnalysisSnapshot.__table__.create(bind=mariadb.engine, checkfirst=True)
+
+        db = mariadb.pre_session()
+        total_saved, total_updated = 0, 0
+
+        try:
+            logger.info("상권 분석 스냅샷 재생성 시작")
+
+            latest_sales = (
+                db.query(SalesData.year, SalesData.quarter)
+                .order_by(desc(SalesData.year), desc(SalesData.quarter))
+                .first()
+            )
+            year, quarter = (latest_sales.year, latest_sales.quarter) if latest_sales else (None, None)
+
+            region_names = [
+                row.region_name
+                for row in db.query(Population.region_name).distinct().all()
+                if row.region_name
+            ]
+
+            existing_map = {
+                (r.region_name, r.industry_name): r.snapshot_id
+                for r in db.query(
+                    AreaAnalysisSnapshot.snapshot_id,
+                    AreaAnalysisSnapshot.region_name,
+                    AreaAnalysisSnapshot.industry_name
+                ).all()
+            }
+
+            for i, region_name in enumerate(region_names):
+                if i % 50 == 0:
+                    logger.info(f"스냅샷 {i}/{len(region_names)} 행정동 처리 중...")
+
+                try:
+                    insert_list = []
+                    update_list = []
+                    now = datetime.now()
+
+                    for snapshot in self.build_region_snapshots(db, region_name):
+                        snapshot["year"] = year
+                        snapshot["quarter"] = quarter
+                        snapshot["updated_at"] = now
+
+                        key = (snapshot["region_name"], snapshot["industry_name"])
+                        if key in existing_map:
+                            snapshot["snapshot_id"] = existing_map[key]
+                            update_list.append(snapshot)
+                        else:
+                            snapshot["created_at"] = now
+                            insert_list.append(snapshot)
+
+                    if insert_list:
+                        db.bulk_insert_mappings(AreaAnalysisSnapshot, insert_list)
+                    if update_list:
+                        db.bulk_update_mappings(AreaAnalysisSnapshot, update_list)
+
+                    # 행정동 단위 커밋으로 트랜잭션을 짧게 유지
+                    db.commit()
+                    total_saved += len(insert_list)
+                    total_updated += len(update_list)
+
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(f"{region_name} 스냅샷 저장 실패: {e}")
+
+            logger.info(f"상권 분석 스냅샷 재생성 완료 - 신규 {total_saved}건, 수정 {total_updated}건")
+            return {"saved": total_saved, "updated": total_updated}
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"상권 분석 스냅샷 재생성 중 오류 발생: {e}")
+            return {"saved": total_saved, "updated": total_updated}
+        finally:
+            db.close()
+
+    async def refresh_snapshots(self):
+        """스냅샷 재생성 요청 (실행 중이면 완료 후 한 번 더 재생성)"""
+        self._rebuild_pending = True
+        if self._rebuild_lock.locked():
+            return
+
+        async with self._rebuild_lock:
+            while self._rebuild_pending:
+                self._rebuild_pending = False
+                await asyncio.to_thread(self.rebuild_snapshots)
+
+area_snapshot_service = AreaSnapshotService()
+
+# 단독 실행 테스트
+if __name__ == "__main__":
+    print(area_snapshot_service.rebuild_snapshots())
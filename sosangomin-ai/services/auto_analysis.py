@@ -3,8 +3,10 @@
 import os
 import sys
 import logging
+import asyncio
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 from datetime import datetime
 from bson import ObjectId
 import holidays  #type: ignore
@@ -18,16 +20,25 @@ from services.weather_service import weather_service
 from database.mongo_connector import mongo_instance
 from services.s3_service import download_file_from_s3
 from services.auto_analysis_chat_service import autoanalysis_chat_service
+from services.pos_data_cache_service import pos_data_cache_service
+from services.kiwoom_normalizer import kiwoom_normalizer
 
 # 우선 키움 페이 포스기 데이터를 기준으로 작성하였음.
 os.environ["LOKY_MAX_CPU_COUNT"] = "8"
 logger = logging.getLogger(__name__)
 
 class AutoAnalysisService: 
+    # read_file/preprocess_data 결과가 달라지는 변경 시 올림 (전처리 캐시 무효화)
+    PREPROCESS_VERSION = 2
+
     def __init__(self): 
         self.temp_dir = "temp_files"
         os.makedirs(self.temp_dir, exist_ok=True)
 
+        # 이 크기 이상의 CSV는 청크 단위로 읽음
+        self.csv_chunk_threshold_mb = float(os.getenv("POS_CSV_CHUNK_THRESHOLD_MB", 20))
+        self.csv_chunk_rows = int(os.getenv("POS_CSV_CHUNK_ROWS", 100000))
+
         self.pos_col = {
             "키움": {
                 "datetime": "매출 일시",
@@ -54,19 +65,21 @@ class AutoAnalysisService:
         else:
             raise ValueError("지원되지 않는 파일 형식입니다. CSV 또는 Excel만 가능합니다.")
 
-    def validate_and_normalize_pos(self, df: pd.DataFrame, pos_type: str) -> pd.DataFrame:
-        """POS 데이터의 형식 검증 및 표준 컬럼명으로 통일"""
-        pos_map = self.pos_col[pos_type]
-        required_cols = list(pos_map.values())
-
-        # 필수 컬럼 존재 여부 확인
-        missing = [col for col in required_cols if col not in df.columns]
+    def _check_required_columns(self, columns, pos_type: str) -> None:
+        """POS 유형별 필수 컬럼 존재 여부 확인"""
+        required_cols = list(self.pos_col[pos_type].values())
+        missing = [col for col in required_cols if col not in columns]
         if missing:
             raise ValueError(
                 f"'{pos_type}' POS 형식으로 분석을 시도했으나, 필수 컬럼 {missing} 이(가) 존재하지 않습니다. "
                 "선택한 POS 유형이 실제 데이터와 다르거나, 업로드된 파일이 POS 형식이 아닐 수 있습니다. "
                 "파일을 다시 확인해주세요."
             )
+
+    def _rename_and_coerce(self, df: pd.DataFrame, pos_type: str) -> pd.DataFrame:
+        """표준 컬럼명으로 통일하고 수량/단가/매출 일시 형식 변환"""
+        pos_map = self.pos_col[pos_type]
+
         # 표준 컬럼명으로 통일
         df = df.rename(columns={
             pos_map["datetime"]: "매출 일시",
@@ -81,7 +94,10 @@ class AutoAnalysisService:
         
         # 날짜 형식 확인
         df['매출 일시'] = pd.to_datetime(df['매출 일시'], format="%Y-%m-%d %H:%M:%S", errors='coerce')
-        
+        return df
+
+    def _check_rows(self, df: pd.DataFrame) -> None:
+        """행 수/상품명 다양성으로 비정상 파일 여부 확인"""
         # 행 수 너무 적으면 비정상 파일 가능성
         if df.shape[0] < 5:
             raise ValueError(f"행 수가 너무 적습니다: {df.shape[0]}행")
@@ -90,134 +106,192 @@ class AutoAnalysisService:
         if df['상품 명칭'].nunique() <= 1:
             raise ValueError(f"상품명이 1개 이하입니다.")
 
+    def validate_and_normalize_pos(self, df: pd.DataFrame, pos_type: str) -> pd.DataFrame:
+        """POS 데이터의 형식 검증 및 표준 컬럼명으로 통일"""
+        self._check_required_columns(df.columns, pos_type)
+        df = self._rename_and_coerce(df, pos_type)
+        self._check_rows(df)
+        return df
+
+    # =====================
+    #  대용량 CSV 분할 읽기
+    # =====================
+
+    # 필수 컬럼 외에 함께 읽는 컬럼 (EDA 차트에서 사용)
+    OPTIONAL_COLUMNS = ['전표 번호', '고객 수']
+    # 청크마다 category로 바꿔 누적하는 문자열 컬럼 (object 문자열은 행당 수십 바이트)
+    CATEGORY_COLUMNS = ['상품 명칭', '전표 번호']
+    # 한 행이 한 품목인 평면 형식이라 청크별로 정규화할 수 있는 POS
+    # (키움은 반복 헤더/분할 열을 파일 전체 기준으로 정리해야 하므로 제외, 엑셀은 청크 읽기 불가)
+    CHUNKED_POS_TYPES = {'토스'}
+
+    def use_chunked_read(self, file_path: str, pos_type: str) -> bool:
+        """청크 단위로 읽을 파일인지 (평면 형식 POS의 대용량 CSV)"""
+        if pos_type not in self.CHUNKED_POS_TYPES or os.path.splitext(file_path)[1].lower() != ".csv":
+            return False
+        return os.path.getsize(file_path) >= self.csv_chunk_threshold_mb * 1024 * 1024
+
+    def _normalize_chunk(self, chunk: pd.DataFrame, pos_type: str) -> pd.DataFrame:
+        """청크 하나를 표준 컬럼/형식으로 변환 (preprocess_data의 POS별 매출 계산 포함)"""
+        chunk = self._rename_and_coerce(chunk, pos_type)
+        if '고객 수' in chunk.columns:
+            chunk['고객 수'] = pd.to_numeric(chunk['고객 수'], errors='coerce')
+
+        if pos_type == "토스":
+            chunk['매출'] = chunk['단가']
+            chunk['단가'] = chunk['매출'] / chunk['수량']
+
+        return chunk.dropna(axis=0, how='all')
+
+    def read_csv_chunked(self, temp_file: str, pos_type: str) -> pd.DataFrame:
+        """CSV를 청크 단위로 읽어 필요한 컬럼만 검증/정규화 후 누적
+
+        분석(예측/클러스터링)이 행 단위 데이터를 쓰므로 행은 모두 보관한다. 대신 필요한 컬럼만 문자열로 읽어
+        청크마다 숫자/날짜로 바꾸고, 문자열 컬럼은 category로 누적해 행당 약 50바이트(일시/숫자 8바이트 x 5 +
+        범주 코드)와 고유 문자열만 남긴다. 마지막 병합도 컬럼 단위로 해 청크 사본과 결과가 동시에 두 벌 있지 않게 한다.
+        반환 프레임은 preprocess_data(normalized=True)에 넘긴다.
+        """
+        header_cols = pd.read_csv(temp_file, nrows=0).columns
+        self._check_required_columns(header_cols, pos_type)
+
+        wanted = set(self.pos_col[pos_type].values()) | set(self.OPTIONAL_COLUMNS)
+        usecols = [col for col in header_cols if col in wanted]
+
+        parts = {}
+        reader = pd.read_csv(temp_file, usecols=usecols, dtype=str, chunksize=self.csv_chunk_rows)
+        for i, chunk in enumerate(reader):
+            # 기존 전처리와 동일하게 첫 데이터 행은 제외
+            if i == 0 and pos_type == "토스":
+                chunk = chunk.iloc[1:]
+
+            chunk = self._normalize_chunk(chunk, pos_type)
+            # 컬럼별 사본으로 떼어 내 청크 블록(원본 문자열 포함)이 바로 해제되게 함
+            for col in chunk.columns:
+                series = chunk[col].astype('category') if col in self.CATEGORY_COLUMNS else chunk[col].copy()
+                parts.setdefault(col, []).append(series)
+            del chunk
+
+        if not parts:
+            raise ValueError(f"파일 '{os.path.basename(temp_file)}'에서 읽은 데이터가 없습니다.")
+
+        chunk_count = len(next(iter(parts.values())))
+        df = pd.DataFrame(index=pd.RangeIndex(sum(len(part) for part in next(iter(parts.values())))))
+        for col in list(parts):
+            col_parts = parts.pop(col)
+            if col in self.CATEGORY_COLUMNS:
+                df[col] = union_categoricals(col_parts)
+            else:
+                df[col] = pd.concat(col_parts, ignore_index=True)
+            del col_parts
+
+        self._check_rows(df)
+
+        logger.info(f"CSV 분할 읽기 완료: {chunk_count}개 청크, 행 수={df.shape[0]}, 메모리={df.memory_usage(deep=True).sum() / (1024 * 1024):.1f}MB")
         return df
 
-    async def preprocess_data(self, df: pd.DataFrame, pos_type: str = "키움") -> pd.DataFrame:
-        """데이터 전처리 및 시간 변수 생성"""
-        try:
+    async def read_and_preprocess(self, temp_file: str, pos_type: str = "키움") -> pd.DataFrame:
+        """파일 읽기 + 전처리 (대용량 CSV는 청크 단위로 읽음)"""
+        if self.use_chunked_read(temp_file, pos_type):
+            df = await asyncio.to_thread(self.read_csv_chunked, temp_file, pos_type)
+            return await self.preprocess_data(df, pos_type, normalized=True)
+
+        df = await self.read_file(temp_file, pos_type)
+        return await self.preprocess_data(df, pos_type)
+
+    # =====================
+    #  파생 시간 변수
+    # =====================
+
+    # 라벨은 기존 문자열과 동일 ('01'월, '09'시, 'Monday', '점심' 등), 저장은 category dtype
+    WEEKDAY_LABELS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    TIME_PERIOD_LABELS = ['점심', '저녁', '기타']
+    SEASON_LABELS = ['봄', '여름', '가을', '겨울']
+    HOLIDAY_LABELS = ['평일', '휴일']
+    TIME_FEATURE_DTYPES = {
+        '월': pd.CategoricalDtype([f"{m:02d}" for m in range(1, 13)]),
+        '일': pd.CategoricalDtype([f"{d:02d}" for d in range(1, 32)]),
+        '시': pd.CategoricalDtype([f"{h:02d}" for h in range(24)]),
+        '분': pd.CategoricalDtype([f"{m:02d}" for m in range(60)]),
+        '요일': pd.CategoricalDtype(WEEKDAY_LABELS),
+        '시간대': pd.CategoricalDtype(TIME_PERIOD_LABELS),
+        '계절': pd.CategoricalDtype(SEASON_LABELS),
+        '공휴일': pd.CategoricalDtype(HOLIDAY_LABELS),
+    }
+
+    # 시(0~23) → 시간대 코드 (점심 11~15시, 저녁 17~21시, 그 외 기타)
+    TIME_PERIOD_BY_HOUR = np.array([0 if 11 <= h <= 15 else 1 if 17 <= h <= 21 else 2 for h in range(24)])
+    # 월(1~12) → 계절 코드 (인덱스 0은 사용하지 않음)
+    SEASON_BY_MONTH = np.array([-1] + [0 if 3 <= m <= 5 else 1 if 6 <= m <= 8 else 2 if 9 <= m <= 11 else 3 for m in range(1, 13)])
+
+    def _time_feature(self, name: str, codes: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes, dtype=self.TIME_FEATURE_DTYPES[name])
+
+    def _add_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """매출 일시에서 년/월/일/시/분/요일/시간대/계절/공휴일 생성 (행 단위 apply 없이 코드 배열로 계산)"""
+        dt = df['매출 일시'].dt
+
+        # 결측 일시는 코드 -1 (범주형 결측)
+        month = dt.month.fillna(0).to_numpy(dtype=int)
+        day = dt.day.fillna(0).to_numpy(dtype=int)
+        hour = dt.hour.fillna(-1).to_numpy(dtype=int)
+        minute = dt.minute.fillna(-1).to_numpy(dtype=int)
+        weekday = dt.dayofweek.fillna(-1).to_numpy(dtype=int)
+        valid = hour >= 0
+
+        year_codes, years = pd.factorize(dt.year, sort=True)
+        df['년'] = pd.Categorical.from_codes(year_codes, categories=[str(int(year)) for year in years])
+        df['월'] = self._time_feature('월', month - 1)
+        df['일'] = self._time_feature('일', day - 1)
+        df['시'] = self._time_feature('시', hour)
+        df['분'] = self._time_feature('분', minute)
+        df['요일'] = self._time_feature('요일', weekday)
+        df['시간대'] = self._time_feature('시간대', np.where(valid, self.TIME_PERIOD_BY_HOUR[hour], -1))
+        df['계절'] = self._time_feature('계절', self.SEASON_BY_MONTH[month])
+
+        # 공휴일: 기간 내 공휴일 날짜 집합과 자정 기준 날짜를 비교, 주말 포함
+        kr_holidays = holidays.KR(years=[int(year) for year in years]) if len(years) else {}
+        holiday_dates = pd.DatetimeIndex(list(kr_holidays.keys()))
+        is_holiday = (dt.normalize().isin(holiday_dates) | (weekday >= 5)).to_numpy()
+        df['공휴일'] = self._time_feature('공휴일', np.where(valid, is_holiday.astype(int), -1))
 
-            # TODO: 결제 수단 이용할건지?
-            if pos_type == "키움":
-
-                # 헤더의 변수명과 같은 값을 가지는 열을 삭제 
-                header_values = set(df.columns.tolist()) 
-                columns_to_drop = [col for col in df.columns if any(df[col].astype(str).isin(header_values))]
-                df = df.drop(columns=columns_to_drop)
-
-                if df.empty:
-                    raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
-                # 결측 및 중복 처리 
-                # df = (
-                #     df.dropna(axis=0, how='all')  # 모든 값이 NaN인 행 제거
-                #     .dropna(axis=1, how='all')  # 모든 값이 NaN인 열 제거
-                #     .loc[:, df.nunique() > 1]  # 고유값 1개 이하인 열 제거
-                #     .T.drop_duplicates().T    # 중복 열 제거
-                # )
-
-                logger.info(f"[초기 df shape]: {df.shape}")
-
-                # 모든 NaN 행 제거
-                df = df.dropna(axis=0, how='all')
-                logger.info(f"[NaN 행 제거 후]: {df.shape}")
-
-                # 모든 NaN 열 제거
-                df = df.dropna(axis=1, how='all')
-                logger.info(f"[NaN 열 제거 후]: {df.shape}")
-
-                # 고유값 1개 이하 컬럼 제거
-                df = df.loc[:, df.nunique() > 1]
-                logger.info(f"[고유값 1개 이하 컬럼 제거 후]: {df.shape}")
-
-                # 중복 열 제거
-                df = df.T.drop_duplicates().T
-                logger.info(f"[중복 열 제거 후]: {df.shape}")
-
-                if df.empty:
-                    raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
-
-                # 'Unnamed'가 포함되지 않은 열 중복
-                cols_to_fill = [col for col in df.columns if 'Unnamed' not in str(col)]
-                df[cols_to_fill] = df[cols_to_fill].ffill()
-
-                # 동일 속성이 여러 다른 칼럼에 존재하는 경우, 이를 하나의 칼럼으로 정리
-                dup_val = ['단가', '수량', '원가', '거스름']
-                for val in dup_val :
-                    columns = [col for col in df.columns if df[col].astype(str).str.contains(val, na=False).any()]
-                    if columns:
-                        df[val] = df[columns].bfill(axis=1).iloc[:, 0] 
-                        df = df.drop(columns=columns)
-                if "거스름" in df.columns:
-                    df.drop(columns=['거스름'], inplace=True)
-                if "원가" in df.columns:
-                    df.drop(columns=['원가'], inplace=True)
-
-                logger.error(f'[df.dropna] 처리 전 {len(df)}')
-                df = df.dropna(axis=0, how='any') # 결측값이 있는 행 제거
-                logger.error(f'[df.dropna] 처리 후 {len(df)}')
-
-                if df.shape[0] == 0:
-                    logger.error("❌ 컬럼명 처리 직전에 데이터프레임이 비어있음. 열 이름 추출 불가.")
-                    raise ValueError("컬럼명 처리 전에 데이터가 존재하지 않습니다.")
-
-                logger.info(f"[컬럼명 처리 시작] df.shape: {df.shape}, columns: {df.columns.tolist()}")
-
-                try:
-                    new_columns = [df.iloc[0, i] if 'Unnamed' in str(col) else col for i, col in enumerate(df.columns)]
-                except Exception as e:
-                    logger.error(f"❗ new_columns 생성 중 오류 발생: {e}")
-                    raise
-
-                df.columns = new_columns
-                logger.info(f"[전처리 전] df shape: {df.shape}")
-                df = df[~df.apply(lambda row: any(row.astype(str).isin(new_columns)), axis=1)]
-                logger.info(f"[컬럼 정리 후] df shape: {df.shape}")
-
-                if df.empty:
-                    logger.warning("컬럼명 처리 후 데이터프레임이 비어 있습니다.")
-                    raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
-                
-                df = df.loc[:, df.nunique() > 1]  
+        return df
+
+    def compact_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """병합 등으로 object가 된 파생 시간 변수를 다시 category dtype으로 변환"""
+        dtypes = {col: dtype for col, dtype in self.TIME_FEATURE_DTYPES.items() if col in df.columns}
+        if '년' in df.columns:
+            dtypes['년'] = 'category'
+        return df.astype(dtypes)
 
-                if df.empty:
-                    logger.warning("컬럼명 처리 후 데이터프레임이 비어 있습니다.")
-                    raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
+    async def preprocess_data(self, df: pd.DataFrame, pos_type: str = "키움", normalized: bool = False) -> pd.DataFrame:
+        """데이터 전처리 및 시간 변수 생성 (normalized=True면 read_csv_chunked에서 정규화까지 끝난 프레임)"""
+        try:
+
+            if not normalized:
+                # TODO: 결제 수단 이용할건지?
+                if pos_type == "키움":
+                    df = kiwoom_normalizer.normalize(df)
                 
-                # 매출 
-                df = df.drop(columns=['총매출', '실매출'], errors='ignore') 
-                df['매출'] = (df['단가'] * df['수량']).astype(int)
-            
-            # 파일 형식 확인
-            df = self.validate_and_normalize_pos(df, pos_type)
-
-            if pos_type == "토스":
-                df['매출'] = df['단가']
-                df['단가'] = df['매출'] / df['수량']
-                df = df.drop(index=0).reset_index(drop=True)
-                df = (
-                    df.dropna(axis=0, how='all')  # 모든 값이 NaN인 행 제거
-                    .dropna(axis=1, how='all')  # 모든 값이 NaN인 열 제거
-                    .loc[:, df.nunique() > 1]  # 고유값 1개 이하인 열 제거
-                    .T.drop_duplicates().T    # 중복 열 제거
-                )
+                # 파일 형식 확인
+                df = self.validate_and_normalize_pos(df, pos_type)
+
+                if pos_type == "토스":
+                    df['매출'] = df['단가']
+                    df['단가'] = df['매출'] / df['수량']
+                    df = df.drop(index=0).reset_index(drop=True)
+                    df = (
+                        df.dropna(axis=0, how='all')  # 모든 값이 NaN인 행 제거
+                        .dropna(axis=1, how='all')  # 모든 값이 NaN인 열 제거
+                        .loc[:, df.nunique() > 1]  # 고유값 1개 이하인 열 제거
+                        .T.drop_duplicates().T    # 중복 열 제거
+                    )
 
             if df['수량'].isna().any():
                 raise ValueError("'수량' 컬럼에 숫자로 변환할 수 없는 값이 포함되어 있습니다.")
         
             # 파생변수 생성
-            kr_holidays = holidays.KR()
-
             df['매출 일시'] = pd.to_datetime(df['매출 일시'])
-            df['년'] = df['매출 일시'].dt.year.astype(str)  
-            df['월'] = df['매출 일시'].dt.month.astype(str).str.zfill(2)
-            df['일'] = df['매출 일시'].dt.day.astype(str).str.zfill(2)
-            df['시'] = df['매출 일시'].dt.hour.astype(str).str.zfill(2)
-            df['분'] = df['매출 일시'].dt.minute.astype(str).str.zfill(2)
-            df['요일'] = df['매출 일시'].dt.day_name()  
-            df['시간대'] = df['시'].astype(int).apply(lambda x: '점심' if 11 <= x <= 15 else ('저녁' if 17 <= x <= 21 else '기타')) # 시간대 (점심, 저녁, 기타)
-            df['계절'] = df['월'].astype(int).apply(lambda x: '봄' if 3 <= x <= 5 else
-                                                '여름' if 6 <= x <= 8 else
-                                                '가을' if 9 <= x <= 11 else '겨울')
-            df['공휴일'] = df['매출 일시'].dt.date.apply(lambda x: '휴일' if x in kr_holidays or x.weekday() >= 5 else '평일')
+            df = self._add_time_features(df)
             
             # 외부 데이터 불러오기
             min_date, max_date = df['매출 일시'].min(), df['매출 일시'].max()
@@ -241,6 +315,8 @@ class AutoAnalysisService:
                 'rn': '강수량'
             })
             merged_df['강수량'] = merged_df['강수량'].fillna(0)
+            # 날씨 병합 키(년/월/일/시)가 object로 바뀌므로 다시 category로
+            merged_df = self.compact_time_features(merged_df)
             # df['미세먼지']
             # df['유동인구']
 
@@ -295,6 +371,10 @@ class AutoAnalysisService:
         return elbow_point
 
     async def predict_next_30_sales(self, df: pd.DataFrame, model_type="Prophet"):
+        """향후 30일 매출 예측 (모델 학습 동안 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(self._predict_next_30_sales, df, model_type)
+
+    def _predict_next_30_sales(self, df: pd.DataFrame, model_type="Prophet"):
         """향후 30일 매출 예측"""
         try:
             # 날짜, 매출만 추출
@@ -416,22 +496,48 @@ class AutoAnalysisService:
         except Exception as e:
             return {"error": str(e)}
 
+    # 상품별 수량 합계를 피벗하는 범주형 변수 (클러스터링 특성)
+    CLUSTER_CATEGORY_VARS = ['월', '요일', '시간대', '계절', '공휴일']
+
+    def product_pivot(self, df: pd.DataFrame, col: str) -> pd.DataFrame:
+        """상품 x 범주값별 수량 합계"""
+        return df.pivot_table(index='상품 명칭', columns=col, values='수량', aggfunc='sum', fill_value=0, observed=True)
+
+    def cluster_features(self, agg_df: pd.DataFrame, pivot_tables: list) -> pd.DataFrame:
+        """상품별 매출/수량/단가 집계에 범주형 피벗을 상품명 기준으로 병합"""
+        final_df = agg_df.copy()
+        for pivot in pivot_tables:
+            final_df = final_df.merge(pivot, on='상품 명칭', how='left')
+        final_df.reset_index(inplace=True)
+        return final_df
+
     async def cluster_items(self, df: pd.DataFrame):
+        """상품 클러스터링 (스레드에서 실행)"""
+        return await asyncio.to_thread(self._cluster_items, df)
+
+    async def cluster_products(self, final_df: pd.DataFrame):
+        """이미 집계된 상품 특성(cluster_features 결과)으로 클러스터링 (스레드에서 실행)"""
+        return await asyncio.to_thread(self._cluster_products, final_df)
+
+    def _cluster_items(self, df: pd.DataFrame):
         """상품 클러스터링"""
         try:
-            cluster_df = df[['상품 명칭', '매출', '단가', '수량', '월', '요일', '시간대', '계절', '공휴일']] 
+            cluster_df = df[['상품 명칭', '매출', '단가', '수량'] + self.CLUSTER_CATEGORY_VARS]
 
             # 범주형 변수별 수량 합계 피벗 테이블 생성
-            category_vars = ['월', '요일', '시간대', '계절', '공휴일']
-            pivot_tables = [cluster_df.pivot_table(index='상품 명칭', columns=col, values='수량', aggfunc='sum', fill_value=0) for col in category_vars]
-            agg_df = cluster_df.groupby('상품 명칭').agg({'매출': 'sum', '수량': 'sum', '단가': 'mean'}) # 매출과 수량은 sum(), 단가는 mean()으로 집계
+            pivot_tables = [self.product_pivot(cluster_df, col) for col in self.CLUSTER_CATEGORY_VARS]
+            agg_df = cluster_df.groupby('상품 명칭', observed=True).agg({'매출': 'sum', '수량': 'sum', '단가': 'mean'}) # 매출과 수량은 sum(), 단가는 mean()으로 집계
 
             # 모든 피벗 테이블을 상품명 기준으로 병합
-            final_df = agg_df.copy()
-            for pivot in pivot_tables:
-                final_df = final_df.merge(pivot, on='상품 명칭', how='left')
-            final_df.reset_index(inplace=True)
+            final_df = self.cluster_features(agg_df, pivot_tables)
+        except Exception as e:
+            return {"error": str(e)}
 
+        return self._cluster_products(final_df)
+
+    def _cluster_products(self, final_df: pd.DataFrame):
+        """상품별 특성 → 정규화 + KMeans 클러스터링 결과"""
+        try:
             # 상품명 제거 후 정규화
             X = final_df.drop(columns=['상품 명칭'])
             scaler = StandardScaler()
@@ -495,19 +601,20 @@ class AutoAnalysisService:
             for path in local_file_paths:
                 script_dir = os.path.dirname(os.path.abspath(__file__))  
                 path = os.path.join(script_dir, path)
-                df = await self.read_file(path, pos_type)
-                df = await self.preprocess_data(df, pos_type)
+                df = await self.read_and_preprocess(path, pos_type)
                 preprocessed_data.append(df)
 
-            combined_df = pd.concat(preprocessed_data, ignore_index=True)
+            combined_df = self.compact_time_features(pd.concat(preprocessed_data, ignore_index=True))
 
             # 예측 & 클러스터링
             predict_result = await self.predict_next_30_sales(combined_df)
             cluster_result = await self.cluster_items(combined_df)
 
             # 요약
-            predict_summary = await autoanalysis_chat_service.generate_sales_predict_summary(predict_result)
-            cluster_summary = await autoanalysis_chat_service.generate_cluster_summary(cluster_result)
+            predict_summary, cluster_summary = await asyncio.gather(
+                autoanalysis_chat_service.generate_sales_predict_summary(predict_result),
+                autoanalysis_chat_service.generate_cluster_summary(cluster_result)
+            )
 
             return {
                 "status": "success",
@@ -550,24 +657,29 @@ class AutoAnalysisService:
                 filename = source.get("original_filename") or s3_key.split("/")[-1]
                 s3_keys.append(s3_key)
 
-                temp_path = os.path.join(self.temp_dir, f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}")
-                local_path = await download_file_from_s3(s3_key, temp_path)
-                local_files.append(local_path)
+                async def load_source():
+                    temp_path = os.path.join(self.temp_dir, f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}")
+                    local_path = await download_file_from_s3(s3_key, temp_path)
+                    local_files.append(local_path)
 
-                df = await self.read_file(local_path, pos_type)
-                df = await self.preprocess_data(df, pos_type)
+                    return await self.read_and_preprocess(local_path, pos_type)
+
+                # 이전에 전처리한 소스는 Parquet 캐시에서 바로 로드
+                df = await pos_data_cache_service.get_or_create(source, pos_type, self.PREPROCESS_VERSION, load_source)
                 preprocessed_data.append(df)
 
             # 모든 전처리된 데이터 병합
-            combined_df = pd.concat(preprocessed_data, ignore_index=True)
+            combined_df = self.compact_time_features(pd.concat(preprocessed_data, ignore_index=True))
 
             # 분석 실행
             predict_result = await self.predict_next_30_sales(combined_df)
             cluster_result = await self.cluster_items(combined_df)
 
             # 요약 생성 추가
-            predict_summary = await autoanalysis_chat_service.generate_sales_predict_summary(predict_result)
-            cluster_summary = await autoanalysis_chat_service.generate_cluster_summary(cluster_result)
+            predict_summary, cluster_summary = await asyncio.gather(
+                autoanalysis_chat_service.generate_sales_predict_summary(predict_result),
+                autoanalysis_chat_service.generate_cluster_summary(cluster_result)
+            )
 
             status = "fail" if ("error" in predict_result or "error" in cluster_result) else "completed"
 
@@ -1,24 +1,14 @@
 # services/auto_chat_service.py
 
-import os
 import logging
 import json
 from typing import Dict, Any
-from anthropic import Anthropic
-from dotenv import load_dotenv
+from services.llm_client import llm_client
 
 logger = logging.getLogger(__name__)
 
 class AutoAnalysisChatService:
     def __init__(self):
-        load_dotenv("./config/.env")
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            logger.error("Anthropic API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
-            api_key = "NOT_SET"  
-        
-        self.client = Anthropic(api_key=api_key)
-        
         self.system_prompt = """
         당신은 소상공인을 위한 데이터 분석 플랫폼에서 일하는 데이터 분석가입니다.
         당신의 역할은 데이터를 잘 모르는 사용자에게 분석 결과를 쉽고, 실용적이며, 친절하게 전달하는 것입니다.
@@ -97,7 +87,7 @@ class AutoAnalysisChatService:
             ※ 숫자를 너무 기술적으로 설명하지 말고, 가게 사장님이 쉽게 이해할 수 있게 표현해 주세요.
             """
 
-            response = self.client.messages.create(
+            response = await llm_client.create_message(
                 model="claude-3-5-haiku-20241022",
                 max_tokens=800,
                 temperature=0.2,
@@ -105,7 +95,7 @@ class AutoAnalysisChatService:
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            raw_text = response.content[0].text.strip()
+            raw_text = response.strip()
 
             # ```json 제거
             if raw_text.startswith("```json"):
@@ -169,7 +159,7 @@ class AutoAnalysisChatService:
             ※ 통계 용어는 피하고, 쉽고 직관적인 말로 설명해 주세요. 
             """
 
-            response = self.client.messages.create(
+            response = await llm_client.create_message(
                 model="claude-3-5-haiku-20241022",
                 max_tokens=1000,
                 temperature=0.2,
@@ -177,7 +167,7 @@ class AutoAnalysisChatService:
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            raw_text = response.content[0].text.strip()
+            raw_text = response.strip()
 
             # ```json 제거
             if raw_text.startswith("```json"):
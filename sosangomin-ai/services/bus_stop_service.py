@@ -3,9 +3,11 @@ import logging
 import asyncio
 import aiohttp
 from datetime import datetime
+from typing import Dict, List, Any
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 from db_models import BusStop
+from services.seoul_openapi_client import seoul_openapi_client, SeoulOpenApiError
 
 logger = logging.getLogger(__name__)
 
@@ -14,90 +16,118 @@ class BusStopService:
         load_dotenv("./config/.env")
         
         self.bus_api_key = os.getenv("BUS_API_KEY")
-        self.base_url = "http://openapi.seoul.go.kr:8088"
         self.service_name = "busStopLocationXyInfo"
 
         if not self.bus_api_key:
             logger.error("버스 정류장 인증키가 없습니다. 환경 변수를 확인하세요.")
 
-    async def fetch_bus_stop_data(self, session) -> dict:
-        """버스 정류장 데이터 API 호출"""
+    async def fetch_all_bus_stops(self, session) -> Dict[str, Any]:
+        """버스 정류장 전체 페이지 수집 (공용 클라이언트 - 재시도/백오프/요청 수 제한 적용)"""
         try:
-            url = f"{self.base_url}/{self.bus_api_key}/json/{self.service_name}/1/1000/"
-            logger.info(f"버스 정류장 API 호출 URL: {url}")
-            
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                response.raise_for_status()
-                return await response.json()
-        except Exception as e:
+            return await seoul_openapi_client.fetch_all(session, self.bus_api_key, self.service_name)
+        except SeoulOpenApiError as e:
             logger.error(f"버스 정류장 API 호출 중 오류 발생 : {e}")
             return {"error": str(e)}
 
-    async def update_bus_stop_data(self):
+    def reconcile_bus_stops(self, db: Session, rows: List[Dict[str, Any]], allow_delete: bool = True) -> Dict[str, int]:
+        """API 정류장 목록과 DB를 stop_no 기준 집합 연산으로 동기화 (단일 트랜잭션)"""
+        now = datetime.now()
+
+        # API 데이터 → stop_no 키 맵 (중복 정류소 번호는 마지막 값 사용)
+        # feed_keys는 좌표 변환 실패 행도 포함 - 피드에 남아 있는 정류장은 삭제하지 않음
+        incoming: Dict[str, Dict[str, Any]] = {}
+        feed_keys = set()
+        for row in rows:
+            stop_no = row.get("STOPS_NO")  # 정류소 번호
+            if not stop_no:
+                continue
+            feed_keys.add(stop_no)
+            try:
+                incoming[stop_no] = {
+                    "stop_no": stop_no,
+                    "stop_name": row.get("STOPS_NM"),  # 정류소 이름
+                    "longitude": float(row.get("XCRD")),  # X 좌표 (경도)
+                    "latitude": float(row.get("YCRD")),  # Y 좌표 (위도)
+                    "node_id": row.get("NODE_ID"),  # 노드 ID
+                    "stop_type": row.get("STOPS_TYPE")  # 정류소 타입
+                }
+            except (TypeError, ValueError) as e:
+                logger.warning(f"버스 정류장 좌표 변환 실패 ({stop_no}) : {e}")
+
+        # 기존 데이터 한 번에 조회
+        existing = {
+            r.stop_no: r
+            for r in db.query(BusStop.stop_id, BusStop.stop_no, BusStop.latitude, BusStop.longitude).all()
+        }
+
+        new_keys = incoming.keys() - existing.keys()
+        common_keys = incoming.keys() & existing.keys()
+        removed_keys = existing.keys() - feed_keys if allow_delete else set()
+
+        insert_list = [{**incoming[key], "created_at": now} for key in new_keys]
+
+        # 위치 정보가 변경된 경우에만 업데이트
+        update_list = [
+            {
+                "stop_id": existing[key].stop_id,
+                "latitude": incoming[key]["latitude"],
+                "longitude": incoming[key]["longitude"]
+            }
+            for key in common_keys
+            if existing[key].latitude != incoming[key]["latitude"]
+            or existing[key].longitude != incoming[key]["longitude"]
+        ]
+
+        delete_ids = [existing[key].stop_id for key in removed_keys]
+
+        if insert_list:
+            db.bulk_insert_mappings(BusStop, insert_list)
+        if update_list:
+            db.bulk_update_mappings(BusStop, update_list)
+        for i in range(0, len(delete_ids), 1000):
+            db.query(BusStop).filter(BusStop.stop_id.in_(delete_ids[i:i + 1000])).delete(synchronize_session=False)
+
+        return {"saved": len(insert_list), "updated": len(update_list), "deleted": len(delete_ids)}
+
+    EMPTY_RESULT = {"saved": 0, "updated": 0, "deleted": 0}
+
+    async def update_bus_stop_data(self) -> Dict[str, int]:
         """버스 정류장 데이터 수집 및 DB 저장"""
         from database.connector import database_instance as mariadb
         db = mariadb.pre_session()
-        total_updated = 0
-        total_saved = 0 
 
         try:
             logger.info("버스 정류장 데이터 업데이트 시작")
 
             async with aiohttp.ClientSession() as session:
-                data = await self.fetch_bus_stop_data(session)
-
-                if 'error' in data:
-                    return 0
-                
-                rows = data[self.service_name].get("row", [])
-                if not rows:
-                    logger.warning("가져올 데이터가 없습니다.")
-                    return 0
-                
-                for row in rows:
-                    try:
-                        stop_no = row.get("STOPS_NO")  # 정류소 번호
-                        stop_name = row.get("STOPS_NM")  # 정류소 이름
-                        longitude = row.get("XCRD")  # X 좌표 (경도)
-                        latitude = row.get("YCRD")  # Y 좌표 (위도)
-                        node_id = row.get("NODE_ID")  # 노드 ID
-                        stop_type = row.get("STOPS_TYPE")  # 정류소 타입
-
-                        # 기존 데이터 조회
-                        existing_stop = db.query(BusStop).filter_by(stop_no=stop_no).first()
-
-                        if existing_stop:
-                            # 위치 정보가 변경된 경우에만 업데이트
-                            if existing_stop.latitude != latitude or existing_stop.longitude != longitude:
-                                existing_stop.latitude = latitude
-                                existing_stop.longitude = longitude
-                                db.commit()
-                                total_updated += 1
-                        else:
-                            # 신규 데이터 추가
-                            new_stop = BusStop(
-                                stop_no=stop_no,
-                                stop_name=stop_name,
-                                longitude=longitude,
-                                latitude=latitude,
-                                node_id=node_id,
-                                stop_type=stop_type,
-                                created_at=datetime.now()
-                            )
-                            db.add(new_stop)
-                            total_saved += 1
-
-                    except Exception as e:
-                        logger.warning(f"버스 정류장 데이터 저장 실패 : {e}")
-
-                db.commit()
-                logger.info(f"버스 정류장 데이터 저장 완료 : 신규 {total_saved}건, 수정 {total_updated}건")
-                return 
+                data = await self.fetch_all_bus_stops(session)
+
+            if 'error' in data:
+                return dict(self.EMPTY_RESULT)
+            
+            rows = data["rows"]
+            if not rows:
+                logger.warning("가져올 데이터가 없습니다.")
+                return dict(self.EMPTY_RESULT)
+
+            # 전체 건수를 다 받지 못한 경우 삭제는 건너뜀 (부분 수집으로 정류장이 지워지는 것 방지)
+            total_count = data.get("total_count")
+            allow_delete = not data["failed_pages"] and bool(total_count) and len(rows) >= total_count
+            if not allow_delete:
+                logger.warning(f"버스 정류장 전체 건수 불일치 ({len(rows)}/{total_count}) - 삭제 생략")
+
+            result = self.reconcile_bus_stops(db, rows, allow_delete)
+            db.commit()
+            logger.info(
+                f"버스 정류장 데이터 저장 완료 : 신규 {result['saved']}건, "
+                f"수정 {result['updated']}건, 삭제 {result['deleted']}건"
+            )
+            return result
 
         except Exception as e:
             db.rollback()
             logger.error(f"버스 정류장 데이터 호출 및 저장 실패 : {e}")
-            return 
+            return dict(self.EMPTY_RESULT)
         finally:
             db.close()
 
@@ -4,7 +4,6 @@ import os
 import logging
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Any
-from anthropic import Anthropic
 import uuid
 import json
 import re
@@ -15,6 +14,7 @@ from db_models import ChatHistory, ChatSession, Store
 from database.connector import database_instance
 from database.mongo_connector import mongo_instance
 from services.rag_service import rag_service
+from services.llm_client import llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,6 @@ class ChatService:
             logger.error("Anthropic API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
             raise ValueError("API 키가 설정되지 않았습니다.")
         
-        self.client = Anthropic(api_key=api_key)
-        
         # 시스템 프롬프트 설정
         self.system_prompt = """
         당신은 자영업자를 위한 비즈니스 도우미 '고미니'입니다.
@@ -190,7 +188,7 @@ class ChatService:
             user_assistant_messages = [msg for msg in messages if msg["role"] != "system"]
             system_message = next((msg["content"] for msg in messages if msg["role"] == "system"), "")
             
-            response = self.client.messages.create(
+            text = await llm_client.create_message(
                 model="claude-3-haiku-20240307",
                 max_tokens=700,
                 temperature=0.1,
@@ -198,7 +196,6 @@ class ChatService:
                 messages=user_assistant_messages  
             )
               
-            text = response.content[0].text
             # text = text.replace("\\n", " ").replace("\\t", " ")
             # text = text.replace("\n", " ").replace("\t", " ")
             # text = text.replace("\n\n", "")
@@ -2,7 +2,8 @@
 
 import os
 import logging
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import AsyncIterator, Dict, Any, Optional, List
 from datetime import datetime
 from bson import ObjectId
 from database.mongo_connector import mongo_instance
@@ -91,34 +92,26 @@ class CompetitorService:
                     "message": "경쟁사의 네이버 플레이스 ID를 찾을 수 없습니다."
                 }
             
-            reviews = await review_service.fetch_reviews_with_selenium(place_id)
+            # place_id별 리뷰 캐시 - 여러 매장이 같은 경쟁사를 분석해도 새 리뷰만 크롤링/분석
+            review_result = await review_service.get_analyzed_reviews(place_id)
+            analyzed_reviews = review_result["reviews"]
             
-            if not reviews:
+            if not analyzed_reviews:
                 return {
                     "status": "error",
                     "message": "경쟁사의 리뷰를 가져올 수 없습니다."
                 }
-            
-            analyzed_reviews = await review_service.analyze_sentiment(reviews)
-            word_cloud_data = await review_service.generate_word_cloud_data(analyzed_reviews)
-            insights = await review_service.generate_insights(analyzed_reviews, place_id)
-            
-            total_reviews = len(analyzed_reviews)
-            avg_rating = sum(r.get("rating", 0) for r in analyzed_reviews) / total_reviews if total_reviews > 0 else 0
-            sentiment_counts = {
-                "positive": sum(1 for r in analyzed_reviews if r.get("sentiment") == "positive"),
-                "neutral": sum(1 for r in analyzed_reviews if r.get("sentiment") == "neutral"),
-                "negative": sum(1 for r in analyzed_reviews if r.get("sentiment") == "negative")
-            }
+            analytics = await review_service.summarize_reviews(analyzed_reviews)
+            insights = await review_service.generate_insights(analyzed_reviews, place_id, analytics)
             
             analysis_result = {
                 "competitor_name": competitor_info.get("store_name"),
                 "place_id": place_id,
                 "reviews": analyzed_reviews,  
-                "review_count": total_reviews,
-                "average_rating": round(avg_rating, 1),
-                "sentiment_distribution": sentiment_counts,
-                "word_cloud_data": word_cloud_data,
+                "review_count": analytics["review_count"],
+                "average_rating": analytics["average_rating"],
+                "sentiment_distribution": analytics["sentiment_distribution"],
+                "word_cloud_data": analytics["word_cloud_data"],
                 "insights": insights,
                 "analysis_time": datetime.now().isoformat()
             }
@@ -137,6 +130,131 @@ class CompetitorService:
                 "message": f"경쟁사 리뷰 분석 중 오류가 발생했습니다: {str(e)}"
             }
 
+    # =====================
+    #  비교 분석 단계
+    # =====================
+
+    def _load_my_analysis(self, store_id: int, analysis_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """내 점포 리뷰 분석 결과 (analysis_id가 없으면 최신 분석)"""
+        reviews_collection = mongo_instance.get_collection("StoreReviews")
+        if analysis_id:
+            return reviews_collection.find_one({"_id": ObjectId(analysis_id), "store_id": store_id})
+        return reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
+
+    async def _load_competitor_analytics(
+        self,
+        competitor_place_id: str,
+        competitor_analyzed_reviews: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """경쟁사 분석 리뷰와 집계 ({"reviews", "analytics"}, 리뷰가 없으면 reviews가 빈 목록)"""
+        if not competitor_analyzed_reviews:
+            review_result = await review_service.get_analyzed_reviews(competitor_place_id)
+            competitor_analyzed_reviews = review_result["reviews"]
+
+        if not competitor_analyzed_reviews:
+            return {"reviews": [], "analytics": None}
+
+        analytics = await review_service.summarize_reviews(competitor_analyzed_reviews)
+        return {"reviews": competitor_analyzed_reviews, "analytics": analytics}
+
+    async def _search_and_load_competitor(self, competitor_name: str) -> Dict[str, Any]:
+        """경쟁사 검색 → 리뷰 크롤링/분석 → 집계"""
+        search_result = await self.search_competitor(competitor_name)
+        if search_result.get("status") == "error":
+            return search_result
+
+        competitor_info = search_result.get("competitor_info", {})
+        place_id = competitor_info.get("place_id")
+        if not place_id:
+            return {"status": "error", "message": "경쟁사의 네이버 플레이스 ID를 찾을 수 없습니다."}
+
+        competitor = await self._load_competitor_analytics(place_id)
+        if not competitor["reviews"]:
+            return {"status": "error", "message": "경쟁사의 리뷰를 가져올 수 없습니다."}
+
+        return {"status": "success", "competitor_info": competitor_info, **competitor}
+
+    def _build_comparison_data(
+        self,
+        my_analysis: Dict[str, Any],
+        competitor_name: str,
+        competitor_analyzed_reviews: List[Dict[str, Any]],
+        competitor_analytics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """내 점포/경쟁사 비교 통계"""
+        my_review_count = my_analysis.get("review_count", 0)
+        my_sentiment = my_analysis.get("sentiment_distribution", {})
+        my_avg_rating = my_analysis.get("average_rating", 0)
+        my_word_cloud = my_analysis.get("word_cloud_data", {})
+
+        my_reviews = my_analysis.get("reviews", [])
+        my_positive_reviews = [r for r in my_reviews if r.get("sentiment") == "positive"][:5]
+        my_negative_reviews = [r for r in my_reviews if r.get("sentiment") == "negative"][:5]
+
+        competitor_positive_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "positive"][:5]
+        competitor_negative_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "negative"][:5]
+
+        competitor_review_count = competitor_analytics["review_count"]
+        competitor_sentiment = competitor_analytics["sentiment_distribution"]
+
+        competitor_avg_rating = 0
+        if competitor_review_count > 0:
+            pos_ratio = competitor_sentiment.get("positive", 0) / competitor_review_count
+            competitor_avg_rating = 3.0 + (pos_ratio - 0.5) * 2
+            competitor_avg_rating = max(1.0, min(5.0, round(competitor_avg_rating, 1)))
+
+        return {
+            "my_store": {
+                "review_count": my_review_count,
+                "average_rating": my_avg_rating,
+                "sentiment_distribution": my_sentiment,
+                "positive_rate": (my_sentiment.get("positive", 0) / my_review_count * 100) if my_review_count > 0 else 0,
+                "sample_reviews": {
+                    "positive": my_positive_reviews,
+                    "negative": my_negative_reviews
+                }
+            },
+            "competitor": {
+                "name": competitor_name,
+                "review_count": competitor_review_count,
+                "average_rating": competitor_avg_rating,
+                "sentiment_distribution": competitor_sentiment,
+                "positive_rate": (competitor_sentiment.get("positive", 0) / competitor_review_count * 100) if competitor_review_count > 0 else 0,
+                "sample_reviews": {
+                    "positive": competitor_positive_reviews,
+                    "negative": competitor_negative_reviews
+                }
+            },
+            "word_cloud_comparison": {
+                "my_store": my_word_cloud,
+                "competitor": competitor_analytics["word_cloud_data"]
+            }
+        }
+
+    def _save_comparison(
+        self,
+        store_id: int,
+        my_analysis: Dict[str, Any],
+        competitor_place_id: str,
+        competitor_name: str,
+        comparison_data: Dict[str, Any],
+        comparison_insight: str
+    ) -> str:
+        """비교 분석 결과 저장 후 ID 반환"""
+        comparison_collection = mongo_instance.get_collection("CompetitorComparisons")
+
+        comparison_doc = {
+            "store_id": store_id,
+            "store_analysis_id": str(my_analysis["_id"]),
+            "competitor_place_id": competitor_place_id,
+            "competitor_name": competitor_name,
+            "comparison_data": comparison_data,
+            "comparison_insight": comparison_insight,
+            "created_at": datetime.now()
+        }
+
+        return str(comparison_collection.insert_one(comparison_doc).inserted_id)
+
     async def compare_with_competitor(
         self, 
         store_id: int, 
@@ -153,15 +271,14 @@ class CompetitorService:
             analysis_id: 내 점포 분석 ID (없으면 최신 분석 사용)
             competitor_analyzed_reviews: 이미 분석된 경쟁사 리뷰 (없으면 새로 가져옴)
             
+        내 분석 결과 조회와 경쟁사 리뷰 크롤링/분석은 동시에 시작하되, 내 분석 결과가 없거나
+        조회에 실패하면 경쟁사 크롤링을 취소한다.
         """
+        competitor_task = asyncio.create_task(
+            self._load_competitor_analytics(competitor_place_id, competitor_analyzed_reviews)
+        )
         try:
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
-            
-            my_analysis = None
-            if analysis_id:
-                my_analysis = reviews_collection.find_one({"_id": ObjectId(analysis_id), "store_id": store_id})
-            else:
-                my_analysis = reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
+            my_analysis = await asyncio.to_thread(self._load_my_analysis, store_id, analysis_id)
             
             if not my_analysis:
                 return {
@@ -169,91 +286,28 @@ class CompetitorService:
                     "message": "내 매장의 리뷰 분석 결과가 없습니다. 먼저 리뷰 분석을 진행해주세요."
                 }
             
-            if not competitor_analyzed_reviews:
-                competitor_reviews = await review_service.fetch_reviews_with_selenium(competitor_place_id)
-                
-                if not competitor_reviews:
-                    return {
-                        "status": "error",
-                        "message": "경쟁사의 리뷰를 가져올 수 없습니다."
-                    }
-                
-                competitor_analyzed_reviews = await review_service.analyze_sentiment(competitor_reviews)
-            
-            competitor_word_cloud = await review_service.generate_word_cloud_data(competitor_analyzed_reviews)
-            
-            my_review_count = my_analysis.get("review_count", 0)
-            my_sentiment = my_analysis.get("sentiment_distribution", {})
-            my_avg_rating = my_analysis.get("average_rating", 0)
-            my_word_cloud = my_analysis.get("word_cloud_data", {})
-            
-            my_reviews = my_analysis.get("reviews", [])
-            my_positive_reviews = [r for r in my_reviews if r.get("sentiment") == "positive"][:5]
-            my_negative_reviews = [r for r in my_reviews if r.get("sentiment") == "negative"][:5]
-            
-            competitor_positive_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "positive"][:5]
-            competitor_negative_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "negative"][:5]
-            
-            competitor_review_count = len(competitor_analyzed_reviews)
-            competitor_sentiment = {
-                "positive": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "positive"),
-                "neutral": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "neutral"),
-                "negative": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "negative")
-            }
-            
-            if competitor_review_count > 0:
-                pos_ratio = competitor_sentiment.get("positive", 0) / competitor_review_count
-                competitor_avg_rating = 3.0 + (pos_ratio - 0.5) * 2
-                competitor_avg_rating = max(1.0, min(5.0, round(competitor_avg_rating, 1)))
-            
-            comparison_data = {
-                "my_store": {
-                    "review_count": my_review_count,
-                    "average_rating": my_avg_rating,
-                    "sentiment_distribution": my_sentiment,
-                    "positive_rate": (my_sentiment.get("positive", 0) / my_review_count * 100) if my_review_count > 0 else 0,
-                    "sample_reviews": {
-                        "positive": my_positive_reviews,
-                        "negative": my_negative_reviews
-                    }
-                },
-                "competitor": {
-                    "name": competitor_name,
-                    "review_count": competitor_review_count,
-                    "average_rating": competitor_avg_rating,
-                    "sentiment_distribution": competitor_sentiment,
-                    "positive_rate": (competitor_sentiment.get("positive", 0) / competitor_review_count * 100) if competitor_review_count > 0 else 0,
-                    "sample_reviews": {
-                        "positive": competitor_positive_reviews,
-                        "negative": competitor_negative_reviews
-                    }
-                },
-                "word_cloud_comparison": {
-                    "my_store": my_word_cloud,
-                    "competitor": competitor_word_cloud
+            competitor = await competitor_task
+            if not competitor["reviews"]:
+                return {
+                    "status": "error",
+                    "message": "경쟁사의 리뷰를 가져올 수 없습니다."
                 }
-            }
-            
-            comparison_insight = await self._generate_comparison_insight(comparison_data)
             
-            comparison_collection = mongo_instance.get_collection("CompetitorComparisons")
+            comparison_data = self._build_comparison_data(
+                my_analysis, competitor_name, competitor["reviews"], competitor["analytics"]
+            )
             
-            comparison_doc = {
-                "store_id": store_id,
-                "store_analysis_id": str(my_analysis["_id"]),
-                "competitor_place_id": competitor_place_id,
-                "competitor_name": competitor_name,
-                "comparison_data": comparison_data,
-                "comparison_insight": comparison_insight,
-                "created_at": datetime.now()
-            }
+            comparison_insight = await self._generate_comparison_insight(comparison_data)
             
-            comparison_id = comparison_collection.insert_one(comparison_doc).inserted_id
+            comparison_id = await asyncio.to_thread(
+                self._save_comparison,
+                store_id, my_analysis, competitor_place_id, competitor_name, comparison_data, comparison_insight
+            )
             
             return {
                 "status": "success",
                 "message": "내 매장과 경쟁사 비교 분석이 완료되었습니다.",
-                "comparison_id": str(comparison_id),
+                "comparison_id": comparison_id,
                 "comparison_data": comparison_data,
                 "comparison_insight": comparison_insight
             }
@@ -264,6 +318,64 @@ class CompetitorService:
                 "status": "error",
                 "message": f"비교 분석 중 오류가 발생했습니다: {str(e)}"
             }
+        
+        finally:
+            if not competitor_task.done():
+                competitor_task.cancel()
+
+    async def stream_comparison(
+        self,
+        store_id: int,
+        competitor_name: str,
+        analysis_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        경쟁사 비교 분석 파이프라인 (단계별 결과를 순서대로 전달)
+        
+        경쟁사 검색/리뷰 분석과 내 분석 결과 조회를 동시에 시작하고, 빠른 내 분석 결과 조회를
+        먼저 확인해 결과가 없으면 경쟁사 크롤링을 기다리지 않고 취소한다.
+        비교 통계는 LLM 인사이트를 기다리지 않고 먼저 전달한다.
+        
+        Yields:
+            {"event": "competitor_info" | "comparison_data" | "comparison_insight" | "error", ...}
+        """
+        my_analysis_task = asyncio.create_task(asyncio.to_thread(self._load_my_analysis, store_id, analysis_id))
+        competitor_task = asyncio.create_task(self._search_and_load_competitor(competitor_name))
+        
+        try:
+            my_analysis = await my_analysis_task
+            if not my_analysis:
+                yield {"event": "error", "message": "내 매장의 리뷰 분석 결과가 없습니다. 먼저 리뷰 분석을 진행해주세요."}
+                return
+            
+            competitor = await competitor_task
+            if competitor.get("status") == "error":
+                yield {"event": "error", "message": competitor.get("message")}
+                return
+            
+            competitor_info = competitor["competitor_info"]
+            yield {"event": "competitor_info", "competitor_info": competitor_info}
+            
+            comparison_data = self._build_comparison_data(
+                my_analysis, competitor_name, competitor["reviews"], competitor["analytics"]
+            )
+            yield {"event": "comparison_data", "comparison_data": comparison_data}
+            
+            comparison_insight = await self._generate_comparison_insight(comparison_data)
+            comparison_id = await asyncio.to_thread(
+                self._save_comparison,
+                store_id, my_analysis, competitor_info.get("place_id"), competitor_name, comparison_data, comparison_insight
+            )
+            yield {"event": "comparison_insight", "comparison_id": comparison_id, "comparison_insight": comparison_insight}
+            
+        except Exception as e:
+            logger.error(f"비교 분석 파이프라인 오류: {str(e)}")
+            yield {"event": "error", "message": f"비교 분석 중 오류가 발생했습니다: {str(e)}"}
+        
+        finally:
+            for task in (my_analysis_task, competitor_task):
+                if not task.done():
+                    task.cancel()
 
     async def _generate_comparison_insight(self, comparison_data: Dict[str, Any]) -> str:
         """
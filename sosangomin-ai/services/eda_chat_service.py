@@ -1,24 +1,14 @@
 # services/eda_chat_service.py
 
-import os
 import logging
 import json
 from typing import Dict, Any
-from anthropic import Anthropic
-from dotenv import load_dotenv
+from services.llm_client import llm_client
 
 logger = logging.getLogger(__name__)
 
 class EdaChatService:
     def __init__(self):
-        load_dotenv("./config/.env")
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            logger.error("Anthropic API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
-            api_key = "NOT_SET"  
-        
-        self.client = Anthropic(api_key=api_key)
-        
         self.system_prompt = """
         당신은 데이터 분석가입니다. 당신의 역할은 제공된 데이터 분석 결과를 초보자도 쉽게 이해할 수 있도록 명확하게 설명하는 것입니다.
         
@@ -81,7 +71,7 @@ class EdaChatService:
             
             prompt = prompt_template.format(data_str)
             
-            response = self.client.messages.create(
+            response = await llm_client.create_message(
                 model="claude-3-5-haiku-20241022",
                 max_tokens=500, 
                 temperature=0.2,
@@ -91,7 +81,7 @@ class EdaChatService:
                 ]
             )
             
-            return response.content[0].text.strip()
+            return response.strip()
             
         except Exception as e:
             logger.error(f"Claude API 호출 중 오류: {str(e)}")
@@ -123,7 +113,7 @@ class EdaChatService:
             끝맺음을 무조건 하세요.
             """
             
-            response = self.client.messages.create(
+            response = await llm_client.create_message(
                 model="claude-3-7-sonnet-20250219",
                 max_tokens=1300,
                 temperature=0.2,
@@ -133,7 +123,7 @@ class EdaChatService:
                 ]
             )
             
-            result = response.content[0].text.strip()
+            result = response.strip()
             
             return result
             
@@ -0,0 +1,372 @@
+# services/eda_partial_service.py
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import pandas as pd
+from bson import ObjectId
+from database.mongo_connector import mongo_instance
+from services.auto_analysis import autoanalysis_service
+
+logger = logging.getLogger(__name__)
+
+class EdaPartialService:
+    """데이터소스별 EDA 부분 집계 저장/병합
+
+    - 소스마다 요일/시간/상품/월/일자(날씨)/영수증 금액대별 합계와 건수를 한 번만 계산해 EdaPartials 컬렉션에 저장
+    - 여러 소스의 부분 집계를 합쳐 차트 데이터(chart_data)와 매출 예측(일별 매출)/상품 클러스터링(상품별 특성)
+      입력을 만든다 - 원본 행은 다시 읽지 않음
+    월별 파일이 하나 추가되면 새 파일의 부분 집계만 계산하면 된다 (모델 학습 자체는 매번 전체 기간으로 다시 수행).
+    상품명 등에 '.'/'$'가 올 수 있어 집계는 [키..., 값...] 행 목록으로 저장한다.
+    """
+
+    COLLECTION_NAME = "EdaPartials"
+    # 부분 집계 항목/형식이 바뀌면 올림
+    PARTIAL_VERSION = 3
+
+    DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    AMOUNT_BINS = [0, 10000, 20000, 30000, 50000, 100000, float('inf')]
+    AMOUNT_LABELS = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
+
+    # 부분 집계 이름 → (키 컬럼, 값 컬럼)
+    SALES_SECTIONS = {
+        "weekday": (['요일'], ['매출']),
+        "time_period": (['시간대'], ['매출']),
+        "hourly": (['시'], ['매출']),
+        "holiday": (['공휴일'], ['매출']),
+        "season": (['계절'], ['매출']),
+        "weekday_time": (['요일', '시간대'], ['매출']),
+        "monthly": (['년', '월'], ['매출']),
+    }
+    PRODUCT_SECTION = (['상품 명칭'], ['매출', '수량'])
+    DAILY_SECTION = (['날짜'], ['매출', '기온_합', '기온_수', '강수량', '습도_합', '습도_수'])
+    AMOUNT_SECTION = (['금액대'], ['건수'])
+    # 매출 예측/상품 클러스터링 입력 (단가 평균은 소스를 합친 뒤 계산하도록 합계와 건수로 저장)
+    DAILY_SALES_SECTION = (['날짜'], ['매출'])
+    PRODUCT_STATS_SECTION = (['상품 명칭'], ['매출', '수량', '단가_합', '단가_수'])
+
+    def __init__(self):
+        logger.info("EdaPartialService 초기화 완료")
+
+    def _collection(self):
+        return mongo_instance.get_collection(self.COLLECTION_NAME)
+
+    def _native(self, value: Any) -> Any:
+        """numpy 스칼라 → 파이썬 값 (MongoDB 저장용)"""
+        return value.item() if hasattr(value, "item") else value
+
+    def _rows(self, grouped: pd.DataFrame) -> List[List[Any]]:
+        """groupby 결과 → [키..., 값...] 행 목록"""
+        rows = []
+        for key, values in zip(grouped.index, grouped.itertuples(index=False)):
+            keys = key if isinstance(key, tuple) else (key,)
+            rows.append([str(k) for k in keys] + [self._native(v) for v in values])
+        return rows
+
+    # =====================
+    #  부분 집계 생성
+    # =====================
+
+    def build(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """전처리된 소스 하나의 부분 집계"""
+        partial: Dict[str, Any] = {"row_count": int(len(df))}
+        if '매출' not in df.columns:
+            return partial
+
+        partial["sales_sum"] = self._native(df['매출'].sum())
+        # 평균 거래액은 기존 df['매출'].mean()처럼 매출이 있는 행만 센다 (토스는 단가 결측 행이 있음)
+        partial["sales_count"] = int(df['매출'].count())
+
+        for name, (keys, _) in self.SALES_SECTIONS.items():
+            if all(key in df.columns for key in keys):
+                partial[name] = self._rows(df.groupby(keys, observed=True)[['매출']].sum())
+
+        if '상품 명칭' in df.columns and '수량' in df.columns:
+            partial["products"] = self._rows(df.groupby('상품 명칭', observed=True)[['매출', '수량']].sum())
+
+        if '고객 수' in df.columns:
+            partial["customer_sum"] = self._native(df['고객 수'].sum())
+
+        # 날짜별 매출/날씨 (기온·습도는 소스를 합친 뒤 평균을 내도록 합계와 건수로 저장)
+        if all(col in df.columns for col in ['기온', '강수량', '습도']):
+            daily = df.groupby(df['매출 일시'].dt.normalize()).agg(
+                매출=('매출', 'sum'),
+                기온_합=('기온', 'sum'),
+                기온_수=('기온', 'count'),
+                강수량=('강수량', 'max'),
+                습도_합=('습도', 'sum'),
+                습도_수=('습도', 'count')
+            )
+            daily.index = daily.index.strftime('%Y-%m-%d')
+            partial["daily"] = self._rows(daily)
+
+        # 매출 예측 입력: 날짜별 매출
+        if '매출 일시' in df.columns:
+            daily_sales = df.groupby(df['매출 일시'].dt.normalize())[['매출']].sum()
+            daily_sales.index = daily_sales.index.strftime('%Y-%m-%d')
+            partial["daily_sales"] = self._rows(daily_sales)
+
+        # 상품 클러스터링 입력: 상품별 매출/수량/단가 + 범주형 변수별 수량 합계
+        category_vars = autoanalysis_service.CLUSTER_CATEGORY_VARS
+        if all(col in df.columns for col in ['상품 명칭', '단가', '수량'] + category_vars):
+            product_stats = df.groupby('상품 명칭', observed=True).agg(
+                매출=('매출', 'sum'),
+                수량=('수량', 'sum'),
+                단가_합=('단가', 'sum'),
+                단가_수=('단가', 'count')
+            )
+            partial["product_stats"] = self._rows(product_stats)
+            for col in category_vars:
+                partial[f"product_qty_{col}"] = self._rows(df.groupby(['상품 명칭', col], observed=True)[['수량']].sum())
+
+        # 영수증(전표 번호)별 합계의 금액대 건수
+        if '전표 번호' in df.columns:
+            transaction_amounts = df.groupby('전표 번호', observed=True)['매출'].sum()
+            counts = pd.cut(transaction_amounts, bins=self.AMOUNT_BINS, labels=self.AMOUNT_LABELS).value_counts(sort=False)
+            partial["transaction_amounts"] = self._rows(counts.to_frame('건수'))
+
+        return partial
+
+    # =====================
+    #  저장/조회
+    # =====================
+
+    def load(self, source_id: str, pos_type: str, preprocess_version: int) -> Optional[Dict[str, Any]]:
+        """저장된 부분 집계 (POS 유형/전처리 버전/집계 버전이 같을 때만)"""
+        try:
+            doc = self._collection().find_one({
+                "_id": ObjectId(source_id),
+                "pos_type": pos_type,
+                "preprocess_version": preprocess_version,
+                "partial_version": self.PARTIAL_VERSION
+            })
+            return doc["partial"] if doc else None
+        except Exception as e:
+            logger.warning(f"소스 {source_id} EDA 부분 집계 조회 실패: {e}")
+            return None
+
+    def save(self, source_id: str, pos_type: str, preprocess_version: int, partial: Dict[str, Any]) -> None:
+        """부분 집계 저장 (실패해도 분석은 계속)"""
+        try:
+            self._collection().replace_one(
+                {"_id": ObjectId(source_id)},
+                {
+                    "pos_type": pos_type,
+                    "preprocess_version": preprocess_version,
+                    "partial_version": self.PARTIAL_VERSION,
+                    "partial": partial,
+                    "created_at": datetime.now()
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"소스 {source_id} EDA 부분 집계 저장 실패: {e}")
+
+    async def get_or_create(
+        self,
+        source_id: str,
+        pos_type: str,
+        preprocess_version: int,
+        load_df: Callable[[], Awaitable[pd.DataFrame]]
+    ) -> Dict[str, Any]:
+        """저장된 부분 집계가 있으면 사용, 없을 때만 load_df()로 전처리 데이터를 읽어 계산 후 저장"""
+        partial = await asyncio.to_thread(self.load, source_id, pos_type, preprocess_version)
+        if partial is not None:
+            logger.info(f"소스 {source_id} EDA 부분 집계 사용")
+            return partial
+
+        df = await load_df()
+        partial = await asyncio.to_thread(self.build, df)
+        await asyncio.to_thread(self.save, source_id, pos_type, preprocess_version, partial)
+        return partial
+
+    # =====================
+    #  병합 → 차트 데이터
+    # =====================
+
+    def _combine(self, partials: List[Dict[str, Any]], name: str, section: tuple) -> Optional[pd.DataFrame]:
+        """소스별 집계 행을 하나의 프레임으로 (집계가 있는 소스가 없으면 None)"""
+        rows = [row for partial in partials for row in (partial.get(name) or [])]
+        if not any(name in partial for partial in partials):
+            return None
+
+        keys, values = section
+        frame = pd.DataFrame(rows, columns=keys + values)
+        # 요일/시간대/월 등은 category로 맞춰 차트 순서를 원본 집계와 같게 유지
+        return autoanalysis_service.compact_time_features(frame)
+
+    def _by_label(self, data):
+        """category 순서(점심/저녁/기타 등) 대신 기존 문자열 라벨 사전순으로 정렬 (응답 키 순서 유지)"""
+        data.index = data.index.astype(str)
+        if isinstance(data, pd.DataFrame):
+            data.columns = data.columns.astype(str)
+            return data.sort_index().sort_index(axis=1)
+        return data.sort_index()
+
+    def merge(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """부분 집계 목록을 Chart.js용 chart_data 구조로 병합"""
+        chart_data = {}
+
+        has_sales = any("sales_sum" in partial for partial in partials)
+        sections = {name: self._combine(partials, name, section) for name, section in self.SALES_SECTIONS.items()}
+        products = self._combine(partials, "products", self.PRODUCT_SECTION)
+
+        # 1. 기본 통계량 계산
+        total_transactions = sum(partial.get("row_count", 0) for partial in partials)
+        total_sales = sum(partial.get("sales_sum", 0) for partial in partials)
+        sales_count = sum(partial.get("sales_count", 0) for partial in partials)
+        avg_transaction = total_sales / sales_count if has_sales and sales_count else 0
+        unique_products = products['상품 명칭'].nunique() if products is not None else 0
+
+        # 기본 통계량
+        chart_data["basic_stats"] = {
+            "total_sales": float(total_sales),
+            "avg_transaction": float(avg_transaction),
+            "total_transactions": total_transactions,
+            "unique_products": unique_products
+        }
+
+        # 2. 요일별 매출
+        if sections["weekday"] is not None:
+            weekday_sales = sections["weekday"].groupby('요일', observed=True)['매출'].sum()
+
+            weekday_sales_dict = {day: float(weekday_sales[day]) if day in weekday_sales else 0 for day in self.DAY_ORDER}
+            chart_data["weekday_sales"] = weekday_sales_dict
+
+        # 3. 시간대별 매출
+        if sections["time_period"] is not None:
+            time_period_dict = self._by_label(sections["time_period"].groupby('시간대', observed=True)['매출'].sum()).to_dict()
+            chart_data["time_period_sales"] = time_period_dict
+
+        # 4. 시간별 매출
+        if sections["hourly"] is not None:
+            hourly_dict = sections["hourly"].groupby('시', observed=True)['매출'].sum().to_dict()
+            chart_data["hourly_sales"] = {str(k): float(v) for k, v in hourly_dict.items()}
+
+        # 5. 상위 상품
+        if products is not None:
+            top_products_dict = products.groupby('상품 명칭')['매출'].sum().sort_values(ascending=False).head(5).to_dict()
+            chart_data["top_products"] = top_products_dict
+
+        # 6. 평일/휴일 매출
+        if sections["holiday"] is not None:
+            holiday_dict = self._by_label(sections["holiday"].groupby('공휴일', observed=True)['매출'].sum()).to_dict()
+            chart_data["holiday_sales"] = holiday_dict
+
+        # 7. 계절별 매출
+        if sections["season"] is not None:
+            season_dict = self._by_label(sections["season"].groupby('계절', observed=True)['매출'].sum()).to_dict()
+            chart_data["season_sales"] = season_dict
+
+        # 9. 고객당 평균 매출
+        customer_sum = sum(partial.get("customer_sum") or 0 for partial in partials)
+        if has_sales and customer_sum > 0:
+            customer_avg = total_sales / customer_sum
+            chart_data["basic_stats"]["customer_avg"] = float(customer_avg)
+
+        # 날짜별 기온 및 날씨 기준 하루 평균 매출
+        daily = self._combine(partials, "daily", self.DAILY_SECTION)
+        if daily is not None:
+            daily_df = daily.groupby('날짜').agg({
+                '매출': 'sum',
+                '기온_합': 'sum',
+                '기온_수': 'sum',
+                '강수량': 'max',
+                '습도_합': 'sum',
+                '습도_수': 'sum'
+            }).reset_index()
+            daily_df['기온'] = daily_df['기온_합'] / daily_df['기온_수']
+            daily_df['습도'] = daily_df['습도_합'] / daily_df['습도_수']
+
+            daily_df['기온_구간'] = (daily_df['기온'] // 5) * 5
+            temp_sales = daily_df.groupby('기온_구간')['매출'].agg(['mean', 'count']).reset_index()
+            temp_sales_filtered = temp_sales[temp_sales['count'] >= 5]
+            chart_data["temperature_sales"] = {
+                f"{int(row['기온_구간'])}~{int(row['기온_구간']) + 5}°C": float(row['mean'])
+                for _, row in temp_sales_filtered.iterrows()
+            }
+
+            daily_df['날씨_상세'] = pd.cut(
+                daily_df['강수량'],
+                bins=[0, 0.1, 5, 20, float('inf')],
+                labels=['맑음', '이슬비', '보통비', '폭우']
+            )
+            weather_sales = daily_df.groupby('날씨_상세', observed=False)['매출'].agg(['mean', 'count']).reset_index()
+            weather_filtered = weather_sales[weather_sales['count'] >= 3]
+            chart_data["weather_sales"] = {
+                str(row['날씨_상세']): float(row['mean'])
+                for _, row in weather_filtered.iterrows()
+            }
+
+        # 12. 요일 + 시간대 교차 분석
+        if sections["weekday_time"] is not None:
+            cross_dict = self._by_label(sections["weekday_time"].pivot_table(index='요일', columns='시간대', values='매출', aggfunc='sum', observed=True).fillna(0)).to_dict()
+            chart_data["weekday_time_sales"] = {k: {str(inner_k): float(inner_v) for inner_k, inner_v in v.items()}
+                                            for k, v in cross_dict.items()}
+
+        # 13. 월별 매출 추세
+        if sections["monthly"] is not None:
+            yearly_monthly_sales = sections["monthly"].groupby(['년', '월'], observed=True)['매출'].sum()
+
+            yearly_monthly_dict = {}
+            for (year, month), sales in yearly_monthly_sales.items():
+                key = f"{year}-{month}"
+                yearly_monthly_dict[key] = float(sales)
+
+            chart_data["monthly_sales"] = yearly_monthly_dict
+
+        # 14. 상품별 판매 비중
+        if products is not None:
+            product_qty = products.groupby('상품 명칭')['수량'].sum()
+            total_qty = product_qty.sum()
+
+            # 상위 10개 품목과 기타로 분류
+            top_products = product_qty.sort_values(ascending=False).head(10)
+            others = pd.Series([product_qty.sum() - top_products.sum()], index=['기타 상품'])
+
+            product_share = pd.concat([top_products, others]) / total_qty * 100
+            product_share_dict = product_share.to_dict()
+            chart_data["product_share"] = {str(k): float(v) for k, v in product_share_dict.items()}
+
+        # 15. 구매 금액대별 거래 건수
+        amounts = self._combine(partials, "transaction_amounts", self.AMOUNT_SECTION)
+        if amounts is not None:
+            transaction_counts = (
+                amounts.groupby('금액대')['건수'].sum()
+                .reindex(self.AMOUNT_LABELS, fill_value=0)
+                .sort_values(ascending=False)
+                .to_dict()
+            )
+            chart_data["transaction_amounts"] = {str(k): int(v) for k, v in transaction_counts.items()}
+
+        return chart_data
+
+    # =====================
+    #  병합 → 예측/클러스터링 입력
+    # =====================
+
+    def forecast_input(self, partials: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """소스별 일별 매출을 합친 예측 입력 (predict_next_30_sales가 날짜별로 다시 합산)"""
+        daily = self._combine(partials, "daily_sales", self.DAILY_SALES_SECTION)
+        if daily is None or daily.empty:
+            return None
+        return pd.DataFrame({'매출 일시': pd.to_datetime(daily['날짜']), '매출': daily['매출']})
+
+    def cluster_input(self, partials: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """소스별 상품 집계를 합친 클러스터링 특성 (행 단위 _cluster_items와 같은 열 구성)"""
+        stats = self._combine(partials, "product_stats", self.PRODUCT_STATS_SECTION)
+        if stats is None or stats.empty:
+            return None
+
+        agg_df = stats.groupby('상품 명칭')[['매출', '수량', '단가_합', '단가_수']].sum()
+        agg_df['단가'] = agg_df['단가_합'] / agg_df['단가_수'].where(agg_df['단가_수'] > 0)
+        agg_df = agg_df[['매출', '수량', '단가']]
+
+        pivot_tables = []
+        for col in autoanalysis_service.CLUSTER_CATEGORY_VARS:
+            qty = self._combine(partials, f"product_qty_{col}", (['상품 명칭', col], ['수량']))
+            pivot_tables.append(autoanalysis_service.product_pivot(qty, col))
+        return autoanalysis_service.cluster_features(agg_df, pivot_tables)
+
+eda_partial_service = EdaPartialService()
@@ -2,6 +2,7 @@
 
 import os
 import logging
+import asyncio
 import pandas as pd
 import numpy as np
 import json
@@ -13,6 +14,8 @@ from services.s3_service import download_file_from_s3
 from services.auto_analysis import autoanalysis_service
 from services.auto_analysis_chat_service import autoanalysis_chat_service
 from services.eda_chat_service import eda_chat_service
+from services.pos_data_cache_service import pos_data_cache_service
+from services.eda_partial_service import eda_partial_service
 
 logger = logging.getLogger(__name__)
 
@@ -20,152 +23,103 @@ class EdaService:
     def __init__(self):
         self.temp_dir = "temp_files"
         os.makedirs(self.temp_dir, exist_ok=True)
+        
+        # EDA 1건당 동시에 요청하는 LLM 요약 수
+        self.summary_concurrency = int(os.getenv("EDA_SUMMARY_CONCURRENCY", 4))
     
     def generate_chart_data(self, df):
-        """Chart.js에 적합한 데이터 구조 생성"""
-
-        chart_data = {}
-        
-        # 1. 기본 통계량 계산
-        total_sales = df['매출'].sum() if '매출' in df.columns else 0
-        avg_transaction = df['매출'].mean() if '매출' in df.columns else 0
-        total_transactions = len(df)
-        unique_products = df['상품 명칭'].nunique() if '상품 명칭' in df.columns else 0
-        
-        # 기본 통계량
-        chart_data["basic_stats"] = {
-            "total_sales": float(total_sales),
-            "avg_transaction": float(avg_transaction),
-            "total_transactions": total_transactions,
-            "unique_products": unique_products
-        }
-        
-        # 2. 요일별 매출
-        if '요일' in df.columns and '매출' in df.columns:
-            day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        """Chart.js에 적합한 데이터 구조 생성 (데이터프레임 하나 기준)"""
+        return eda_partial_service.merge([eda_partial_service.build(df)])
+    
+    def _read_source_file(self, local_path: str, filename: str, pos_type: str) -> pd.DataFrame:
+        """다운로드한 POS 파일 읽기 (키움은 3번째 행이 헤더)"""
+        header = 2 if pos_type == '키움' else 0
+        try:
+            logger.info(f'{pos_type} 데이터 다운로드')
+            file_ext = os.path.splitext(filename)[1].lower()
             
-            available_days = df['요일'].unique().tolist()
-            logger.info(f"데이터에 존재하는 요일: {available_days}")
+            # 파일 크기 확인
+            file_size_mb = os.path.getsize(local_path) / (1024 * 1024)
+            logger.info(f"파일 '{filename}' 크기: {file_size_mb:.2f}MB")
             
-            weekday_sales = df.groupby('요일')['매출'].sum()
+            # 파일이 비어있는지 확인
+            if os.path.getsize(local_path) == 0:
+                raise ValueError(f"파일 '{filename}'이 비어있습니다.")
             
-            weekday_sales_dict = {day: float(weekday_sales[day]) if day in weekday_sales else 0 for day in day_order}
-            chart_data["weekday_sales"] = weekday_sales_dict
-        
-        # 3. 시간대별 매출
-        if '시간대' in df.columns and '매출' in df.columns:
-            time_period_dict = df.groupby('시간대')['매출'].sum().to_dict()
-            chart_data["time_period_sales"] = time_period_dict
-        
-        # 4. 시간별 매출
-        if '시' in df.columns and '매출' in df.columns:
-            hourly_dict = df.groupby('시')['매출'].sum().to_dict()
-            chart_data["hourly_sales"] = {str(k): float(v) for k, v in hourly_dict.items()}
-        
-        # 5. 상위 상품
-        if '상품 명칭' in df.columns and '매출' in df.columns:
-            top_products_dict = df.groupby('상품 명칭')['매출'].sum().sort_values(ascending=False).head(5).to_dict()
-            chart_data["top_products"] = top_products_dict
-        
-        # 6. 평일/휴일 매출
-        if '공휴일' in df.columns and '매출' in df.columns:
-            holiday_dict = df.groupby('공휴일')['매출'].sum().to_dict()
-            chart_data["holiday_sales"] = holiday_dict
-        
-        # 7. 계절별 매출
-        if '계절' in df.columns and '매출' in df.columns:
-            season_dict = df.groupby('계절')['매출'].sum().to_dict()
-            chart_data["season_sales"] = season_dict
-        
-        # 9. 고객당 평균 매출
-        if '고객 수' in df.columns and '매출' in df.columns and df['고객 수'].sum() > 0:
-            customer_avg = df['매출'].sum() / df['고객 수'].sum()
-            chart_data["basic_stats"]["customer_avg"] = float(customer_avg)
-        
-        # 날짜별 기온 및 날씨 기준 하루 평균 매출
-        if all(col in df.columns for col in ['매출', '기온', '강수량', '습도']):
-            df['날짜'] = df['매출 일시'].dt.date
-            daily_df = df.groupby('날짜').agg({
-                '매출': 'sum',
-                '기온': 'mean',
-                '강수량': 'max',
-                '습도': 'mean'
-            }).reset_index()
-
-            daily_df['기온_구간'] = (daily_df['기온'] // 5) * 5
-            temp_sales = daily_df.groupby('기온_구간')['매출'].agg(['mean', 'count']).reset_index()
-            temp_sales_filtered = temp_sales[temp_sales['count'] >= 5]
-            chart_data["temperature_sales"] = {
-                f"{int(row['기온_구간'])}~{int(row['기온_구간']) + 5}°C": float(row['mean'])
-                for _, row in temp_sales_filtered.iterrows()
-            }
-
-            daily_df['날씨_상세'] = pd.cut(
-                daily_df['강수량'],
-                bins=[0, 0.1, 5, 20, float('inf')],
-                labels=['맑음', '이슬비', '보통비', '폭우']
-            )
-            weather_sales = daily_df.groupby('날씨_상세')['매출'].agg(['mean', 'count']).reset_index()
-            weather_filtered = weather_sales[weather_sales['count'] >= 3]
-            chart_data["weather_sales"] = {
-                str(row['날씨_상세']): float(row['mean'])
-                for _, row in weather_filtered.iterrows()
-            }
-        
-        # 12. 요일 + 시간대 교차 분석
-        if all(col in df.columns for col in ['요일', '시간대', '매출']):
-            cross_dict = df.pivot_table(index='요일', columns='시간대', values='매출', aggfunc='sum').fillna(0).to_dict()
-            chart_data["weekday_time_sales"] = {k: {str(inner_k): float(inner_v) for inner_k, inner_v in v.items()} 
-                                            for k, v in cross_dict.items()}
-        
-        # 13. 월별 매출 추세
-        if '년' in df.columns and '월' in df.columns and '매출' in df.columns:
-            yearly_monthly_sales = df.groupby(['년', '월'])['매출'].sum()
+            # 파일 크기에 따른 처리
+            if file_ext == '.xlsx' or file_ext == '.xls':
+                if file_size_mb > 3:
+                    # 대용량 엑셀 파일 특별 처리
+                    logger.info(f"대용량 엑셀 파일({file_size_mb:.2f}MB) 특별 처리")
+                    excel_file = pd.ExcelFile(local_path, engine='openpyxl')
+                    sheet_name = excel_file.sheet_names[0]  # 첫 번째 시트 사용
+                    
+                    # 데이터 행이 있는지 미리 확인
+                    sample_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None, nrows=5)
+                    if sample_df.empty:
+                        raise ValueError(f"파일 '{filename}'의 첫 번째 시트가 비어 있습니다.")
+                    
+                    df = pd.read_excel(excel_file, sheet_name=sheet_name, header=header, engine='openpyxl')
+                else:
+                    # 일반 크기 엑셀 파일 처리
+                    df = pd.read_excel(local_path, header=header, engine='openpyxl')
+            elif file_ext == '.csv':
+                df = pd.read_csv(local_path, header=header)
+            else:
+                raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
             
-            yearly_monthly_dict = {}
-            for (year, month), sales in yearly_monthly_sales.items():
-                key = f"{year}-{month}"
-                yearly_monthly_dict[key] = float(sales)
+            # 데이터프레임이 비어있는지 확인
+            if df.empty:
+                raise ValueError(f"파일 '{filename}'에서 읽은 데이터프레임이 비어 있습니다.")
             
-            chart_data["monthly_sales"] = yearly_monthly_dict
-        
-        # 14. 상품별 판매 비중
-        if '상품 명칭' in df.columns and '수량' in df.columns:
-            product_qty = df.groupby('상품 명칭')['수량'].sum()
-            total_qty = product_qty.sum()
-            
-            # 상위 10개 품목과 기타로 분류
-            top_products = product_qty.sort_values(ascending=False).head(10)
-            others = pd.Series([product_qty.sum() - top_products.sum()], index=['기타 상품'])
-            
-            product_share = pd.concat([top_products, others]) / total_qty * 100
-            product_share_dict = product_share.to_dict()
-            chart_data["product_share"] = {str(k): float(v) for k, v in product_share_dict.items()}
+            # 전처리 전 데이터프레임 정보 로깅
+            logger.info(f"전처리 전 데이터프레임: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
+            logger.info(f"전처리 전 열 목록: {df.columns.tolist()}")
+            return df
+        except Exception as e:
+            raise ValueError(f"{pos_type}파일 {filename} 처리 중 오류 발생: {str(e)}")
+    
+    async def _load_source_frame(self, source, source_id, pos_type, local_files) -> pd.DataFrame:
+        """소스 하나의 전처리 데이터 (Parquet 캐시 → 없으면 S3 다운로드 후 전처리)"""
+        s3_key = source.get("file_path")
+        filename = source.get("original_filename") or s3_key.split("/")[-1]
         
-        # 15. 구매 금액대별 거래 건수
-        if '매출' in df.columns:
-            # 거래별 합계를 계산 (같은 전표 번호끼리 합산)
-            if '전표 번호' in df.columns:
-                transaction_amounts = df.groupby('전표 번호')['매출'].sum()
-                
-                # 금액대별 분류
-                bins = [0, 10000, 20000, 30000, 50000, 100000, float('inf')]
-                labels = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
-                
-                transaction_ranges = pd.cut(transaction_amounts, bins=bins, labels=labels)
-                transaction_counts = transaction_ranges.value_counts().to_dict()
+        async def load_source():
+            temp_path = os.path.join(self.temp_dir, f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}")
+            
+            local_path = await download_file_from_s3(s3_key, temp_path)
+            local_files.append(local_path)
+            
+            if autoanalysis_service.use_chunked_read(local_path, pos_type):
+                # 대용량 CSV는 청크 단위로 읽고 정규화
+                df = await autoanalysis_service.read_and_preprocess(local_path, pos_type)
+            else:
+                df = self._read_source_file(local_path, filename, pos_type)
                 
-                chart_data["transaction_amounts"] = {str(k): int(v) for k, v in transaction_counts.items()}
+                # 전처리 수행
+                df = await autoanalysis_service.preprocess_data(df, pos_type)
+            
+            logger.info(f"전처리 완료: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
+            logger.info(f"전처리 후 열: {df.columns.tolist()}")
+            logger.info(f"'매출' 열 존재 여부: {'매출' in df.columns}")
+            return df
         
-        return chart_data
+        # 이전에 전처리한 소스는 Parquet 캐시에서 바로 로드 (다운로드/엑셀 파싱/전처리 생략)
+        df = await pos_data_cache_service.get_or_create(
+            source, pos_type, autoanalysis_service.PREPROCESS_VERSION, load_source
+        )
+        df['source_id'] = source_id
+        return df
     
     async def perform_eda(self, store_id, source_ids, pos_type="키움"):
         """여러 데이터소스에 대한 EDA 및 자동 분석을 수행하고 결과를 MongoDB에 저장"""
+        summary_tasks = []
         try:
             data_sources = mongo_instance.get_collection("DataSources")
             analysis_results = mongo_instance.get_collection("AnalysisResults")
             
-            preprocessed_data = []
+            sources = []
+            partials = []
             local_files = []
 
             all_date_ranges = []
@@ -179,153 +133,51 @@ class EdaService:
                 if "date_range" in source:
                     all_date_ranges.append(source["date_range"])
                 
-                s3_key = source.get("file_path")
-                if not s3_key:
+                if not source.get("file_path"):
                     raise ValueError(f"소스 {source_id}의 파일 경로 정보가 없습니다.")
                 
-                filename = source.get("original_filename") or s3_key.split("/")[-1]
-                    
-                temp_path = os.path.join(self.temp_dir, f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}")
-                
-                local_path = await download_file_from_s3(s3_key, temp_path)
-                local_files.append(local_path)
-                
-                if pos_type == '키움':
-                    try:
-                        logger.info(f'{pos_type} 데이터 다운로드')
-                        file_ext = os.path.splitext(filename)[1].lower()
-                        
-                        # 파일 크기 확인
-                        file_size_mb = os.path.getsize(local_path) / (1024 * 1024)
-                        logger.info(f"파일 '{filename}' 크기: {file_size_mb:.2f}MB")
-                        
-                        # 파일이 비어있는지 확인
-                        if os.path.getsize(local_path) == 0:
-                            raise ValueError(f"파일 '{filename}'이 비어있습니다.")
-                        
-                        # 파일 크기에 따른 처리
-                        if file_ext == '.xlsx' or file_ext == '.xls':
-                            if file_size_mb > 3:
-                                # 대용량 엑셀 파일 특별 처리
-                                logger.info(f"대용량 엑셀 파일({file_size_mb:.2f}MB) 특별 처리")
-                                excel_file = pd.ExcelFile(local_path, engine='openpyxl')
-                                sheet_name = excel_file.sheet_names[0]  # 첫 번째 시트 사용
-                                
-                                # 데이터 행이 있는지 미리 확인
-                                sample_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None, nrows=5)
-                                if sample_df.empty:
-                                    raise ValueError(f"파일 '{filename}'의 첫 번째 시트가 비어 있습니다.")
-                                
-                                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=2, engine='openpyxl')
-                            else:
-                                # 일반 크기 엑셀 파일 처리
-                                df = pd.read_excel(local_path, header=2, engine='openpyxl')
-                        elif file_ext == '.csv':
-                            df = pd.read_csv(local_path, header=2)
-                        else:
-                            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
-                        
-                        # 데이터프레임이 비어있는지 확인
-                        if df.empty:
-                            raise ValueError(f"파일 '{filename}'에서 읽은 데이터프레임이 비어 있습니다.")
-                        
-                        # 전처리 전 데이터프레임 정보 로깅
-                        logger.info(f"전처리 전 데이터프레임: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
-                        logger.info(f"전처리 전 열 목록: {df.columns.tolist()}")
-                    except Exception as e:
-                        raise ValueError(f"{pos_type}파일 {filename} 처리 중 오류 발생: {str(e)}")
-                    # 전처리 수행
-                    df = await autoanalysis_service.preprocess_data(df, pos_type)
-                    
-                    logger.info(f"전처리 완료: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
-                    logger.info(f"전처리 후 열: {df.columns.tolist()}")
-                    logger.info(f"'매출' 열 존재 여부: {'매출' in df.columns}")
-                    df['source_id'] = source_id
-                    
-                    preprocessed_data.append(df)
-                    
-                else:
-                    try:
-                        logger.info(f'{pos_type} 데이터 다운로드')
-                        file_ext = os.path.splitext(filename)[1].lower()
-                        
-                        # 파일 크기 확인
-                        file_size_mb = os.path.getsize(local_path) / (1024 * 1024)
-                        logger.info(f"파일 '{filename}' 크기: {file_size_mb:.2f}MB")
-                        
-                        # 파일이 비어있는지 확인
-                        if os.path.getsize(local_path) == 0:
-                            raise ValueError(f"파일 '{filename}'이 비어있습니다.")
-                        
-                        # 파일 크기에 따른 처리
-                        if file_ext == '.xlsx' or file_ext == '.xls':
-                            if file_size_mb > 3:
-                                # 대용량 엑셀 파일 특별 처리
-                                logger.info(f"대용량 엑셀 파일({file_size_mb:.2f}MB) 특별 처리")
-                                excel_file = pd.ExcelFile(local_path, engine='openpyxl')
-                                sheet_name = excel_file.sheet_names[0]  # 첫 번째 시트 사용
-                                
-                                # 데이터 행이 있는지 미리 확인
-                                sample_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None, nrows=5)
-                                if sample_df.empty:
-                                    raise ValueError(f"파일 '{filename}'의 첫 번째 시트가 비어 있습니다.")
-                                
-                                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=0, engine='openpyxl')
-                            else:
-                                # 일반 크기 엑셀 파일 처리
-                                df = pd.read_excel(local_path, header=0, engine='openpyxl')
-                        elif file_ext == '.csv':
-                            df = pd.read_csv(local_path, header=0)
-                        else:
-                            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
-                        
-                        # 데이터프레임이 비어있는지 확인
-                        if df.empty:
-                            raise ValueError(f"파일 '{filename}'에서 읽은 데이터프레임이 비어 있습니다.")
-                        
-                        # 전처리 전 데이터프레임 정보 로깅
-                        logger.info(f"전처리 전 데이터프레임: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
-                        logger.info(f"전처리 전 열 목록: {df.columns.tolist()}")
-                    except Exception as e:
-                        raise ValueError(f"{pos_type}파일 {filename} 처리 중 오류 발생: {str(e)}")
-
-
-                    # 전처리 수행
-                    df = await autoanalysis_service.preprocess_data(df, pos_type)
-                    
-                    logger.info(f"전처리 완료: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
-                    logger.info(f"전처리 후 열: {df.columns.tolist()}")
-                    logger.info(f"'매출' 열 존재 여부: {'매출' in df.columns}")
-                    df['source_id'] = source_id
-                    
-                    preprocessed_data.append(df)
-                    
-                
+                sources.append((source_id, source))
+            
+            # 차트/예측/클러스터링용 부분 집계는 소스별로 저장해 두고, 저장된 집계가 없는 소스만 데이터를 읽어 계산
+            for source_id, source in sources:
+                partial = await eda_partial_service.get_or_create(
+                    source_id, pos_type, autoanalysis_service.PREPROCESS_VERSION,
+                    lambda source=source, source_id=source_id: self._load_source_frame(source, source_id, pos_type, local_files)
+                )
+                partials.append(partial)
             
             overall_date_range = self._calculate_overall_date_range(all_date_ranges)
 
-            if not preprocessed_data:
+            if not partials:
                 raise ValueError("처리할 유효한 데이터 소스가 없습니다.")
             
-            combined_df = pd.concat(preprocessed_data, ignore_index=True)
-            print(combined_df)
-            chart_data = self.generate_chart_data(combined_df)
+            chart_data = eda_partial_service.merge(partials)
             
-            eda_result_data = {}
-            for chart_type, data in chart_data.items():
-                if not data:  
-                    continue
-                
-                summary = await eda_chat_service.generate_chart_summary(chart_type, data)
-                
-                eda_result_data[chart_type] = {
-                    "data": data,
-                    "summary": summary
-                }
+            # 차트별/종합 요약은 입력이 준비됐으므로 바로 시작 (동시 요청 수 제한)
+            # 예측/클러스터링 모델 학습은 그동안 별도 스레드에서 진행
+            semaphore = asyncio.Semaphore(max(1, self.summary_concurrency))
+            
+            def start_summary(coro):
+                task = asyncio.create_task(self._bounded(semaphore, coro))
+                summary_tasks.append(task)
+                return task
             
-            overall_summary = await eda_chat_service.generate_overall_summary(chart_data)
+            overall_task = start_summary(eda_chat_service.generate_overall_summary(chart_data))
+            chart_tasks = {
+                chart_type: start_summary(eda_chat_service.generate_chart_summary(chart_type, data))
+                for chart_type, data in chart_data.items()
+                if data
+            }
+            
+            # 매출 예측(일별 매출)과 상품 클러스터링(상품별 특성) 입력도 부분 집계를 합쳐 만든다
+            forecast_df = eda_partial_service.forecast_input(partials)
+            if forecast_df is None:
+                raise ValueError("매출 예측에 필요한 일별 매출 집계가 없습니다.")
+            cluster_df = eda_partial_service.cluster_input(partials)
+            if cluster_df is None:
+                raise ValueError("상품 클러스터링에 필요한 상품 집계가 없습니다.")
             
-            predict_result = await autoanalysis_service.predict_next_30_sales(combined_df)
+            predict_result = await autoanalysis_service.predict_next_30_sales(forecast_df)
             total_sales = sum(item["예측 매출"] for item in predict_result['predictions'])
             predictions_dict = {item["날짜"]: item["예측 매출"] for item in predict_result['predictions']}
             predict_value = {
@@ -333,11 +185,24 @@ class EdaService:
                             "predictions_30" : predictions_dict
                         }
 
-            cluster_result = await autoanalysis_service.cluster_items(combined_df)
+            cluster_result = await autoanalysis_service.cluster_products(cluster_df)
             cluster_value = cluster_result["clusters"]
 
-            predict_summary = await autoanalysis_chat_service.generate_sales_predict_summary(predict_result)
-            cluster_summary = await autoanalysis_chat_service.generate_cluster_summary(cluster_result)
+            predict_task = start_summary(autoanalysis_chat_service.generate_sales_predict_summary(predict_result))
+            cluster_task = start_summary(autoanalysis_chat_service.generate_cluster_summary(cluster_result))
+            
+            await asyncio.gather(*summary_tasks)
+            
+            eda_result_data = {
+                chart_type: {
+                    "data": chart_data[chart_type],
+                    "summary": task.result()
+                }
+                for chart_type, task in chart_tasks.items()
+            }
+            overall_summary = overall_task.result()
+            predict_summary = predict_task.result()
+            cluster_summary = cluster_task.result()
             
             result_doc = {
                 "_id": ObjectId(),
@@ -394,10 +259,18 @@ class EdaService:
             raise ValueError(f"종합 분석에 실패했습니다: {str(e)}")
         
         finally:
+            for task in summary_tasks:
+                if not task.done():
+                    task.cancel()
             for path in local_files:
                 if os.path.exists(path):
                     os.remove(path)
 
+    async def _bounded(self, semaphore: asyncio.Semaphore, coro):
+        """세마포어 안에서 코루틴 실행"""
+        async with semaphore:
+            return await coro
+
     def _calculate_overall_date_range(self, date_ranges):
         """여러 데이터 소스의 날짜 범위를 병합하여 전체 범위 계산"""
         if not date_ranges:
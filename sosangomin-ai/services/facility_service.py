@@ -9,6 +9,8 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 from db_models import Facilities  
+from services.aggregate_cache_service import aggregate_cache_service
+from services.seoul_openapi_client import seoul_openapi_client
 
 logger = logging.getLogger(__name__)
 
@@ -42,21 +44,14 @@ class FacilityDataService:
         try:
             logger.info("집객 시설 데이터 업데이트 시작")
 
-            all_rows = []
             async with aiohttp.ClientSession() as session:
-                for start_index in range(1, total_count + 1,1000):
-                    end_index = start_index + 999
-                    data = await self.fetch_facility_data(session, start_index, end_index)
+                result = await seoul_openapi_client.fetch_all(
+                    session, self.api_key, self.service_name, max_rows=total_count
+                )
 
-                    if 'error' in data:
-                        logger.warning("API 오류로 인해 일부 데이터 누락될 수 있음")
-                        continue
-
-                    rows = data.get(self.service_name, {}).get("row", [])
-                    if not rows:
-                        continue
-
-                    all_rows.extend(rows)
+            if result["failed_pages"]:
+                logger.warning("API 오류로 인해 일부 데이터 누락될 수 있음")
+            all_rows = result["rows"]
 
             total_rows = len(all_rows)
             if total_rows == 0:
@@ -123,6 +118,7 @@ class FacilityDataService:
                 except Exception as e:
                     logger.warning(f"행 처리 오류: {e}")
 
+            aggregate_cache_service.bump_version(db, aggregate_cache_service.FACILITIES)
             db.commit()
             logger.info(f"최신 분기({latest_code}) 기준 저장된 데이터 수: {saved_rows}개")
 
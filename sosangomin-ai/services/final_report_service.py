@@ -11,6 +11,7 @@ from services.auto_analysis import autoanalysis_service
 from services.competitor_service import competitor_service
 from services.eda_chat_service import eda_chat_service
 from services.location_info_service import location_info_service
+from services.llm_client import llm_client
 from dotenv import load_dotenv
 import re
 
@@ -26,8 +27,6 @@ class FinalReportService:
     async def call_claude_api(self, prompt: str) -> Dict[str, Any]:
         """Claude API를 호출하여 SWOT 분석 생성"""
         try:
-            import aiohttp
-            
             if not self.api_key:
                 logger.error("ANTHROPIC_API_KEY가 없어 분석을 수행할 수 없습니다.")
                 return {
@@ -35,37 +34,18 @@ class FinalReportService:
                     "message": "API 키가 설정되지 않았습니다. 환경 변수를 확인하세요."
                 }
                 
-            url = "https://api.anthropic.com/v1/messages"
-            headers = {
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
-            
-            data = {
-                "model": "claude-3-7-sonnet-20250219",
-                "max_tokens": 7000,
-                "messages": [
+            content = await llm_client.create_message(
+                model="claude-3-7-sonnet-20250219",
+                max_tokens=7000,
+                messages=[
                     {"role": "user", "content": prompt}
                 ],
-                "system": "당신은 소상공인을 위한 사업 분석 전문가입니다. 주어진 데이터를 바탕으로 정확하고 객관적인 SWOT 분석을 제공합니다."
+                system="당신은 소상공인을 위한 사업 분석 전문가입니다. 주어진 데이터를 바탕으로 정확하고 객관적인 SWOT 분석을 제공합니다."
+            )
+            return {
+                "status": "success",
+                "content": content
             }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=data) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Claude API 오류: {response.status}, {error_text}")
-                        return {
-                            "status": "error",
-                            "message": f"Claude API 오류: {response.status}"
-                        }
-                        
-                    response_json = await response.json()
-                    return {
-                        "status": "success",
-                        "content": response_json["content"][0]["text"]
-                    }
                     
         except Exception as e:
             logger.error(f"Claude API 호출 중 오류: {e}")
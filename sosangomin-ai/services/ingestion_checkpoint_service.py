@@ -0,0 +1,184 @@
+# services/ingestion_checkpoint_service.py
+
+import logging
+import asyncio
+from typing import Any, Dict, List, Optional
+from db_models import IngestionCheckpoint, IngestionCheckpointPage
+from services.seoul_openapi_client import seoul_openapi_client, SeoulOpenApiError
+
+logger = logging.getLogger(__name__)
+
+class IngestionCheckpointService:
+    """서울 열린데이터 수집 작업의 분기/페이지 단위 체크포인트
+
+    - 상위 API의 최신 분기가 이미 수집 완료된 분기와 같으면 수집을 건너뛴다.
+    - 받은 페이지는 바로 ingestion_checkpoint_pages에 커밋하므로, 중간에 실패하거나
+      재시작되어도 다음 실행에서 남은 페이지만 받아 이어서 수집한다.
+    """
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+    # 수집 작업(update_*) 결과
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+    def __init__(self):
+        self._tables_ready = False
+        logger.info("IngestionCheckpointService 초기화 완료")
+
+    def _session(self):
+        from database.connector import database_instance as mariadb
+
+        if not self._tables_ready:
+            IngestionCheckpoint.__table__.create(bind=mariadb.engine, checkfirst=True)
+            IngestionCheckpointPage.__table__.create(bind=mariadb.engine, checkfirst=True)
+            self._tables_ready = True
+
+        return mariadb.pre_session()
+
+    # =====================
+    #  수집 필요 여부 판단
+    # =====================
+
+    async def fetch_latest_quarter(self, session, api_key: str, service_name: str) -> Optional[str]:
+        """상위 API의 최신 기준 분기 (첫 페이지 STDR_YYQU_CD의 최댓값 - 응답 정렬 순서에 의존하지 않음)
+
+        수집 서비스는 이 값을 그대로 수집/완료 처리 분기로 사용해야 다음 실행의 비교와 일치한다.
+        """
+        page = await seoul_openapi_client.fetch_page(
+            session, api_key, service_name, 1, seoul_openapi_client.PAGE_SIZE
+        )
+        quarters = [str(row["STDR_YYQU_CD"]) for row in page["rows"] if row.get("STDR_YYQU_CD")]
+        return max(quarters) if quarters else None
+
+    async def get_pending_quarter(
+        self,
+        session,
+        dataset: str,
+        api_key: str,
+        service_name: str,
+        stored_quarter: Optional[str] = None
+    ) -> Optional[str]:
+        """수집해야 할 최신 분기, 이미 수집된 분기면 None
+
+        stored_quarter: 체크포인트가 없을 때 비교할 DB 저장 데이터의 최신 분기 (예: "20244")
+        """
+        latest_quarter = await self.fetch_latest_quarter(session, api_key, service_name)
+        if not latest_quarter:
+            logger.warning(f"{dataset} 최신 분기를 확인할 수 없습니다.")
+            return None
+
+        db = self._session()
+        try:
+            checkpoint = db.get(IngestionCheckpoint, dataset)
+            if checkpoint and checkpoint.quarter == latest_quarter and checkpoint.status == self.COMPLETED:
+                logger.info(f"{dataset} {latest_quarter} 분기는 이미 수집 완료 - 수집 생략")
+                return None
+            if not checkpoint and stored_quarter == latest_quarter:
+                logger.info(f"{dataset} {latest_quarter} 분기 데이터가 이미 저장되어 있음 - 수집 생략")
+                return None
+        finally:
+            db.close()
+
+        return latest_quarter
+
+    # =====================
+    #  체크포인트 기반 수집
+    # =====================
+
+    async def fetch_rows(
+        self,
+        session,
+        dataset: str,
+        api_key: str,
+        service_name: str,
+        quarter: str,
+        max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """체크포인트에 없는 페이지만 받아 저장한 뒤 전체 행 반환 (실패 페이지가 있으면 SeoulOpenApiError)"""
+        db = self._session()
+        try:
+            checkpoint = db.get(IngestionCheckpoint, dataset)
+            if checkpoint is None:
+                checkpoint = IngestionCheckpoint(dataset=dataset)
+                db.add(checkpoint)
+
+            # 다른 분기의 체크포인트는 버리고 새로 시작
+            if checkpoint.quarter != quarter:
+                db.query(IngestionCheckpointPage).filter(IngestionCheckpointPage.dataset == dataset).delete(synchronize_session=False)
+                checkpoint.quarter = quarter
+            checkpoint.status = self.RUNNING
+            db.commit()
+
+            completed_pages = [
+                row.page
+                for row in db.query(IngestionCheckpointPage.page)
+                .filter(IngestionCheckpointPage.dataset == dataset, IngestionCheckpointPage.quarter == quarter)
+                .all()
+            ]
+            if completed_pages:
+                logger.info(f"{dataset} {quarter} 체크포인트에서 재개 - 완료된 페이지 {len(completed_pages)}개")
+
+            # 페이지 저장은 별도 세션으로 스레드에서 실행 (이벤트 루프를 막지 않도록)
+            async def on_page(page: int, rows: List[Dict[str, Any]]):
+                await asyncio.to_thread(self._save_page, dataset, quarter, page, rows)
+
+            result = await seoul_openapi_client.fetch_all(
+                session, api_key, service_name,
+                max_rows=max_rows,
+                completed_pages=completed_pages,
+                on_page=on_page
+            )
+
+            checkpoint.total_pages = result["page_count"]
+            db.commit()
+
+            if result["failed_pages"]:
+                raise SeoulOpenApiError(f"{dataset} 페이지 수집 실패 (다음 실행에서 재개) : {result['failed_pages']}")
+
+            pages = (
+                db.query(IngestionCheckpointPage.rows)
+                .filter(IngestionCheckpointPage.dataset == dataset, IngestionCheckpointPage.quarter == quarter)
+                .order_by(IngestionCheckpointPage.page)
+                .all()
+            )
+            return [row for page in pages for row in page.rows]
+
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _save_page(self, dataset: str, quarter: str, page: int, rows: List[Dict[str, Any]]) -> None:
+        """받은 페이지 한 개를 체크포인트로 커밋"""
+        db = self._session()
+        try:
+            db.add(IngestionCheckpointPage(dataset=dataset, quarter=quarter, page=page, rows=rows))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def mark_completed(self, dataset: str, quarter: str) -> None:
+        """DB 반영까지 끝난 분기를 완료 처리하고 페이지 데이터 정리"""
+        db = self._session()
+        try:
+            checkpoint = db.get(IngestionCheckpoint, dataset) or IngestionCheckpoint(dataset=dataset)
+            checkpoint.quarter = quarter
+            checkpoint.status = self.COMPLETED
+            db.merge(checkpoint)
+            db.query(IngestionCheckpointPage).filter(IngestionCheckpointPage.dataset == dataset).delete(synchronize_session=False)
+            db.commit()
+            logger.info(f"{dataset} {quarter} 분기 수집 완료 처리")
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"{dataset} 체크포인트 완료 처리 실패: {e}")
+        finally:
+            db.close()
+
+ingestion_checkpoint_service = IngestionCheckpointService()
@@ -0,0 +1,141 @@
+# services/kiwoom_normalizer.py
+
+import logging
+import pandas as pd
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class KiwoomNormalizer:
+    """키움 POS 엑셀(영수증별 매출 내역) 정규화
+
+    반복 헤더 행과 영수증마다 위치가 다른 단가/수량 열을 정리해 한 행이 한 품목인 표준 형태로 만든다.
+    pandas/numpy만 사용하므로 DB/모델 의존성 없이 단독으로 import해 검증할 수 있다.
+    """
+
+    def drop_duplicate_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """값이 같은 열 제거 (df.T.drop_duplicates().T와 동일한 결과)
+
+        전치 없이 전체 값을 한 번에 factorize해 열마다 코드 배열을 만들고, 코드 배열이 같은 열을
+        중복으로 본다. 전치 결과와 같도록 남은 열은 공통 dtype(대개 object)으로 맞춘다.
+        결측값(None/NaN/NaT)은 factorize에서 모두 같은 코드(-1)가 된다. drop_duplicates도 내부에서
+        같은 factorize로 행을 비교하므로 None과 NaN만 다른 두 열은 양쪽 모두 중복으로 처리된다.
+        """
+        if df.empty:
+            return df.T.drop_duplicates().T
+
+        values = df.to_numpy()
+        codes, _ = pd.factorize(values.ravel(order="F"))
+        codes = codes.reshape(values.shape[1], values.shape[0])
+
+        seen = set()
+        keep = np.zeros(values.shape[1], dtype=bool)
+        for i in range(values.shape[1]):
+            key = codes[i].tobytes()
+            if key not in seen:
+                seen.add(key)
+                keep[i] = True
+
+        return pd.DataFrame(values[:, keep], index=df.index, columns=df.columns[keep], dtype=values.dtype)
+
+    def header_row_mask(self, df: pd.DataFrame, header_names: list) -> np.ndarray:
+        """헤더명과 같은 값이 하나라도 있는 행 (행 단위 apply 대신 열 단위로 계산)"""
+        values = df.to_numpy()
+        mask = np.zeros(values.shape[0], dtype=bool)
+        for i in range(values.shape[1]):
+            mask |= pd.Series(values[:, i]).astype(str).isin(header_names).to_numpy()
+        return mask
+
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """키움 POS 엑셀의 반복 헤더/분할 열을 정리해 표준 형태로 변환"""
+        # 헤더의 변수명과 같은 값을 가지는 열을 삭제 
+        header_values = set(df.columns.tolist()) 
+        columns_to_drop = [col for col in df.columns if df[col].astype(str).isin(header_values).any()]
+        df = df.drop(columns=columns_to_drop)
+
+        if df.empty:
+            raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
+
+        logger.info(f"[초기 df shape]: {df.shape}")
+
+        # 모든 NaN 행 제거
+        df = df.dropna(axis=0, how='all')
+        logger.info(f"[NaN 행 제거 후]: {df.shape}")
+
+        # 모든 NaN 열 제거
+        df = df.dropna(axis=1, how='all')
+        logger.info(f"[NaN 열 제거 후]: {df.shape}")
+
+        # 고유값 1개 이하 컬럼 제거
+        df = df.loc[:, df.nunique() > 1]
+        logger.info(f"[고유값 1개 이하 컬럼 제거 후]: {df.shape}")
+
+        # 중복 열 제거
+        df = self.drop_duplicate_columns(df)
+        logger.info(f"[중복 열 제거 후]: {df.shape}")
+
+        if df.empty:
+            raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
+
+        # 'Unnamed'가 포함되지 않은 열 중복
+        cols_to_fill = [col for col in df.columns if 'Unnamed' not in str(col)]
+        df[cols_to_fill] = df[cols_to_fill].ffill()
+
+        # 동일 속성이 여러 다른 칼럼에 존재하는 경우, 이를 하나의 칼럼으로 정리
+        # 열별 문자열 고유값을 한 번만 계산해 속성 4개 검사에 재사용
+        unique_strings = {}
+
+        def column_contains(col, val) -> bool:
+            if col not in unique_strings:
+                unique_strings[col] = pd.Series(pd.unique(df[col].astype(str).to_numpy()))
+            return unique_strings[col].str.contains(val, na=False).any()
+
+        dup_val = ['단가', '수량', '원가', '거스름']
+        for val in dup_val :
+            columns = [col for col in df.columns if column_contains(col, val)]
+            if columns:
+                df[val] = df[columns].bfill(axis=1).iloc[:, 0] 
+                df = df.drop(columns=columns)
+                unique_strings.pop(val, None)
+        if "거스름" in df.columns:
+            df.drop(columns=['거스름'], inplace=True)
+        if "원가" in df.columns:
+            df.drop(columns=['원가'], inplace=True)
+
+        logger.error(f'[df.dropna] 처리 전 {len(df)}')
+        df = df.dropna(axis=0, how='any') # 결측값이 있는 행 제거
+        logger.error(f'[df.dropna] 처리 후 {len(df)}')
+
+        if df.shape[0] == 0:
+            logger.error("❌ 컬럼명 처리 직전에 데이터프레임이 비어있음. 열 이름 추출 불가.")
+            raise ValueError("컬럼명 처리 전에 데이터가 존재하지 않습니다.")
+
+        logger.info(f"[컬럼명 처리 시작] df.shape: {df.shape}, columns: {df.columns.tolist()}")
+
+        try:
+            new_columns = [df.iloc[0, i] if 'Unnamed' in str(col) else col for i, col in enumerate(df.columns)]
+        except Exception as e:
+            logger.error(f"❗ new_columns 생성 중 오류 발생: {e}")
+            raise
+
+        df.columns = new_columns
+        logger.info(f"[전처리 전] df shape: {df.shape}")
+        df = df[~self.header_row_mask(df, new_columns)]
+        logger.info(f"[컬럼 정리 후] df shape: {df.shape}")
+
+        if df.empty:
+            logger.warning("컬럼명 처리 후 데이터프레임이 비어 있습니다.")
+            raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
+        
+        df = df.loc[:, df.nunique() > 1]  
+
+        if df.empty:
+            logger.warning("컬럼명 처리 후 데이터프레임이 비어 있습니다.")
+            raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
+        
+        # 매출 
+        df = df.drop(columns=['총매출', '실매출'], errors='ignore') 
+        df['매출'] = (df['단가'] * df['수량']).astype(int)
+        return df
+
+kiwoom_normalizer = KiwoomNormalizer()
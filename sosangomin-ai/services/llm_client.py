@@ -0,0 +1,112 @@
+# services/llm_client.py
+
+import os
+import logging
+import asyncio
+from typing import Any, Dict, List, Optional
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient, APIConnectionError, APIStatusError, APITimeoutError
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+class LLMClient:
+    """Claude API 공용 비동기 클라이언트
+
+    - 워커당 하나의 AsyncAnthropic(httpx 커넥션 풀)을 재사용
+    - 요청 타임아웃, 429/5xx/연결 오류 시 지수 백오프 재시도 (SDK max_retries)
+    - 긴 생성(max_tokens >= LLM_LONG_GENERATION_TOKENS)은 읽기 타임아웃 시 재시도하지 않음
+      (비스트리밍 호출이라 재시도하면 전체 응답을 처음부터 다시 생성)
+    - 동시 생성 요청 수 제한 (초과 요청은 대기)
+    생성 중에도 이벤트 루프를 막지 않으므로 다른 요청이 계속 처리된다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not self.api_key:
+            logger.error("Anthropic API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
+
+        self.max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", 3))
+        # 비스트리밍 호출의 읽기 타임아웃 - 7000토큰 보고서 생성도 끝날 수 있도록 넉넉히
+        self.timeout = float(os.getenv("LLM_TIMEOUT", 300))
+        self.long_generation_tokens = int(os.getenv("LLM_LONG_GENERATION_TOKENS", 2000))
+        max_connections = int(os.getenv("LLM_MAX_CONNECTIONS", 20))
+
+        self.client = AsyncAnthropic(
+            api_key=self.api_key or "NOT_SET",
+            max_retries=self.max_retries,
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                )
+            )
+        )
+        self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        logger.info(f"LLMClient 초기화 완료 (동시 요청 {self.max_concurrency}개)")
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
+
+    async def create_message(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """메시지 생성 후 첫 텍스트 블록 반환 (재시도 후에도 실패하면 예외)
+
+        timeout: 이 호출의 읽기 타임아웃(초), 없으면 LLM_TIMEOUT
+        """
+        params: Dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": messages
+        }
+        if system:
+            params["system"] = system
+        if temperature is not None:
+            params["temperature"] = temperature
+
+        if timeout is not None:
+            params["timeout"] = httpx.Timeout(timeout, connect=10.0)
+
+        async with self._semaphore:
+            if max_tokens >= self.long_generation_tokens:
+                response = await self._create_long(params)
+            else:
+                response = await self.client.messages.create(**params)
+
+        return response.content[0].text
+
+    async def _create_long(self, params: Dict[str, Any]):
+        """긴 생성 요청 - 429/5xx/연결 오류만 재시도하고 읽기 타임아웃은 바로 실패"""
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await client.messages.create(**params)
+            except APITimeoutError:
+                raise
+            except (APIConnectionError, APIStatusError) as e:
+                status = getattr(e, "status_code", None)
+                retryable = status is None or status == 429 or status >= 500
+                if not retryable or attempt == self.max_retries:
+                    raise
+                backoff = min(2 ** attempt, 8)
+                logger.warning(f"LLM 요청 실패 ({attempt + 1}/{self.max_retries}), {backoff}초 후 재시도 : {e}")
+                await asyncio.sleep(backoff)
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        await self.client.close()
+
+llm_client = LLMClient()
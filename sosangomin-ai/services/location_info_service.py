@@ -54,9 +54,7 @@ class LocationInfoService:
             행정동 관련 정보 또는 에러 메시지
         """
         try:
-            heatmap_data = location_recommendation_service.prepare_initial_heatmap_data()
-            
-            dong_data = next((item for item in heatmap_data if item["행정동명"] == dong_name), None)
+            dong_data = location_recommendation_service.get_heatmap_dong(dong_name)
             
             if not dong_data:
                 return {
@@ -1,11 +1,13 @@
 import pandas as pd
 import os
 import json
+import hashlib
 from sqlalchemy.orm import Session
 from database.connector import database_instance
 from db_models import Population, Facilities, SalesData, RentInfo, StoreCategories
-from sklearn.preprocessing import MinMaxScaler
-from typing import List
+from services.aggregate_cache_service import aggregate_cache_service
+import numpy as np
+from typing import List, Dict, Any, Optional
 import logging
 from fastapi import HTTPException
 
@@ -21,6 +23,76 @@ class LocationRecomService:
         with open(os.path.join(json_dir, "area_data.json"), "r", encoding="utf-8") as f:
             self.area_data = json.load(f)
 
+    # =====================
+    #  히트맵 (분기 단위로 동일한 응답 → 프로세스/Redis 캐시 + ETag)
+    # =====================
+
+    HEATMAP_REDIS_PREFIX = "location:heatmap"
+    HEATMAP_REDIS_TTL = 60 * 60 * 24 * 7
+
+    def get_heatmap_payload(self) -> Dict[str, Any]:
+        """히트맵 데이터, ETag(내용 해시), 행정동명 인덱스 조회"""
+        db = database_instance.pre_session()
+        try:
+            datasets = [aggregate_cache_service.POPULATION, aggregate_cache_service.STORE_CATEGORIES]
+            return aggregate_cache_service.get_or_compute(
+                db,
+                "heatmap_payload",
+                datasets,
+                lambda: self._load_heatmap_payload(db, datasets)
+            )
+        finally:
+            db.close()
+
+    def get_heatmap_dong(self, dong_name: str) -> Optional[Dict[str, Any]]:
+        """행정동명으로 히트맵 데이터 조회 (O(1))"""
+        return self.get_heatmap_payload()["index"].get(dong_name)
+
+    def _load_heatmap_payload(self, db: Session, datasets: List[str]) -> Dict[str, Any]:
+        """Redis에 저장된 히트맵을 읽고, 없으면 계산 후 저장"""
+        versions = aggregate_cache_service.get_versions(db)
+        redis_key = f"{self.HEATMAP_REDIS_PREFIX}:" + ":".join(str(versions.get(d, 0)) for d in datasets)
+
+        redis_client = self._get_redis_client()
+        body = None
+        if redis_client is not None:
+            try:
+                body = redis_client.get(redis_key)
+            except Exception as e:
+                logger.warning(f"Redis 히트맵 조회 실패: {e}")
+
+        if body is None:
+            data = self.prepare_initial_heatmap_data()
+            body = json.dumps(data, ensure_ascii=False, default=str)
+            if redis_client is not None:
+                try:
+                    redis_client.set(redis_key, body, ex=self.HEATMAP_REDIS_TTL)
+                except Exception as e:
+                    logger.warning(f"Redis 히트맵 저장 실패: {e}")
+        else:
+            data = json.loads(body)
+
+        # 행정동명이 중복되면 첫 레코드 사용
+        index = {}
+        for item in data:
+            index.setdefault(item["행정동명"], item)
+
+        return {
+            "etag": '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"',
+            "body": body,
+            "data": data,
+            "index": index
+        }
+
+    def _get_redis_client(self):
+        """Redis 클라이언트 (설정/패키지가 없으면 None → 프로세스 캐시만 사용)"""
+        try:
+            from config.redis_config import redis_client
+            return redis_client
+        except Exception as e:
+            logger.debug(f"Redis 클라이언트 사용 불가: {e}")
+            return None
+
     def prepare_initial_heatmap_data(self) -> pd.DataFrame:
         """상권분석 페이지 초기 히트맵을 위한 데이터 처리"""
         db = database_instance.pre_session()
@@ -42,10 +114,10 @@ class LocationRecomService:
             df_pop = pd.DataFrame(pop_data)
 
             # 2. 점포 수 정보
-            latest_store = db.query(StoreCategories.year, StoreCategories.quarter).order_by(StoreCategories.year.desc(), StoreCategories.quarter.desc()).first()
+            latest_year, latest_quarter = aggregate_cache_service.get_latest_quarter(db, StoreCategories)
             store_rows = db.query(StoreCategories).filter(
-                StoreCategories.year == latest_store.year,
-                StoreCategories.quarter == latest_store.quarter,
+                StoreCategories.year == latest_year,
+                StoreCategories.quarter == latest_quarter,
                 StoreCategories.main_category == "외식업"
             ).all()
 
@@ -82,109 +154,175 @@ class LocationRecomService:
         finally:
             db.close()
 
-    def get_integrated_location_dataframe(self, target_age: str, industry_name: str) -> pd.DataFrame:
-        """입지추천을 위한 데이터 병합 수행(타겟연령, 업종 반영)"""
+    # =====================
+    #  입지추천 데이터셋 (컬럼형, 데이터셋 버전별 캐시)
+    # =====================
+
+    POP_SUFFIXES = ["fpop", "repop", "wrpop"]
+    AGE_GROUPS = ["10", "20", "30", "40", "50", "60"]
+
+    def get_location_dataset(self) -> Dict[str, Any]:
+        """전체 행정동 입지추천 데이터셋 조회 (수집 작업으로 데이터셋 버전이 바뀔 때만 재구성)"""
         db = database_instance.pre_session()
         try:
-            # 1. 인구 정보
-            pop_rows = db.query(Population).all()
-            pop_data = []
-            for row in pop_rows:
-                try:
-                    total_pop = (row.tot_fpop or 0) + (row.tot_wrpop or 0) + (row.tot_repop or 0)
-                    target_total = (
-                        (getattr(row, f"female_{target_age}_fpop", 0) or 0) + (getattr(row, f"male_{target_age}_fpop", 0) or 0) +
-                        (getattr(row, f"female_{target_age}_repop", 0) or 0) + (getattr(row, f"male_{target_age}_repop", 0) or 0) +
-                        (getattr(row, f"female_{target_age}_wrpop", 0) or 0) + (getattr(row, f"male_{target_age}_wrpop", 0) or 0)
-                    )
-                    if target_age == "60" : 
-                        target_total += (getattr(row, f"female_70_fpop", 0) or 0) + (getattr(row, f"male_70_fpop", 0) or 0) 
-                    target_ratio = target_total / total_pop if total_pop else 0
-                    pop_data.append({
-                        "행정동명": row.region_name,
-                        f"타겟연령_비율": target_ratio,
-                        f"타겟연령_수": target_total,
-                        "유동인구": row.tot_fpop or 0,
-                        "직장인구": row.tot_wrpop or 0,
-                        "거주인구": row.tot_repop or 0
-                    })
-                except Exception as e:
-                    logger.warning(f"입지추천 인구 데이터 처리 오류: {e}")
+            return aggregate_cache_service.get_or_compute(
+                db,
+                "location_dataset",
+                [
+                    aggregate_cache_service.POPULATION,
+                    aggregate_cache_service.FACILITIES,
+                    aggregate_cache_service.SALES_DATA,
+                    aggregate_cache_service.STORE_CATEGORIES,
+                    aggregate_cache_service.RENT_INFO
+                ],
+                lambda: self._build_location_dataset(db)
+            )
+        finally:
+            db.close()
 
-            df_pop = pd.DataFrame(pop_data)
+    def _build_location_dataset(self, db: Session) -> Dict[str, Any]:
+        """인구/시설/매출/점포/임대료 테이블을 한 번에 읽어 행정동 기준 컬럼형 프레임으로 구성"""
+        # 1. 인구 정보 (성별/연령대 전체 컬럼 포함, 행 단위 유지)
+        age_gender_columns = [
+            f"{gender}_{age}_{suffix}"
+            for suffix in self.POP_SUFFIXES
+            for gender in ("male", "female")
+            for age in self.AGE_GROUPS
+        ]
+        pop_rows = db.query(
+            Population.region_name,
+            Population.tot_fpop,
+            Population.tot_wrpop,
+            Population.tot_repop,
+            *[getattr(Population, col) for col in age_gender_columns]
+        ).all()
+        df_pop = pd.DataFrame(pop_rows, columns=["행정동명", "유동인구", "직장인구", "거주인구"] + age_gender_columns)
+        value_columns = ["유동인구", "직장인구", "거주인구"] + age_gender_columns
+        df_pop[value_columns] = df_pop[value_columns].apply(pd.to_numeric).fillna(0)
+
+        # 2. 시설 정보 - 가장 최근 연도/분기 데이터만 사용
+        facility_year, facility_quarter = aggregate_cache_service.get_latest_quarter(db, Facilities)
+        facility_rows = db.query(
+            Facilities.region_name,
+            Facilities.arprt_co,
+            Facilities.rlroad_statn_co,
+            Facilities.bus_trminl_co,
+            Facilities.subway_statn_co,
+            Facilities.bus_sttn_co,
+            Facilities.viatr_fclty_co
+        ).filter(
+            Facilities.year == facility_year,
+            Facilities.quarter == facility_quarter
+        ).all()
+        df_facility = pd.DataFrame(facility_rows, columns=[
+            "행정동명", "arprt_co", "rlroad_statn_co", "bus_trminl_co", "subway_statn_co", "bus_sttn_co", "viatr_fclty_co"
+        ])
+        df_facility = df_facility.set_index("행정동명").apply(pd.to_numeric).fillna(0)
+        df_facility = pd.DataFrame({
+            "접근성_합": df_facility[["arprt_co", "rlroad_statn_co", "bus_trminl_co", "subway_statn_co", "bus_sttn_co"]].sum(axis=1),
+            "집객시설": df_facility["viatr_fclty_co"]
+        }).groupby(level=0).mean()
+
+        # 3. 점포 수 정보 - 최신 기준, 전체 업종
+        store_year, store_quarter = aggregate_cache_service.get_latest_quarter(db, StoreCategories)
+        storecat_rows = db.query(
+            StoreCategories.region_name,
+            StoreCategories.industry_name,
+            StoreCategories.store_count
+        ).filter(
+            StoreCategories.year == store_year,
+            StoreCategories.quarter == store_quarter
+        ).all()
+        df_storecat = pd.DataFrame(storecat_rows, columns=["행정동명", "업종명", "점포수"])
+        df_storecat["점포수"] = pd.to_numeric(df_storecat["점포수"]).fillna(0)
+
+        # 행정동 x 업종 동일업종 수
+        store_count = df_storecat.pivot_table(index="행정동명", columns="업종명", values="점포수", aggfunc="mean")
+
+        # 4. 매출 정보 - 최신 연도/분기 기준, 전체 업종 (점포당 평균 매출)
+        sales_year, sales_quarter = aggregate_cache_service.get_latest_quarter(db, SalesData)
+        sales_rows = db.query(
+            SalesData.region_name,
+            SalesData.industry_name,
+            SalesData.sales_amount
+        ).filter(
+            SalesData.year == sales_year,
+            SalesData.quarter == sales_quarter
+        ).all()
+        df_sales = pd.DataFrame(sales_rows, columns=["행정동명", "업종명", "매출"])
+        df_sales["매출"] = pd.to_numeric(df_sales["매출"]).fillna(0)
+
+        last_store_count = df_storecat.drop_duplicates(["행정동명", "업종명"], keep="last")
+        df_sales = df_sales.merge(last_store_count, on=["행정동명", "업종명"], how="left")
+        df_sales["점포수"] = df_sales["점포수"].fillna(0)
+        df_sales["평균매출"] = (df_sales["매출"] / df_sales["점포수"]).where(df_sales["점포수"] != 0, 0)
+
+        avg_sales = df_sales.pivot_table(index="행정동명", columns="업종명", values="평균매출", aggfunc="mean")
+
+        # 5. 임대료 
+        rent_year, rent_quarter = aggregate_cache_service.get_latest_rent_quarter(db)
+        rent_rows = db.query(RentInfo.ADSTRD_CD_NM, RentInfo.EXCHE_RENTCG_AVE).filter(
+            RentInfo.STRD_YR_CD == rent_year,
+            RentInfo.STRD_QTR_CD == rent_quarter,
+            RentInfo.LET_CURPRC_FLR_CLSF_CD_NM == "전체층"
+        ).all()
+        df_rent = pd.DataFrame(rent_rows, columns=["행정동명", "임대료"])
+        rent = pd.to_numeric(df_rent["임대료"]).fillna(0).groupby(df_rent["행정동명"]).mean()
+
+        # 6. 면적
+        area = pd.to_numeric(pd.Series(self.area_data))
+
+        logger.info(f"입지추천 데이터셋 구성 완료: 행정동 {df_pop['행정동명'].nunique()}개, 업종 {store_count.shape[1]}개")
 
-            # 2. 시설 정보 - 가장 최근 연도/분기 데이터만 사용
-            latest_facility = db.query(Facilities.year, Facilities.quarter).order_by(Facilities.year.desc(), Facilities.quarter.desc()).limit(1).first()
-            facility_rows = db.query(Facilities).filter(
-                Facilities.year == latest_facility.year,
-                Facilities.quarter == latest_facility.quarter
-            ).all()
-            facility_data = [
-                {
-                    "행정동명": row.region_name,
-                    "접근성_합": (
-                        (row.arprt_co or 0) + (row.rlroad_statn_co or 0) +
-                        (row.bus_trminl_co or 0) + (row.subway_statn_co or 0) + (row.bus_sttn_co or 0)
-                    ),
-                    "집객시설": row.viatr_fclty_co or 0
-                }
-                for row in facility_rows
-            ]
-            df_facility = pd.DataFrame(facility_data)
-
-            # 3. 매출 정보 - 최신 연도/분기 기준
-            latest_sales = db.query(SalesData.year, SalesData.quarter).order_by(SalesData.year.desc(), SalesData.quarter.desc()).first()
-            sales_rows = db.query(SalesData).filter(
-                SalesData.year == latest_sales.year,
-                SalesData.quarter == latest_sales.quarter,
-                SalesData.industry_name == industry_name
-            ).all()
+        return {
+            "population": df_pop,
+            "facility": df_facility,
+            "store_count": store_count,
+            "avg_sales": avg_sales,
+            "rent": rent,
+            "area": area
+        }
 
-            # 4. 점포 수 정보 - 최신 기준
-            latest_store = db.query(StoreCategories.year, StoreCategories.quarter).order_by(StoreCategories.year.desc(), StoreCategories.quarter.desc()).first()
-            storecat_rows = db.query(StoreCategories).filter(
-                StoreCategories.year == latest_store.year,
-                StoreCategories.quarter == latest_store.quarter,
-                StoreCategories.industry_name == industry_name
-            ).all()
-            storecat_dict = {row.region_name: row.store_count or 0 for row in storecat_rows}
-
-            sales_data = []
-            for row in sales_rows:
-                store_count = storecat_dict.get(row.region_name, 0)
-                avg_sales = (row.sales_amount / store_count) if store_count else 0
-                sales_data.append({
-                    "행정동명": row.region_name,
-                    "업종_평균_매출": avg_sales
-                })
-            df_sales = pd.DataFrame(sales_data)
-
-            storecat_data = [
-                {"행정동명": row.region_name, 
-                "동일업종_수": row.store_count or 0}
-                for row in storecat_rows
-            ]
-            df_storecat = pd.DataFrame(storecat_data)
-
-            # 5. 임대료 
-            latest_rent = db.query(RentInfo.STRD_YR_CD, RentInfo.STRD_QTR_CD).order_by(RentInfo.STRD_YR_CD.desc(), RentInfo.STRD_QTR_CD.desc()).first()
-            rent_rows = db.query(RentInfo).filter(
-                RentInfo.STRD_YR_CD == latest_rent.STRD_YR_CD,
-                RentInfo.STRD_QTR_CD == latest_rent.STRD_QTR_CD,
-                RentInfo.LET_CURPRC_FLR_CLSF_CD_NM == "전체층"
-            ).all()
-            rent_data = [
-                {"행정동명": row.ADSTRD_CD_NM, "임대료": row.EXCHE_RENTCG_AVE or 0}
-                for row in rent_rows
+    def get_integrated_location_dataframe(self, target_age: str, industry_name: str) -> pd.DataFrame:
+        """입지추천을 위한 데이터 병합 수행(타겟연령, 업종 반영)"""
+        try:
+            dataset = self.get_location_dataset()
+            df_pop = dataset["population"]
+
+            # 1. 인구 정보 (타겟 연령 컬럼 선택)
+            target_columns = [
+                col for col in (
+                    f"{gender}_{target_age}_{suffix}"
+                    for suffix in self.POP_SUFFIXES
+                    for gender in ("female", "male")
+                )
+                if col in df_pop.columns
             ]
-            df_rent = pd.DataFrame(rent_data)
-
-            merged = df_pop.merge(df_facility, on="행정동명", how="left")
-            merged = merged.merge(df_sales, on="행정동명", how="left")
-            merged = merged.merge(df_storecat, on="행정동명", how="left")
-            merged = merged.merge(df_rent, on="행정동명", how="left")
-            merged['면적(㎢)'] = pd.to_numeric(merged['행정동명'].map(self.area_data))
-
+            total_pop = df_pop["유동인구"] + df_pop["직장인구"] + df_pop["거주인구"]
+            target_total = df_pop[target_columns].sum(axis=1)
+            target_ratio = (target_total / total_pop.where(total_pop != 0)).fillna(0)
+
+            merged = pd.DataFrame({
+                "행정동명": df_pop["행정동명"],
+                "타겟연령_비율": target_ratio,
+                "타겟연령_수": target_total,
+                "유동인구": df_pop["유동인구"],
+                "직장인구": df_pop["직장인구"],
+                "거주인구": df_pop["거주인구"]
+            })
+
+            # 2~5. 시설 / 매출 / 점포 수 / 임대료 (행정동 기준 컬럼 선택)
+            merged = merged.join(dataset["facility"], on="행정동명")
+            if industry_name in dataset["avg_sales"].columns:
+                merged["업종_평균_매출"] = merged["행정동명"].map(dataset["avg_sales"][industry_name])
+            else:
+                merged["업종_평균_매출"] = float("nan")
+            if industry_name in dataset["store_count"].columns:
+                merged["동일업종_수"] = merged["행정동명"].map(dataset["store_count"][industry_name])
+            else:
+                merged["동일업종_수"] = float("nan")
+            merged["임대료"] = merged["행정동명"].map(dataset["rent"])
+            merged['면적(㎢)'] = merged['행정동명'].map(dataset["area"])
 
             merged_unique = merged.groupby("행정동명").agg({
                 "타겟연령_비율": "mean",
@@ -206,60 +344,78 @@ class LocationRecomService:
             merged_unique.rename(columns={"접근성_합(면적당)": "접근성"}, inplace=True)
             merged_unique = merged_unique.drop(columns=["면적(㎢)", "유동인구", "직장인구", "거주인구", "동일업종_수", "집객시설", "접근성_합"], errors="ignore")
 
-            # print("======================")
-            # print("merged_unique")
-            # print(merged_unique["행정동명"].nunique())
-            # print("======================")
-
             return merged_unique.fillna(0)
         
         except Exception as e:
-            db.rollback()
             logger.error(f'데이터 병합 중 오류: {e}')
             raise HTTPException(status_code=401)
-        finally:
-            db.close()
-
-    def calculate_location_scores(self, df: pd.DataFrame, priority: List[str]) -> pd.DataFrame:
-        "입지추천을 위한 행정동별 점수 계산"
-
-        priority_weights = {col: 0.5 for col in ["타겟연령", "유동인구", "직장인구", "거주인구", "동일 업종 수", "업종 매출", "임대료", "집객시설 수", "접근성"]}
-        
-        for i, col in enumerate(priority):
-            priority_weights[col] = 2 - i*0.5  
 
-        scaler = MinMaxScaler()
-        score_components = pd.DataFrame()
+    # 점수 구성 요소 (우선순위 라벨 순서)
+    SCORE_LABELS = ["타겟연령", "유동인구", "직장인구", "거주인구", "동일 업종 수", "업종 매출", "임대료", "집객시설 수", "접근성"]
+
+    # (정규화 대상 컬럼, 점수 라벨)
+    SCORE_COLUMNS = [
+        ("유동인구(면적당)", "유동인구"),
+        ("직장인구(면적당)", "직장인구"),
+        ("거주인구(면적당)", "거주인구"),
+        ("동일업종_수(면적당)", "동일 업종 수"),
+        ("업종_평균_매출", "업종 매출"),
+        ("임대료", "임대료"),  
+        ("집객시설(면적당)", "집객시설 수"),
+        ("접근성", "접근성")
+    ]
+
+    # 추천 결과로 반환하는 컬럼
+    RESULT_COLUMNS = [
+        "행정동명", "타겟연령_비율", "타겟연령_수", "업종_평균_매출", "임대료",
+        "유동인구(면적당)", "직장인구(면적당)", "거주인구(면적당)",
+        "동일업종_수(면적당)", "집객시설(면적당)"
+    ]
+
+    def _min_max_scale(self, values: np.ndarray) -> np.ndarray:
+        """MinMaxScaler와 동일한 0~1 정규화 (최댓값=최솟값이면 0)"""
+        values = values.astype(float)
+        min_value, max_value = values.min(), values.max()
+        value_range = max_value - min_value
+        if value_range == 0:
+            return np.zeros_like(values)
+        return (values - min_value) / value_range
+
+    def get_score_components(self, df: pd.DataFrame) -> np.ndarray:
+        """행정동 x 점수 구성 요소 정규화 행렬 (열 순서 = SCORE_LABELS)"""
+        components = np.empty((len(df), len(self.SCORE_LABELS)))
 
         # 타겟연령 점수 계산 (비율과 수 모두 정규화 후 평균)
-        target_ratio_scaled = scaler.fit_transform(df[["타겟연령_비율"]]).flatten()  # 1D 배열로 변환
-        target_count_scaled = scaler.fit_transform(df[["타겟연령_수"]]).flatten()  # 1D 배열로 변환
-        score_components["타겟연령"] = (target_ratio_scaled + target_count_scaled) / 2
+        target_ratio_scaled = self._min_max_scale(df["타겟연령_비율"].to_numpy())
+        target_count_scaled = self._min_max_scale(df["타겟연령_수"].to_numpy())
+        components[:, 0] = (target_ratio_scaled + target_count_scaled) / 2
 
         # 나머지 지표 정규화
-        for col, label in [
-            ("유동인구(면적당)", "유동인구"),
-            ("직장인구(면적당)", "직장인구"),
-            ("거주인구(면적당)", "거주인구"),
-            ("동일업종_수(면적당)", "동일 업종 수"),
-            ("업종_평균_매출", "업종 매출"),
-            ("임대료", "임대료"),  
-            ("집객시설(면적당)", "집객시설 수"),
-            ("접근성", "접근성")
-        ]:
-            value = df[col].copy()
+        for col, label in self.SCORE_COLUMNS:
+            value = df[col].to_numpy()
             if label == "임대료":
                 value = -value  # 낮을수록 유리
-            score_components[label] = scaler.fit_transform(value.values.reshape(-1, 1))
+            components[:, self.SCORE_LABELS.index(label)] = self._min_max_scale(value)
+
+        return components
+
+    def get_priority_weights(self, priority: List[str]) -> np.ndarray:
+        """우선순위 리스트를 SCORE_LABELS 순서의 가중치 벡터로 변환"""
+        priority_weights = {col: 0.5 for col in self.SCORE_LABELS}
+        
+        for i, col in enumerate(priority):
+            priority_weights[col] = 2 - i*0.5  
+
+        return np.array([priority_weights[col] for col in self.SCORE_LABELS])
 
-        # 최종 점수 계산
-        score_components["최종점수"] = sum(
-            score_components[col] * weight for col, weight in priority_weights.items()
-        )
+    def calculate_location_scores(self, df: pd.DataFrame, priority: List[str]) -> pd.DataFrame:
+        "입지추천을 위한 행정동별 점수 계산"
+        components = self.get_score_components(df)
+        weights = self.get_priority_weights(priority)
 
         # 결과 생성
         result = df.copy()
-        result["점수"] = score_components["최종점수"] *(100/9) # 100점 만점
+        result["점수"] = components @ weights * (100/9) # 100점 만점
 
         return result
     
@@ -286,20 +442,12 @@ class LocationRecomService:
         preprocess = self.get_integrated_location_dataframe(target_age, industry_name)        
         result = self.calculate_location_scores(preprocess, priority)
 
-        avg_data = result[[
-            "타겟연령_비율", "타겟연령_수", "업종_평균_매출", "임대료",
-            "유동인구(면적당)", "직장인구(면적당)", "거주인구(면적당)",
-            "동일업종_수(면적당)", "집객시설(면적당)"
-        ]].mean().to_dict()
+        avg_data = result[self.RESULT_COLUMNS[1:]].mean().to_dict()
         avg_data = self.round_values(avg_data, 2)
 
         # 상위 N개 행정동 추출
         top_locations = result.sort_values("점수", ascending=False).head(top_n)
-        top_locations = top_locations[[
-            "행정동명", "타겟연령_비율", "타겟연령_수", "업종_평균_매출", "임대료",
-            "유동인구(면적당)", "직장인구(면적당)", "거주인구(면적당)",
-            "동일업종_수(면적당)", "집객시설(면적당)"
-        ]]
+        top_locations = top_locations[self.RESULT_COLUMNS]
         top_locations = top_locations.round(2)
 
         # 전체 정보 표기 + 등급 
@@ -315,6 +463,42 @@ class LocationRecomService:
             },
             "total": total.reset_index(drop=True).to_dict(orient="records")
         }
+
+    def recommend_locations_batch(self, profiles: List[dict], top_n: int = 3) -> List[dict]:
+        """여러 추천 프로필(타겟연령, 업종, 우선순위)을 한 번에 점수화하여 프로필별 상위 n개 행정동 반환
+
+        (타겟연령, 업종) 조합별로 정규화 행렬을 한 번만 만들고,
+        해당 조합의 모든 프로필 가중치를 행렬곱 한 번으로 계산한다.
+        """
+        results: List[dict] = [None] * len(profiles)
+
+        # (타겟연령, 업종) 조합별 프로필 인덱스 묶기
+        groups: Dict[tuple, List[int]] = {}
+        for idx, profile in enumerate(profiles):
+            groups.setdefault((profile["target_age"], profile["industry_name"]), []).append(idx)
+
+        for (target_age, industry_name), indices in groups.items():
+            df = self.get_integrated_location_dataframe(target_age, industry_name)
+            components = self.get_score_components(df)
+
+            # 행정동 x 프로필 점수 행렬
+            weights = np.stack([self.get_priority_weights(profiles[idx]["priority"]) for idx in indices], axis=1)
+            scores = components @ weights * (100/9)
+
+            avg_data = self.round_values(df[self.RESULT_COLUMNS[1:]].mean().to_dict(), 2)
+            values = df[self.RESULT_COLUMNS]
+
+            for col_idx, profile_idx in enumerate(indices):
+                top_index = np.argsort(-scores[:, col_idx], kind="stable")[:top_n]
+                top_locations = values.iloc[top_index].round(2)
+
+                results[profile_idx] = {
+                    "profile": profiles[profile_idx],
+                    "top_locations": top_locations.reset_index(drop=True).to_dict(orient="records"),
+                    "average_values": avg_data
+                }
+
+        return results
     
 
 # 서비스 인스턴스 생성
@@ -0,0 +1,160 @@
+# services/morphology_cache_service.py
+
+import os
+import logging
+import hashlib
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+from database.mongo_connector import mongo_instance
+
+logger = logging.getLogger(__name__)
+
+class MorphologyCacheService:
+    """리뷰 텍스트 형태소 분석 결과 캐시 (텍스트 해시 → Okt POS 태그)
+
+    - 1차: 프로세스 메모리 LRU
+    - 2차(선택): MongoDB MorphologyCache 컬렉션 - 워커/재시작 간 공유
+    명사 목록은 Okt.nouns와 동일하게 POS 태그 중 Noun만 골라 만든다.
+    ReviewService와 이를 사용하는 CompetitorService가 같은 인스턴스를 공유한다.
+    """
+
+    COLLECTION_NAME = "MorphologyCache"
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.max_size = int(os.getenv("MORPHOLOGY_CACHE_SIZE", 20000))
+        self.use_mongo = os.getenv("MORPHOLOGY_CACHE_MONGO", "true").lower() == "true"
+        # MongoDB 캐시 보관 기간(초) - created_at TTL 인덱스로 오래된 분석 결과 자동 삭제
+        self.mongo_ttl = int(os.getenv("MORPHOLOGY_CACHE_MONGO_TTL", 60 * 60 * 24 * 30))
+        self._index_ready = False
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, List[Tuple[str, str]]]" = OrderedDict()
+        self._pending: Dict[str, List[Tuple[str, str]]] = {}
+
+        self.hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+
+        logger.info("MorphologyCacheService 초기화 완료")
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def normalize(self, text: str) -> str:
+        """캐시 키로 쓰는 정규화 텍스트 (감성 분석/명사 추출이 같은 결과를 공유하도록 소문자 통일)"""
+        return (text or "").lower()
+
+    def _collection(self):
+        collection = mongo_instance.get_collection(self.COLLECTION_NAME)
+        if not self._index_ready:
+            try:
+                collection.create_index("created_at", expireAfterSeconds=self.mongo_ttl)
+            except Exception as e:
+                logger.warning(f"형태소 캐시 TTL 인덱스 생성 실패: {e}")
+            self._index_ready = True
+        return collection
+
+    def _remember(self, key: str, tags: List[Tuple[str, str]]):
+        """메모리 LRU에 저장 (가득 차면 가장 오래 사용하지 않은 항목 제거)"""
+        self._cache[key] = tags
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    # =====================
+    #  조회
+    # =====================
+
+    def get_pos(self, text: str, okt) -> List[Tuple[str, str]]:
+        """텍스트의 POS 태그 (캐시에 없으면 okt.pos로 분석 후 저장)"""
+        key = self._key(text)
+
+        with self._lock:
+            tags = self._cache.get(key)
+            if tags is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return tags
+            self.misses += 1
+
+        tags = [tuple(tag) for tag in okt.pos(text)]
+
+        with self._lock:
+            self._remember(key, tags)
+            if self.use_mongo:
+                self._pending[key] = tags
+        return tags
+
+    def get_nouns(self, text: str, okt) -> List[str]:
+        """텍스트의 명사 목록 (Okt.nouns와 동일)"""
+        return [word for word, pos in self.get_pos(text, okt) if pos == "Noun"]
+
+    # =====================
+    #  MongoDB 계층
+    # =====================
+
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """메모리에 없는 텍스트의 분석 결과를 MongoDB에서 한 번에 불러옴"""
+        if not self.use_mongo:
+            return
+
+        with self._lock:
+            keys = list({self._key(text) for text in texts if text} - self._cache.keys())
+        if not keys:
+            return
+
+        try:
+            docs = self._collection().find({"_id": {"$in": keys}}, {"pos": 1})
+            loaded = 0
+            with self._lock:
+                for doc in docs:
+                    self._remember(doc["_id"], [tuple(tag) for tag in doc.get("pos", [])])
+                    loaded += 1
+                self.mongo_hits += loaded
+            logger.info(f"형태소 캐시 MongoDB 조회 - {len(keys)}건 중 {loaded}건 적중")
+        except Exception as e:
+            logger.warning(f"형태소 캐시 MongoDB 조회 실패: {e}")
+
+    def flush(self) -> None:
+        """새로 분석한 결과를 MongoDB에 일괄 저장"""
+        if not self.use_mongo:
+            return
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            now = datetime.now()
+            operations = [
+                UpdateOne(
+                    {"_id": key},
+                    {"$setOnInsert": {"pos": [list(tag) for tag in tags], "created_at": now}},
+                    upsert=True
+                )
+                for key, tags in pending.items()
+            ]
+            self._collection().bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"형태소 캐시 MongoDB 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "mongo_hits": self.mongo_hits,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "entries": len(self._cache)
+            }
+
+morphology_cache_service = MorphologyCacheService()
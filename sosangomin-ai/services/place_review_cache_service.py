@@ -0,0 +1,125 @@
+# services/place_review_cache_service.py
+
+import os
+import re
+import logging
+import hashlib
+import asyncio
+import weakref
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from dotenv import load_dotenv
+from database.mongo_connector import mongo_instance
+
+logger = logging.getLogger(__name__)
+
+class PlaceReviewCacheService:
+    """네이버 플레이스(place_id)별 분석 완료 리뷰 저장소
+
+    - 리뷰마다 본문 지문(fingerprint)을 함께 저장해, 다시 크롤링할 때 이미 본 리뷰에
+      도달하면 더보기를 멈추고 새 리뷰만 감성 분석한다.
+    - 마지막 크롤링이 freshness 구간(PLACE_REVIEW_CACHE_TTL초) 안이면 크롤링 없이 저장된 결과를 사용한다.
+    - 여러 매장이 같은 경쟁사를 분석하는 경우가 많아 place_id 단위로 공유한다.
+    """
+
+    COLLECTION_NAME = "PlaceReviews"
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.ttl = int(os.getenv("PLACE_REVIEW_CACHE_TTL", 60 * 60 * 6))
+        self.max_reviews = int(os.getenv("PLACE_REVIEW_CACHE_MAX_REVIEWS", 300))
+
+        # 같은 place_id를 동시에 요청하면 한 번만 크롤링하도록 place_id별 잠금
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+        logger.info("PlaceReviewCacheService 초기화 완료")
+
+    def _collection(self):
+        return mongo_instance.get_collection(self.COLLECTION_NAME)
+
+    def fingerprint(self, text: str) -> str:
+        """리뷰 본문 지문 (공백 정규화 후 SHA-1)"""
+        normalized = re.sub(r'\s+', ' ', text or "").strip()
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def lock(self, place_id: str) -> asyncio.Lock:
+        """place_id별 잠금 (사용 중인 동안만 유지)"""
+        lock = self._locks.get(place_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[place_id] = lock
+        return lock
+
+    # =====================
+    #  조회
+    # =====================
+
+    def get(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 place_id 리뷰 문서"""
+        try:
+            return self._collection().find_one({"_id": str(place_id)})
+        except Exception as e:
+            logger.warning(f"place_id {place_id} 리뷰 캐시 조회 실패: {e}")
+            return None
+
+    def is_fresh(self, cached: Optional[Dict[str, Any]]) -> bool:
+        """마지막 크롤링이 freshness 구간 안인지"""
+        if not cached or not cached.get("last_crawled_at"):
+            return False
+        return (datetime.now() - cached["last_crawled_at"]).total_seconds() < self.ttl
+
+    def known_fingerprints(self, cached: Optional[Dict[str, Any]]) -> Set[str]:
+        """저장된 리뷰 지문 집합"""
+        if not cached:
+            return set()
+        return {review["fingerprint"] for review in cached.get("reviews", []) if review.get("fingerprint")}
+
+    # =====================
+    #  병합/저장
+    # =====================
+
+    def select_new(self, reviews: Iterable[Dict[str, Any]], known: Set[str]) -> List[Dict[str, Any]]:
+        """크롤링한 리뷰 중 처음 보는 리뷰만 (지문을 붙여 반환, 중복 제거)"""
+        new_reviews = []
+        seen = set(known)
+        for review in reviews:
+            fingerprint = self.fingerprint(review.get("text", ""))
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            new_reviews.append({**review, "fingerprint": fingerprint})
+        return new_reviews
+
+    def save(
+        self,
+        place_id: str,
+        new_reviews: List[Dict[str, Any]],
+        cached: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """새 리뷰를 기존 리뷰 앞에 붙여 저장 (최신순, 최대 max_reviews건) 후 전체 리뷰 반환"""
+        previous = cached.get("reviews", []) if cached else []
+        reviews = (new_reviews + previous)[:self.max_reviews]
+        now = datetime.now()
+
+        try:
+            self._collection().update_one(
+                {"_id": str(place_id)},
+                {
+                    "$set": {
+                        "reviews": reviews,
+                        "review_count": len(reviews),
+                        "last_crawled_at": now,
+                        "updated_at": now
+                    },
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            logger.info(f"place_id {place_id} 리뷰 캐시 저장 - 신규 {len(new_reviews)}건, 전체 {len(reviews)}건")
+        except Exception as e:
+            logger.warning(f"place_id {place_id} 리뷰 캐시 저장 실패: {e}")
+
+        return reviews
+
+place_review_cache_service = PlaceReviewCacheService()
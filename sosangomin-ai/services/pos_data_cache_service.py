@@ -0,0 +1,192 @@
+# services/pos_data_cache_service.py
+
+import os
+import logging
+import asyncio
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, Optional
+import pandas as pd
+from dotenv import load_dotenv
+from botocore.exceptions import ClientError
+from services.s3_service import s3_client, S3_BUCKET_NAME
+
+logger = logging.getLogger(__name__)
+
+class PosDataCacheService:
+    """전처리된 POS 데이터 캐시 (Parquet)
+
+    DataSources 문서별로 read_file + preprocess_data 결과를 한 번만 만들어
+    로컬 디스크와 S3(원본 파일 옆)에 Parquet으로 저장하고, 이후 분석에서는 그대로 읽는다.
+    키에 POS 유형과 전처리 버전을 포함하므로 전처리 로직이 바뀌면 버전만 올리면 된다.
+    로컬 사본은 S3 사본의 디스크 캐시일 뿐이라 용량(POS_CACHE_MAX_MB)을 넘으면 오래 안 쓴 파일부터 지운다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.cache_dir = os.getenv("POS_CACHE_DIR", os.path.join("temp_files", "pos_cache"))
+        self.use_s3 = os.getenv("POS_CACHE_S3", "true").lower() == "true"
+        self.max_bytes = float(os.getenv("POS_CACHE_MAX_MB", 2048)) * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        logger.info("PosDataCacheService 초기화 완료")
+
+    # =====================
+    #  캐시 키
+    # =====================
+
+    def _cache_name(self, source: Dict[str, Any], pos_type: str, version: int) -> str:
+        return f"{source['_id']}_{pos_type}_v{version}.parquet"
+
+    def _local_path(self, source: Dict[str, Any], pos_type: str, version: int) -> str:
+        return os.path.join(self.cache_dir, self._cache_name(source, pos_type, version))
+
+    def _s3_key(self, source: Dict[str, Any], pos_type: str, version: int) -> Optional[str]:
+        """원본 파일과 같은 경로에 저장 (예: store_1/uuid_file.xlsx.preprocessed/<source_id>_키움_v1.parquet)"""
+        file_path = source.get("file_path")
+        if not file_path:
+            return None
+        return f"{file_path}.preprocessed/{self._cache_name(source, pos_type, version)}"
+
+    # =====================
+    #  읽기/쓰기
+    # =====================
+
+    def _prepare_for_parquet(self, df: pd.DataFrame) -> pd.DataFrame:
+        """값 타입이 섞인 object 열은 문자열로 통일 (Parquet은 열마다 단일 타입만 허용)
+
+        바꿀 열이 없으면 원본을 그대로 반환하므로 여러 번 적용해도 비용이 거의 없다.
+        """
+        mixed_cols = [
+            col for col in df.columns[df.dtypes == object]
+            if pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+        ]
+        if not mixed_cols and all(isinstance(col, str) for col in df.columns):
+            return df
+
+        df = df.copy()
+        for col in mixed_cols:
+            df[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+        df.columns = [str(col) for col in df.columns]
+        return df
+
+    def _temp_path(self) -> str:
+        """쓰기마다 고유한 임시 파일 (같은 소스를 동시에 분석해도 서로의 파일을 덮어쓰지 않음)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        return tmp_path
+
+    def _remove_quietly(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """로컬 캐시가 용량을 넘으면 최근 사용 시각(mtime)이 오래된 Parquet부터 삭제 (S3 사본은 유지)"""
+        try:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith(".parquet"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._remove_quietly(path)
+                total -= size
+        except Exception as e:
+            logger.warning(f"전처리 캐시 정리 실패: {e}")
+
+    def load(self, source: Dict[str, Any], pos_type: str, version: int) -> Optional[pd.DataFrame]:
+        """캐시된 전처리 데이터 (로컬 → S3 순서, 없으면 None)"""
+        local_path = self._local_path(source, pos_type, version)
+
+        downloaded = False
+        if not os.path.exists(local_path) and self.use_s3:
+            s3_key = self._s3_key(source, pos_type, version)
+            if s3_key:
+                tmp_path = None
+                try:
+                    tmp_path = self._temp_path()
+                    s3_client.download_file(S3_BUCKET_NAME, s3_key, tmp_path)
+                    os.replace(tmp_path, local_path)
+                    downloaded = True
+                except ClientError:
+                    self._remove_quietly(tmp_path)
+                    return None
+                except Exception as e:
+                    logger.warning(f"전처리 캐시 S3 조회 실패 ({s3_key}): {e}")
+                    if tmp_path:
+                        self._remove_quietly(tmp_path)
+                    return None
+
+        if not os.path.exists(local_path):
+            return None
+
+        try:
+            df = pd.read_parquet(local_path)
+        except Exception as e:
+            logger.warning(f"전처리 캐시 읽기 실패, 삭제합니다 ({local_path}): {e}")
+            self._remove_quietly(local_path)
+            return None
+
+        # 최근 사용 시각 갱신 (용량 정리 순서 기준)
+        try:
+            os.utime(local_path)
+        except OSError:
+            pass
+        if downloaded:
+            self._evict()
+        return df
+
+    def save(self, source: Dict[str, Any], pos_type: str, version: int, df: pd.DataFrame) -> None:
+        """전처리 데이터를 로컬/S3에 저장 (실패해도 분석은 계속)"""
+        local_path = self._local_path(source, pos_type, version)
+
+        tmp_path = None
+        try:
+            tmp_path = self._temp_path()
+            self._prepare_for_parquet(df).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, local_path)
+        except Exception as e:
+            logger.warning(f"전처리 캐시 저장 실패 ({local_path}): {e}")
+            if tmp_path:
+                self._remove_quietly(tmp_path)
+            return
+
+        if self.use_s3:
+            s3_key = self._s3_key(source, pos_type, version)
+            if s3_key:
+                try:
+                    s3_client.upload_file(local_path, S3_BUCKET_NAME, s3_key)
+                except Exception as e:
+                    logger.warning(f"전처리 캐시 S3 업로드 실패 ({s3_key}): {e}")
+
+        self._evict()
+
+    async def get_or_create(
+        self,
+        source: Dict[str, Any],
+        pos_type: str,
+        version: int,
+        build: Callable[[], Awaitable[pd.DataFrame]]
+    ) -> pd.DataFrame:
+        """캐시가 있으면 읽고, 없으면 build()로 원본 다운로드/전처리 후 저장
+
+        처음 만든 경우에도 저장본과 같은 형태(_prepare_for_parquet 적용)로 반환해,
+        첫 분석과 캐시를 읽은 이후 분석이 같은 데이터를 보도록 한다.
+        """
+        df = await asyncio.to_thread(self.load, source, pos_type, version)
+        if df is not None:
+            logger.info(f"소스 {source['_id']} 전처리 캐시 사용: 행 수={df.shape[0]}, 열 수={df.shape[1]}")
+            return df
+
+        df = await build()
+        df = await asyncio.to_thread(self._prepare_for_parquet, df)
+        await asyncio.to_thread(self.save, source, pos_type, version, df)
+        return df
+
+pos_data_cache_service = PosDataCacheService()
@@ -9,6 +9,8 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 from db_models import Population 
+from services.aggregate_cache_service import aggregate_cache_service
+from services.ingestion_checkpoint_service import ingestion_checkpoint_service
 
 logger = logging.getLogger(__name__)
 
@@ -46,21 +48,28 @@ class ResidentPopulationService:
             # logger.info("상주인구 데이터 업데이트 시작")
 
             async with aiohttp.ClientSession() as session:
+                # 최신 분기가 이미 반영되어 있으면 수집 생략
+                pending_quarter = await ingestion_checkpoint_service.get_pending_quarter(
+                    session, self.resident_pop_service, self.resident_pop_api_key, self.resident_pop_service
+                )
+                if pending_quarter is None:
+                    return ingestion_checkpoint_service.SKIPPED
+
                 data = await self.fetch_population_data(session, start_index, end_index)
                 # logger.error(f"API 응답 데이터 예시: {data}")
 
                 if 'error' in data:
-                    return
+                    return ingestion_checkpoint_service.FAILED
                 
                 rows = data[self.resident_pop_service].get("row", [])
                 if not rows:
                     logger.warning("가져올 상주 인구 데이터가 없습니다.")
-                    return
+                    return ingestion_checkpoint_service.FAILED
                 
                 # 최신 분기만 필터링
-                # 모든 row의 STDR_YYQU_CD를 비교해서 가장 큰 값만 남김
-                latest_quarter = max(row.get("STDR_YYQU_CD") for row in rows if row.get("STDR_YYQU_CD"))
-                rows = [row for row in rows if row.get("STDR_YYQU_CD") == latest_quarter]
+                # 수집 여부를 판단한 분기(첫 페이지 최댓값)를 그대로 저장/완료 처리에 사용
+                latest_quarter = pending_quarter
+                rows = [row for row in rows if str(row.get("STDR_YYQU_CD")) == latest_quarter]
                 logger.info(f"{latest_quarter} 상주 인구 데이터 저장 중...")
 
                 
@@ -133,14 +142,16 @@ class ResidentPopulationService:
                     except Exception as e:
                         print(f"상주 인구 업데이트 실패: {e}")
 
+                aggregate_cache_service.bump_version(db, aggregate_cache_service.POPULATION)
                 db.commit()
                 logger.info(f"상주 인구 데이터 저장 완료")
-                return 
+                ingestion_checkpoint_service.mark_completed(self.resident_pop_service, latest_quarter)
+                return ingestion_checkpoint_service.UPDATED
 
         except Exception as e:
             db.rollback()
             logger.error(f"상주 인구 데이터 호출 및 저장 실패 : {e}")
-            return 
+            return ingestion_checkpoint_service.FAILED
         finally:
             db.close()
 
@@ -4,27 +4,26 @@ import asyncio
 from bs4 import BeautifulSoup
 import re
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 from database.mongo_connector import mongo_instance
+from services.sentiment_matcher import SentimentMatcher
+from services.morphology_cache_service import morphology_cache_service
+from services.place_review_cache_service import place_review_cache_service
+from services.llm_client import llm_client
 from bson import ObjectId
-import time
 from konlpy.tag import Okt  # type: ignore
 import pandas as pd  
 from collections import Counter  
 import concurrent.futures  
+import threading
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.service import Service
-import tempfile
-import shutil
-import uuid
+from services.webdriver_pool_service import webdriver_pool_service
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +45,24 @@ class ReviewService:
         }
         self.review_base_url = "https://map.naver.com/p/entry/place/{place_id}?c=15.00,0,0,0,dh&placePath=/review"
         
+        # 리뷰 크롤링 1건당 전체 시간 예산(초)
+        self.review_scrape_budget = float(os.getenv("REVIEW_SCRAPE_TIME_BUDGET", 40))
+        
         self.okt = Okt()
         
+        # 감성 분석 전용 스레드 풀 - 스레드마다 미리 생성해 둔 Okt 사용
+        # (Okt는 JVM 기반이라 프로세스 풀 대신 스레드 풀 사용, 형태소 분석 중에는 GIL이 해제됨)
+        self.analysis_workers = int(os.getenv("REVIEW_ANALYSIS_WORKERS", 4))
+        self._okt_local = threading.local()
+        self._analysis_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.analysis_workers,
+            thread_name_prefix="review-okt",
+            initializer=self._init_okt_worker
+        )
+        self._warm_up_workers()
+        
         self.sentiment_dict = self._load_sentiment_dict()
+        self.sentiment_matcher = SentimentMatcher(self.sentiment_dict)
         
         self.stopwords = self._load_stopwords()
     
@@ -123,188 +137,239 @@ class ReviewService:
         ]
         return stopwords
     
-    async def fetch_reviews_with_selenium(self, place_id: str) -> List[Dict[str, Any]]:
-        reviews = []
-        driver = None
+    # 리뷰 목록 선택자 (페이지 구조 변경에 대비해 여러 후보 사용)
+    REVIEW_SELECTORS = [
+        "div.pui__vn15t2", 
+        "div.place_review", 
+        "div.YeUwq",
+        "div.place_section_content",
+        "ul.PVzvR > li",  
+        "ul.WoYpd > li",  
+        "div.ZZ4OK > div",  
+        "li.xg2_q",       
+        "div._1kUrA",     
+        "div._3uEkn",     
+        "div.LHv0Z",      
+        "div.eCPGL",
+        "li.place_apply_pui",      
+        "div.EjjAW",                
+        "a[data-pui-click-code='rvshowmore']",
+        "#app-root > div > div > div > div:nth-child(6) > div:nth-child(3) > div.place_section.k1QQ5 > div.place_section_content",
+        "div.place_section.k1QQ5 > div.place_section_content"
+    ]
+    REVIEW_XPATH_SELECTORS = [
+        "//div[@class='place_section_content']",
+        "//*[@id='app-root']/div/div/div/div[6]/div[3]/div[contains(@class,'place_section')]/div[contains(@class,'place_section_content')]"
+    ]
+    MORE_BUTTON_SELECTORS = [
+        "a.fvwqf", 
+        "button.fvwqf", 
+        "a.place_reviewMore", 
+        "button.place_reviewMore",
+        "a[role='button']",
+        "button.moreBtn"
+    ]
+    
+    async def fetch_reviews_with_selenium(
+        self,
+        place_id: str,
+        known_fingerprints: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """리뷰 크롤링 (스크래핑 전용 실행기에서 실행, 시간 예산 초과 시 그때까지 로드된 리뷰 반환)
 
+        known_fingerprints: 이미 저장된 리뷰 지문 - 로드된 리뷰에 포함되면 더보기를 멈춘다.
+        """
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-            chrome_options.add_argument("--incognito")
-
-            webdriver_path = os.getenv('CHROME_WEBDRIVER_PATH', '/usr/local/bin/chromedriver')
-            logger.info(f"Using Chrome WebDriver at: {webdriver_path}")
-
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            review_url = self.review_base_url.format(place_id=place_id)
-            driver.get(review_url)
+            return await webdriver_pool_service.run_with_driver(
+                self._scrape_reviews, place_id, known_fingerprints,
+                time_budget=self.review_scrape_budget
+            )
+        except Exception as e:
+            logger.error(f"Selenium 리뷰 크롤링 중 오류: {e}")
+            return []
+    
+    def _scrape_reviews(
+        self,
+        driver,
+        deadline: Optional[float],
+        place_id: str,
+        known_fingerprints: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """리뷰 페이지 로드 → 더보기 반복 → 리뷰 파싱 (고정 sleep 없이 조건 대기)"""
+        time_left = webdriver_pool_service.time_left
+        
+        review_url = self.review_base_url.format(place_id=place_id)
+        webdriver_pool_service.load_page(driver, review_url, deadline)
+        
+        try:
+            WebDriverWait(driver, time_left(deadline, 15)).until(
+                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#entryIframe"))
+            )
+        except TimeoutException:
+            logger.info("iframe이 없거나 접근할 수 없습니다. 메인 페이지에서 계속합니다.")
+        
+        # 후보 선택자 중 하나라도 나타날 때까지 한 번만 대기
+        try:
+            WebDriverWait(driver, time_left(deadline, 15)).until(EC.any_of(*[
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                for selector in self.REVIEW_SELECTORS
+            ]))
+        except TimeoutException:
+            logger.error("리뷰 요소를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+            return []
+        
+        self._load_more_reviews(driver, deadline, known_fingerprints)
+        return self._parse_reviews(driver)
+    
+    def _count_review_elements(self, driver) -> int:
+        """현재 로드된 리뷰 후보 요소 수"""
+        for selector in self.REVIEW_SELECTORS:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                return len(elements)
+        return 0
+    
+    def _reached_known_reviews(self, driver, known_fingerprints: Set[str]) -> bool:
+        """현재 로드된 리뷰 중 이미 저장된 리뷰가 있는지 (리뷰는 최신순이라 이후는 모두 저장된 리뷰)"""
+        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        for selector in self.REVIEW_SELECTORS:
+            review_elements = soup.select(selector)
+            if review_elements:
+                return any(
+                    place_review_cache_service.fingerprint(element.get_text()) in known_fingerprints
+                    for element in review_elements
+                )
+        return False
+    
+    def _load_more_reviews(
+        self,
+        driver,
+        deadline: Optional[float],
+        known_fingerprints: Optional[Set[str]] = None,
+        max_clicks: int = 5
+    ):
+        """더보기 버튼 클릭 후 리뷰 수가 늘어날 때까지 대기 (예산 소진 또는 저장된 리뷰 도달 시 중단)"""
+        time_left = webdriver_pool_service.time_left
+        
+        for i in range(max_clicks):
+            if time_left(deadline, 1) <= 0:
+                logger.info("리뷰 크롤링 시간 예산 소진 - 현재까지 로드된 리뷰로 진행")
+                break
             
-            wait = WebDriverWait(driver, 15)
+            if known_fingerprints and self._reached_known_reviews(driver, known_fingerprints):
+                logger.info("이미 저장된 리뷰에 도달 - 추가 로드 중단")
+                break
             
             try:
-                iframe = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe#entryIframe")))
-                driver.switch_to.frame(iframe)
+                more_button = WebDriverWait(driver, time_left(deadline, 2)).until(EC.any_of(*[
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                    for selector in self.MORE_BUTTON_SELECTORS
+                ]))
             except TimeoutException:
-                logger.info("iframe이 없거나 접근할 수 없습니다. 메인 페이지에서 계속합니다.")
+                logger.info("더보기 버튼을 찾을 수 없습니다")
+                break
             
             try:
-                selectors = [
-                    "div.pui__vn15t2", 
-                    "div.place_review", 
-                    "div.YeUwq",
-                    "div.place_section_content",
-                    "ul.PVzvR > li",  
-                    "ul.WoYpd > li",  
-                    "div.ZZ4OK > div",  
-                    "li.xg2_q",       
-                    "div._1kUrA",     
-                    "div._3uEkn",     
-                    "div.LHv0Z",      
-                    "div.eCPGL",
-                    "li.place_apply_pui",      
-                    "div.EjjAW",                
-                    "a[data-pui-click-code='rvshowmore']",
-                    "#app-root > div > div > div > div:nth-child(6) > div:nth-child(3) > div.place_section.k1QQ5 > div.place_section_content",
-                    "div.place_section.k1QQ5 > div.place_section_content"
-                ]
-                xpath_selectors = [
-                    "//div[@class='place_section_content']",
-                    "//*[@id='app-root']/div/div/div/div[6]/div[3]/div[contains(@class,'place_section')]/div[contains(@class,'place_section_content')]"
-                ]
-                                
-                for selector in selectors:
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        break
-                    except TimeoutException:
-                        continue
+                before_count = self._count_review_elements(driver)
+                more_button.click()
+                logger.info(f"더보기 버튼 클릭 {i+1}회 성공")
                 
-                try:
-                    for i in range(5):
-                        try:
-                            more_button_selectors = [
-                                "a.fvwqf", 
-                                "button.fvwqf", 
-                                "a.place_reviewMore", 
-                                "button.place_reviewMore",
-                                "a[role='button']",
-                                "button.moreBtn"
-                            ]
-                            
-                            more_button = None
-                            for btn_selector in more_button_selectors:
-                                try:
-                                    more_button = WebDriverWait(driver, 2).until(
-                                        EC.element_to_be_clickable((By.CSS_SELECTOR, btn_selector))
-                                    )
-                                    break
-                                except:
-                                    continue
-                            
-                            if more_button:
-                                more_button.click()
-                                logger.info(f"더보기 버튼 클릭 {i+1}회 성공")
-                                time.sleep(2)
-                            else:
-                                logger.info("더보기 버튼을 찾을 수 없습니다")
-                                break
-                        except Exception as e:
-                            logger.info(f"더 이상 리뷰를 로드할 수 없습니다: {e}")
-                            break
-                except Exception as e:
-                    logger.info(f"추가 리뷰 로드 시도 중 오류: {e}")
-                
-                page_source = driver.page_source
-                
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                all_div_classes = set()
-                for div in soup.select('div[class]'):
-                    all_div_classes.update(div.get('class', []))
-                
-                for selector in selectors:
-                    review_elements = soup.select(selector)
-                    logger.info(f"{selector} 선택자로 {len(review_elements)}개 리뷰 찾음")
-                    
-                    if review_elements:
-                        for element in review_elements:
+                WebDriverWait(driver, time_left(deadline, 5)).until(
+                    lambda d: self._count_review_elements(d) > before_count
+                )
+            except TimeoutException:
+                logger.info("더 이상 리뷰를 로드할 수 없습니다")
+                break
+            except Exception as e:
+                logger.info(f"더 이상 리뷰를 로드할 수 없습니다: {e}")
+                break
+    
+    def _parse_reviews(self, driver) -> List[Dict[str, Any]]:
+        """현재 페이지 소스에서 리뷰 파싱"""
+        reviews = []
+        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        
+        for selector in self.REVIEW_SELECTORS:
+            review_elements = soup.select(selector)
+            logger.info(f"{selector} 선택자로 {len(review_elements)}개 리뷰 찾음")
+            
+            if review_elements:
+                for element in review_elements:
+                    try:
+                        review_text = element.get_text().strip()
+                        review_text = re.sub(r'\s+', ' ', review_text)
+                        
+                        rating = 0
+                        rating_pattern = r'평점\s*(\d+(\.\d+)?)'
+                        rating_match = re.search(rating_pattern, review_text)
+                        if rating_match:
                             try:
-                                review_text = element.get_text().strip()
-                                review_text = re.sub(r'\s+', ' ', review_text)
-                                
+                                rating = float(rating_match.group(1))
+                            except ValueError:
                                 rating = 0
-                                rating_pattern = r'평점\s*(\d+(\.\d+)?)'
-                                rating_match = re.search(rating_pattern, review_text)
-                                if rating_match:
-                                    try:
-                                        rating = float(rating_match.group(1))
-                                    except ValueError:
-                                        rating = 0
-                                
-                                date = "알 수 없음"
-                                date_pattern = r'(\d{4}-\d{2}-\d{2}|\d{4}\.\d{2}\.\d{2})'
-                                date_match = re.search(date_pattern, review_text)
-                                if date_match:
-                                    date = date_match.group(1)
-                                
-                                reviews.append({
-                                    "text": review_text,
-                                    "rating": rating,
-                                    "date": date,
-                                    "sentiment": None,
-                                    "keywords": []
-                                })
-                            except Exception as e:
-                                logger.warning(f"리뷰 파싱 중 오류: {e}")
-                                continue
                         
-                        break
-                    if not review_elements:
-                        for xpath in xpath_selectors:
-                            try:
-                                review_elements = driver.find_elements(By.XPATH, xpath)
-                                if review_elements:
-                                    logger.info(f"{xpath} XPath로 {len(review_elements)}개 리뷰 찾음")
-                                    break
-                            except:
-                                continue
-                
-                logger.info(f"성공적으로 {len(reviews)}개의 리뷰를 파싱했습니다.")
+                        date = "알 수 없음"
+                        date_pattern = r'(\d{4}-\d{2}-\d{2}|\d{4}\.\d{2}\.\d{2})'
+                        date_match = re.search(date_pattern, review_text)
+                        if date_match:
+                            date = date_match.group(1)
+                        
+                        reviews.append({
+                            "text": review_text,
+                            "rating": rating,
+                            "date": date,
+                            "sentiment": None,
+                            "keywords": []
+                        })
+                    except Exception as e:
+                        logger.warning(f"리뷰 파싱 중 오류: {e}")
+                        continue
                 
-            except TimeoutException:
-                logger.error("리뷰 요소를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
-            
-            return reviews
+                break
             
-        except Exception as e:
-            logger.error(f"Selenium 리뷰 크롤링 중 오류: {e}")
-            return []
-
-        finally:
-            if driver:
-                driver.quit()
-                logger.info("WebDriver 종료됨")
+            for xpath in self.REVIEW_XPATH_SELECTORS:
+                try:
+                    xpath_elements = driver.find_elements(By.XPATH, xpath)
+                    if xpath_elements:
+                        logger.info(f"{xpath} XPath로 {len(xpath_elements)}개 리뷰 찾음")
+                        break
+                except Exception:
+                    continue
+        
+        logger.info(f"성공적으로 {len(reviews)}개의 리뷰를 파싱했습니다.")
+        return reviews
     
+    def _init_okt_worker(self):
+        """분석 스레드 초기화 - 스레드 전용 Okt 생성 후 첫 호출 지연을 미리 소모"""
+        okt = Okt()
+        okt.pos("리뷰 분석 준비")
+        self._okt_local.okt = okt
+
+    def _warm_up_workers(self):
+        """서비스 생성 시 분석 스레드를 미리 띄워 Okt 초기화"""
+        for _ in range(self.analysis_workers):
+            self._analysis_executor.submit(lambda: None)
+
+    def _get_okt(self) -> Okt:
+        """현재 스레드의 Okt (분석 스레드가 아니면 공용 인스턴스)"""
+        return getattr(self._okt_local, "okt", None) or self.okt
+
     def _analyze_single_review(self, review: Dict[str, Any]) -> Dict[str, Any]:
         """KoNLPy를 활용한 단일 리뷰 분석"""
-        text = review["text"].lower()
+        text = morphology_cache_service.normalize(review["text"])
         
-        morphs = self.okt.pos(text)
+        morphs = morphology_cache_service.get_pos(text, self._get_okt())
         
         sentiment_score = 0
         matched_words = []
         
         for word, pos in morphs:
             if pos in ['Adjective', 'Verb', 'Noun']:
-                for sentiment_word, score in self.sentiment_dict.items():
-                    if sentiment_word in word:
-                        sentiment_score += score
-                        matched_words.append(word)
+                # 형태소에 포함된 감성 사전 단어를 한 번에 매칭
+                score, match_count = self.sentiment_matcher.match(word)
+                if match_count:
+                    sentiment_score += score
+                    matched_words.append(word)
         
         sentiment = "neutral"
         if sentiment_score > 1:
@@ -312,17 +377,16 @@ class ReviewService:
         elif sentiment_score < -0.5:
             sentiment = "negative"
         
-        keywords = []
-        for word, pos in morphs:
-            if pos == 'Noun' and len(word) > 1 and word not in self.stopwords:
-                keywords.append(word)
+        # 명사 목록은 집계(워드 클라우드/카테고리)에서 재사용하도록 리뷰에 함께 저장
+        nouns = [word for word, pos in morphs if pos == 'Noun' and len(word) > 1 and word not in self.stopwords]
         
-        keywords = list(dict.fromkeys(keywords))[:5]
+        keywords = list(dict.fromkeys(nouns))[:5]
         
         review_copy = review.copy()
         review_copy["sentiment"] = sentiment
         review_copy["sentiment_score"] = sentiment_score
         review_copy["keywords"] = keywords
+        review_copy["nouns"] = nouns
         review_copy["matched_sentiment_words"] = list(set(matched_words))
         
         return review_copy
@@ -332,108 +396,142 @@ class ReviewService:
         return [self._analyze_single_review(review) for review in batch]
     
     async def analyze_sentiment(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """KoNLPy를 활용한 감성 분석 (병렬 처리)"""
+        """KoNLPy를 활용한 감성 분석 (분석 스레드 풀에서 배치 병렬 처리, 이벤트 루프는 블로킹하지 않음)"""
         if not reviews:
             return []
         
-        def process_reviews_batch(batch):
-            return [self._analyze_single_review(review) for review in batch]
+        # 이전에 분석한 텍스트의 형태소 결과를 MongoDB 캐시에서 미리 로드
+        texts = [review["text"] for review in reviews]
+        await asyncio.to_thread(morphology_cache_service.prefetch, [morphology_cache_service.normalize(text) for text in texts])
         
         batch_size = 10
         review_batches = [reviews[i:i + batch_size] for i in range(0, len(reviews), batch_size)]
         
+        loop = asyncio.get_running_loop()
+        batch_results = await asyncio.gather(*(
+            loop.run_in_executor(self._analysis_executor, self._process_reviews_batch, batch)
+            for batch in review_batches
+        ))
+        
         analyzed_reviews = []
-        for batch in review_batches:
-            analyzed_reviews.extend(self._process_reviews_batch(batch))
+        for batch_result in batch_results:
+            analyzed_reviews.extend(batch_result)
         
+        await asyncio.to_thread(morphology_cache_service.flush)
         return analyzed_reviews
     
-    async def generate_word_cloud_data(self, reviews: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
-        """KoNLPy를 활용한, 개선된 워드 클라우드 데이터 생성"""
-        positive_reviews = [r for r in reviews if r.get("sentiment") == "positive"]
-        negative_reviews = [r for r in reviews if r.get("sentiment") == "negative"]
-        
-        positive_nouns = []
-        for review in positive_reviews:
-            text = review.get("text", "")
-            try:
-                nouns = self.okt.nouns(text)
-                filtered_nouns = [noun for noun in nouns if len(noun) > 1 and noun not in self.stopwords]
-                positive_nouns.extend(filtered_nouns)
-            except Exception as e:
-                logger.warning(f"긍정 리뷰 단어 추출 오류: {e}")
+    # 카테고리별 인사이트 판별 키워드
+    CATEGORY_KEYWORDS = {
+        "음식": ["맛", "맛있", "메뉴", "요리", "음식", "식사", "식감", "간", "양념", "소스", "밥", "반찬"],
+        "서비스": ["서비스", "직원", "종업원", "사장", "알바", "태도", "친절", "응대", "접객", "예약", "대기"],
+        "가격": ["가격", "값", "비싸", "저렴", "가성비", "원", "만원", "천원", "비용", "지불", "계산"],
+        "분위기": ["분위기", "인테리어", "공간", "자리", "테이블", "좌석", "인테리어", "조명", "음악", "시설", "화장실"],
+        "위생": ["위생", "청결", "깨끗", "더러", "먼지", "냄새", "악취", "찝찝", "깔끔"]
+    }
+    
+    def _extract_review_nouns(self, text: str) -> List[str]:
+        """리뷰 텍스트의 명사 (두 글자 이상, 불용어 제외) - 감성 분석과 같은 정규화 키로 형태소 캐시 사용"""
+        try:
+            nouns = morphology_cache_service.get_nouns(morphology_cache_service.normalize(text), self._get_okt())
+        except Exception as e:
+            logger.warning(f"리뷰 단어 추출 오류: {e}")
+            return []
+        return [noun for noun in nouns if len(noun) > 1 and noun not in self.stopwords]
+    
+    def build_review_analytics(self, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """감성 분석된 리뷰를 한 번 순회하며 통계, 워드 클라우드, 카테고리, 키워드를 함께 집계"""
+        sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
+        rating_sum = 0
+        word_counters = {"positive": Counter(), "negative": Counter()}
+        keyword_counters = {"all": Counter(), "positive": Counter(), "negative": Counter()}
+        category_counts = {cat: {"positive": 0, "negative": 0} for cat in self.CATEGORY_KEYWORDS}
+        category_keywords = {cat: Counter() for cat in self.CATEGORY_KEYWORDS}
+        matched_categories_all = set()
         
-        negative_nouns = []
-        for review in negative_reviews:
+        for review in reviews:
             text = review.get("text", "")
-            try:
-                nouns = self.okt.nouns(text)
-                filtered_nouns = [noun for noun in nouns if len(noun) > 1 and noun not in self.stopwords]
-                negative_nouns.extend(filtered_nouns)
-            except Exception as e:
-                logger.warning(f"부정 리뷰 단어 추출 오류: {e}")
-        
-        positive_counter = Counter(positive_nouns)
-        negative_counter = Counter(negative_nouns)
+            sentiment = review.get("sentiment")
+            keywords = review.get("keywords", [])
+            
+            if sentiment in sentiment_counts:
+                sentiment_counts[sentiment] += 1
+            rating_sum += review.get("rating", 0)
+            keyword_counters["all"].update(keywords)
+            
+            matched_categories = [
+                category for category, category_words in self.CATEGORY_KEYWORDS.items()
+                if any(keyword in text for keyword in category_words)
+            ]
+            
+            # 감성 분석 때 만든 명사 재사용 (nouns가 없는 이전 분석 리뷰만 다시 추출)
+            nouns = review.get("nouns")
+            if nouns is None:
+                nouns = self._extract_review_nouns(text) if sentiment in word_counters or matched_categories else []
+            
+            if sentiment in word_counters:
+                word_counters[sentiment].update(nouns)
+                keyword_counters[sentiment].update(keywords)
+            
+            for category in matched_categories:
+                matched_categories_all.add(category)
+                if sentiment in category_counts[category]:
+                    category_counts[category][sentiment] += 1
+                category_keywords[category].update(nouns)
         
-        positive_words = dict(positive_counter.most_common(50))
-        negative_words = dict(negative_counter.most_common(50))
+        category_insights = {
+            category: {
+                "positive": category_counts[category]["positive"],
+                "negative": category_counts[category]["negative"],
+                "keywords": dict(category_keywords[category].most_common(10)) if category in matched_categories_all else []
+            }
+            for category in self.CATEGORY_KEYWORDS
+        }
         
+        total_reviews = len(reviews)
         return {
-            "positive_words": positive_words,
-            "negative_words": negative_words
+            "review_count": total_reviews,
+            "average_rating": round(rating_sum / total_reviews, 1) if total_reviews > 0 else 0,
+            "sentiment_distribution": sentiment_counts,
+            "word_cloud_data": {
+                "positive_words": dict(word_counters["positive"].most_common(50)),
+                "negative_words": dict(word_counters["negative"].most_common(50))
+            },
+            "category_insights": category_insights,
+            "top_keywords": dict(keyword_counters["all"].most_common(10)),
+            "top_positive_keywords": keyword_counters["positive"].most_common(5),
+            "top_negative_keywords": keyword_counters["negative"].most_common(5)
         }
     
+    async def summarize_reviews(self, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """리뷰 집계 (분석 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        analytics = await loop.run_in_executor(self._analysis_executor, self.build_review_analytics, reviews)
+        await asyncio.to_thread(morphology_cache_service.flush)
+        return analytics
+    
+    async def generate_word_cloud_data(self, reviews: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+        """KoNLPy를 활용한, 개선된 워드 클라우드 데이터 생성"""
+        analytics = await self.summarize_reviews(reviews)
+        return analytics["word_cloud_data"]
+    
     async def generate_category_insights(self, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
         """리뷰에서 카테고리별 인사이트 생성"""
-        categories = {
-            "음식": ["맛", "맛있", "메뉴", "요리", "음식", "식사", "식감", "간", "양념", "소스", "밥", "반찬"],
-            "서비스": ["서비스", "직원", "종업원", "사장", "알바", "태도", "친절", "응대", "접객", "예약", "대기"],
-            "가격": ["가격", "값", "비싸", "저렴", "가성비", "원", "만원", "천원", "비용", "지불", "계산"],
-            "분위기": ["분위기", "인테리어", "공간", "자리", "테이블", "좌석", "인테리어", "조명", "음악", "시설", "화장실"],
-            "위생": ["위생", "청결", "깨끗", "더러", "먼지", "냄새", "악취", "찝찝", "깔끔"]
-        }
-        
-        category_data = {cat: {"positive": 0, "negative": 0, "keywords": []} for cat in categories.keys()}
-        
-        for review in reviews:
-            text = review.get("text", "")
-            sentiment = review.get("sentiment", "neutral")
-            
-            for category, keywords in categories.items():
-                matched = False
-                for keyword in keywords:
-                    if keyword in text:
-                        matched = True
-                        if sentiment == "positive":
-                            category_data[category]["positive"] += 1
-                        elif sentiment == "negative":
-                            category_data[category]["negative"] += 1
-                        
-                        try:
-                            nouns = self.okt.nouns(text)
-                            for noun in nouns:
-                                if len(noun) > 1 and noun not in self.stopwords:
-                                    category_data[category]["keywords"].append(noun)
-                        except:
-                            pass
-                            
-                        break
-                
-                if matched:
-                    counter = Counter(category_data[category]["keywords"])
-                    category_data[category]["keywords"] = dict(counter.most_common(10))
-        
-        return category_data
+        analytics = await self.summarize_reviews(reviews)
+        return analytics["category_insights"]
     
-    async def generate_insights_locally(self, reviews: List[Dict[str, Any]], category_insights: Dict[str, Any]) -> str:
+    async def generate_insights_locally(
+        self,
+        reviews: List[Dict[str, Any]],
+        category_insights: Dict[str, Any],
+        analytics: Optional[Dict[str, Any]] = None
+    ) -> str:
         """외부 API 의존성 없이 자체적으로 리뷰 인사이트 생성"""
         try:
             if not reviews:
                 return "리뷰 데이터가 없어 인사이트를 생성할 수 없습니다."
             
-            positive_reviews = [r for r in reviews if r.get("sentiment") == "positive"]
-            negative_reviews = [r for r in reviews if r.get("sentiment") == "negative"]
+            if analytics is None:
+                analytics = await self.summarize_reviews(reviews)
             
             strengths = []
             weaknesses = []
@@ -467,18 +565,8 @@ class ReviewService:
             elif category_insights['위생']['negative'] > 0:
                 weaknesses.append("위생과 청결에 대한 개선이 필요합니다.")
             
-            positive_keywords = {}
-            for review in positive_reviews:
-                for keyword in review.get("keywords", []):
-                    positive_keywords[keyword] = positive_keywords.get(keyword, 0) + 1
-            
-            negative_keywords = {}
-            for review in negative_reviews:
-                for keyword in review.get("keywords", []):
-                    negative_keywords[keyword] = negative_keywords.get(keyword, 0) + 1
-            
-            top_positive = sorted(positive_keywords.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_negative = sorted(negative_keywords.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_positive = analytics["top_positive_keywords"]
+            top_negative = analytics["top_negative_keywords"]
             
             if top_positive:
                 strengths.append(f"고객들이 자주 언급한 긍정적 키워드: {', '.join([k for k, v in top_positive])}")
@@ -537,61 +625,42 @@ class ReviewService:
     async def call_claude_api(self, prompt: str) -> str:
         """Claude API를 직접 호출하여 인사이트 생성"""
         try:
-            import aiohttp
-            import os
-            
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-            if not api_key:
+            if not llm_client.is_configured:
                 logger.warning("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
                 return None
-                
-            url = "https://api.anthropic.com/v1/messages"
-            headers = {
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
             
-            data = {
-                "model": "claude-3-7-sonnet-20250219",
-                "max_tokens": 4000,
-                "messages": [
+            return await llm_client.create_message(
+                model="claude-3-7-sonnet-20250219",
+                max_tokens=4000,
+                messages=[
                     {"role": "user", "content": prompt}
                 ]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=data) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Claude API 오류: {response.status}, {error_text}")
-                        return None
-                        
-                    response_json = await response.json()
-                    return response_json["content"][0]["text"]
+            )
                     
         except Exception as e:
             logger.error(f"Claude API 호출 중 오류: {e}")
             return None
             
-    async def generate_insights(self, reviews: List[Dict[str, Any]], place_id: str) -> str:
+    async def generate_insights(
+        self,
+        reviews: List[Dict[str, Any]],
+        place_id: str,
+        analytics: Optional[Dict[str, Any]] = None
+    ) -> str:
         """리뷰 인사이트 생성 (Claude API와 로컬 분석 둘 다 사용)"""
         try:
-            category_insights = await self.generate_category_insights(reviews)
+            if analytics is None:
+                analytics = await self.summarize_reviews(reviews)
+            category_insights = analytics["category_insights"]
             
-            positive_count = sum(1 for r in reviews if r.get("sentiment") == "positive")
-            negative_count = sum(1 for r in reviews if r.get("sentiment") == "negative")
-            neutral_count = sum(1 for r in reviews if r.get("sentiment") == "neutral")
+            positive_count = analytics["sentiment_distribution"]["positive"]
+            negative_count = analytics["sentiment_distribution"]["negative"]
             
-            total_reviews = len(reviews)
+            total_reviews = analytics["review_count"]
             positive_ratio = positive_count / total_reviews * 100 if total_reviews > 0 else 0
             negative_ratio = negative_count / total_reviews * 100 if total_reviews > 0 else 0
             
-            all_keywords = []
-            for review in reviews:
-                all_keywords.extend(review.get("keywords", []))
-            
-            top_keywords = dict(Counter(all_keywords).most_common(10))
+            top_keywords = analytics["top_keywords"]
             
             review_texts = [f"[리뷰] {r['text']} (감성: {r['sentiment']})" 
                            for r in reviews[:20]]  
@@ -631,12 +700,47 @@ class ReviewService:
                 return claude_response
             
             logger.info("Claude API 호출 실패, 로컬 인사이트 생성으로 대체")
-            return await self.generate_insights_locally(reviews, category_insights)
+            return await self.generate_insights_locally(reviews, category_insights, analytics)
             
         except Exception as e:
             logger.error(f"인사이트 생성 중 오류: {e}")
             return "리뷰를 분석한 결과, 이 매장의 강점과 개선점이 있습니다. 상세 분석은 현재 제공할 수 없습니다."
     
+    async def get_analyzed_reviews(self, place_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """place_id의 감성 분석된 리뷰 (place_id별 리뷰 캐시 사용)
+        
+        - 마지막 크롤링이 freshness 구간 안이면 저장된 리뷰를 그대로 반환
+        - 아니면 저장된 리뷰에 도달할 때까지만 크롤링하고 새 리뷰만 분석해 병합
+        - 크롤링에 실패하면 저장된 리뷰(있다면)를 반환
+        
+        Returns:
+            {"reviews": 최신순 리뷰, "is_cached": 크롤링 생략 여부, "new_count": 새로 분석한 리뷰 수}
+        """
+        async with place_review_cache_service.lock(place_id):
+            cached = await asyncio.to_thread(place_review_cache_service.get, place_id)
+            
+            if not force_refresh and place_review_cache_service.is_fresh(cached):
+                logger.info(f"place_id {place_id} 리뷰 캐시 사용 ({cached.get('review_count', 0)}건)")
+                return {"reviews": cached.get("reviews", []), "is_cached": True, "new_count": 0}
+            
+            known = place_review_cache_service.known_fingerprints(cached)
+            reviews = await self.fetch_reviews_with_selenium(place_id, known)
+            
+            if not reviews:
+                cached_reviews = cached.get("reviews", []) if cached else []
+                if cached_reviews:
+                    logger.warning(f"place_id {place_id} 리뷰 크롤링 실패 - 저장된 리뷰 {len(cached_reviews)}건 사용")
+                return {"reviews": cached_reviews, "is_cached": bool(cached_reviews), "new_count": 0}
+            
+            new_reviews = place_review_cache_service.select_new(reviews, known)
+            analyzed_new_reviews = await self.analyze_sentiment(new_reviews)
+            
+            merged_reviews = await asyncio.to_thread(
+                place_review_cache_service.save, place_id, analyzed_new_reviews, cached
+            )
+            logger.info(f"place_id {place_id} 리뷰 {len(reviews)}건 크롤링, 신규 {len(analyzed_new_reviews)}건 분석")
+            return {"reviews": merged_reviews, "is_cached": False, "new_count": len(analyzed_new_reviews)}
+    
     async def analyze_store_reviews(self, store_id: int, place_id: str) -> Dict[str, Any]:
         try:
             reviews_collection = mongo_instance.get_collection("StoreReviews")
@@ -656,33 +760,27 @@ class ReviewService:
                         "is_cached": True
                     }
             
-            reviews = await self.fetch_reviews_with_selenium(place_id)
+            # place_id별 리뷰 캐시 - 새 리뷰만 크롤링/분석
+            review_result = await self.get_analyzed_reviews(place_id)
+            analyzed_reviews = review_result["reviews"]
             
-            if not reviews:
+            if not analyzed_reviews:
                 return {"status": "error", "message": "리뷰를 가져올 수 없습니다. 매장 ID를 확인하거나 나중에 다시 시도해 주세요."}
             
-            analyzed_reviews = await self.analyze_sentiment(reviews)
-            word_cloud_data = await self.generate_word_cloud_data(analyzed_reviews)
-            category_insights = await self.generate_category_insights(analyzed_reviews)
-            insights = await self.generate_insights(analyzed_reviews, place_id)
-            
-            total_reviews = len(analyzed_reviews)
-            avg_rating = sum(r.get("rating", 0) for r in analyzed_reviews) / total_reviews if total_reviews > 0 else 0
-            sentiment_counts = {
-                "positive": sum(1 for r in analyzed_reviews if r.get("sentiment") == "positive"),
-                "neutral": sum(1 for r in analyzed_reviews if r.get("sentiment") == "neutral"),
-                "negative": sum(1 for r in analyzed_reviews if r.get("sentiment") == "negative")
-            }
+            # 통계/워드 클라우드/카테고리/키워드를 한 번에 집계
+            analytics = await self.summarize_reviews(analyzed_reviews)
+            insights = await self.generate_insights(analyzed_reviews, place_id, analytics)
+            
             api_key = os.getenv("ANTHROPIC_API_KEY")
             result = {
                 "store_id": store_id,
                 "place_id": place_id,
                 "reviews": analyzed_reviews,
-                "review_count": total_reviews,
-                "average_rating": round(avg_rating, 1),
-                "sentiment_distribution": sentiment_counts,
-                "word_cloud_data": word_cloud_data,
-                "category_insights": category_insights,
+                "review_count": analytics["review_count"],
+                "average_rating": analytics["average_rating"],
+                "sentiment_distribution": analytics["sentiment_distribution"],
+                "word_cloud_data": analytics["word_cloud_data"],
+                "category_insights": analytics["category_insights"],
                 "insights": insights,
                 "insights_source": "claude_api" if api_key else "local_analysis",
                 "last_crawled_at": datetime.now(),
@@ -8,11 +8,13 @@ import aiohttp
 from datetime import datetime
 from dotenv import load_dotenv
 from db_models import SalesData  
+from services.aggregate_cache_service import aggregate_cache_service
+from services.seoul_openapi_client import seoul_openapi_client
+from services.ingestion_checkpoint_service import ingestion_checkpoint_service
 import json
 import pandas as pd
-from pandas import Series
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert, tuple_
 from typing import Optional, Dict, List, Any
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -35,6 +37,13 @@ class SalesService:
         with open(os.path.join(json_dir, "industry_to_main_category.json"), "r", encoding="utf-8") as f:
             self.industry_to_main_category = json.load(f)
 
+        # 업종명 → 대분류 역매핑
+        self.industry_to_main = {
+            name: main_cat
+            for main_cat, names in self.industry_to_main_category.items()
+            for name in names
+        }
+
         if not self.sales_api_key:
             logger.error("매출 인증키가 없습니다. 환경 변수를 확인하세요.")
 
@@ -45,32 +54,25 @@ class SalesService:
                 return main_cat
         return "기타"
     
-    def safe_get(self, row: Series, key: str) -> int:
+    def get_stored_quarter(self) -> Optional[str]:
+        """DB에 저장된 매출 데이터의 최신 분기 (STDR_YYQU_CD 형식)"""
+        from database.connector import database_instance as mariadb
+        db = mariadb.pre_session()
         try:
-            return int(row.get(key) or 0)
-        except (ValueError, TypeError):
-            return 0
-    
-    async def fetch_sales_data(self, session) -> dict:
-        """상권 매출 데이터 API 호출"""
+            latest = aggregate_cache_service.get_latest_quarter(db, SalesData)
+            return f"{latest[0]}{latest[1]}" if latest else None
+        finally:
+            db.close()
+
+    async def fetch_sales_data(self, session, quarter: Optional[str] = None) -> dict:
+        """상권 매출 데이터 API 호출 (quarter를 주면 체크포인트에서 이어서 수집)"""
         try:
-            all_data = []
-            start = 1
-            limit = 1000 
-            while True:
-                end = start + limit - 1
-                url = f"{self.base_url}/{self.sales_api_key}/json/{self.sales_service_name}/{start}/{end}/"
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    rows = data[self.sales_service_name].get("row", [])
-                    if not rows:
-                        break
-                    all_data.extend(rows)
-                    if len(rows) < limit:
-                        break
-                    start += limit
-                    await asyncio.sleep(0.2)
+            if quarter:
+                all_data = await ingestion_checkpoint_service.fetch_rows(
+                    session, self.sales_service_name, self.sales_api_key, self.sales_service_name, quarter
+                )
+            else:
+                all_data = await seoul_openapi_client.fetch_rows(session, self.sales_api_key, self.sales_service_name)
             df = pd.DataFrame(all_data)
             if df.empty:
                 return pd.DataFrame()
@@ -83,7 +85,7 @@ class SalesService:
             df["region_name"] = df["region_name"].replace({"일원2동": "개포3동"}) # 일원2동 → 개포3동
             df["district_name"] = df["region_name"].map(self.dong_to_district)
             df["industry_name"] = df["SVC_INDUTY_CD_NM"]
-            df["main_category"] = df["industry_name"].apply(self.get_main_category)
+            df["main_category"] = df["industry_name"].map(self.industry_to_main).fillna("기타")
             df["sales_amount"] = pd.to_numeric(df["THSMON_SELNG_AMT"], errors="coerce").fillna(0)
             df["sales_count"] = pd.to_numeric(df["THSMON_SELNG_CO"], errors="coerce").fillna(0)
 
@@ -97,126 +99,152 @@ class SalesService:
             logger.error(f"상권 매출 API 오류: {e}")
             return pd.DataFrame()
         
-    async def update_sales_data(self):
-        """상권 분석 : 매출 데이터 수집 및 DB 저장"""
+    # SalesData 컬럼 → API 필드
+    SALES_COLUMN_MAP = {
+        "weekday_sales_amount": "MDWK_SELNG_AMT",
+        "weekend_sales_amount": "WKEND_SELNG_AMT",
+        "mon_sales_amount": "MON_SELNG_AMT",
+        "tues_sales_amount": "TUES_SELNG_AMT",
+        "wed_sales_amount": "WED_SELNG_AMT",
+        "thur_sales_amount": "THUR_SELNG_AMT",
+        "fri_sales_amount": "FRI_SELNG_AMT",
+        "sat_sales_amount": "SAT_SELNG_AMT",
+        "sun_sales_amount": "SUN_SELNG_AMT",
+
+        "time_00_06_sales_amount": "TMZON_00_06_SELNG_AMT",
+        "time_06_11_sales_amount": "TMZON_06_11_SELNG_AMT",
+        "time_11_14_sales_amount": "TMZON_11_14_SELNG_AMT",
+        "time_14_17_sales_amount": "TMZON_14_17_SELNG_AMT",
+        "time_17_21_sales_amount": "TMZON_17_21_SELNG_AMT",
+        "time_21_24_sales_amount": "TMZON_21_24_SELNG_AMT",
+
+        "male_sales_amount": "ML_SELNG_AMT",
+        "female_sales_amount": "FML_SELNG_AMT",
+        "age_10_sales_amount": "AGRDE_10_SELNG_AMT",
+        "age_20_sales_amount": "AGRDE_20_SELNG_AMT",
+        "age_30_sales_amount": "AGRDE_30_SELNG_AMT",
+        "age_40_sales_amount": "AGRDE_40_SELNG_AMT",
+        "age_50_sales_amount": "AGRDE_50_SELNG_AMT",
+        "age_60_sales_amount": "AGRDE_60_ABOVE_SELNG_AMT",
+
+        "weekday_sales_count": "MDWK_SELNG_CO",
+        "weekend_sales_count": "WKEND_SELNG_CO",
+        "mon_sales_count": "MON_SELNG_CO",
+        "tues_sales_count": "TUES_SELNG_CO",
+        "wed_sales_count": "WED_SELNG_CO",
+        "thur_sales_count": "THUR_SELNG_CO",
+        "fri_sales_count": "FRI_SELNG_CO",
+        "sat_sales_count": "SAT_SELNG_CO",
+        "sun_sales_count": "SUN_SELNG_CO",
+
+        "time_00_06_sales_count": "TMZON_00_06_SELNG_CO",
+        "time_06_11_sales_count": "TMZON_06_11_SELNG_CO",
+        "time_11_14_sales_count": "TMZON_11_14_SELNG_CO",
+        "time_14_17_sales_count": "TMZON_14_17_SELNG_CO",
+        "time_17_21_sales_count": "TMZON_17_21_SELNG_CO",
+        "time_21_24_sales_count": "TMZON_21_24_SELNG_CO",
+
+        "male_sales_count": "ML_SELNG_CO",
+        "female_sales_count": "FML_SELNG_CO",
+        "age_10_sales_count": "AGRDE_10_SELNG_CO",
+        "age_20_sales_count": "AGRDE_20_SELNG_CO",
+        "age_30_sales_count": "AGRDE_30_SELNG_CO",
+        "age_40_sales_count": "AGRDE_40_SELNG_CO",
+        "age_50_sales_count": "AGRDE_50_SELNG_CO",
+        "age_60_sales_count": "AGRDE_60_ABOVE_SELNG_CO",
+    }
+
+    # 이미 저장된 데이터 판별 키
+    SALES_KEY_COLUMNS = ["year", "quarter", "region_name", "industry_name"]
+
+    def build_sales_records(self, df: pd.DataFrame) -> pd.DataFrame:
+        """API DataFrame을 SalesData 컬럼 구조로 컬럼 단위 변환"""
+        records = df[[
+            "year", "quarter", "district_name", "region_name", "industry_name", "main_category",
+            "sales_amount", "sales_count"
+        ]].copy()
+
+        for column, api_field in self.SALES_COLUMN_MAP.items():
+            if api_field in df.columns:
+                records[column] = pd.to_numeric(df[api_field], errors="coerce").fillna(0).astype("int64")
+            else:
+                records[column] = 0
+
+        records["sales_amount"] = records["sales_amount"].astype("int64")
+        records["sales_count"] = records["sales_count"].astype("int64")
+        return records
+
+    async def update_sales_data(self, chunk_size: int = 2000):
+        """상권 분석 : 매출 데이터 수집 및 DB 저장 (컬럼 단위 변환 + 기존 키 anti-join + 청크 단위 bulk insert)"""
         from database.connector import database_instance as mariadb
-        db = mariadb.pre_session()
 
         try:
             logger.info("상권 매출 데이터 업데이트 시작")
             timeout = aiohttp.ClientTimeout(total=30) 
             
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                df = await self.fetch_sales_data(session)
-                
-                if df.empty :
-                    logger.warning("매출 데이터에서 수집된 데이터가 없음")
-                    return
+                # 최신 분기가 이미 수집되어 있으면 수집 생략
+                quarter = await ingestion_checkpoint_service.get_pending_quarter(
+                    session, self.sales_service_name, self.sales_api_key, self.sales_service_name,
+                    stored_quarter=self.get_stored_quarter()
+                )
+                if quarter is None:
+                    return ingestion_checkpoint_service.SKIPPED
+
+                df = await self.fetch_sales_data(session, quarter)
                 
-                # 기존 DB에서 (year, quarter, region_code, indu) 조합
+            if df.empty :
+                logger.warning("매출 데이터에서 수집된 데이터가 없음")
+                return ingestion_checkpoint_service.FAILED
+
+            records = self.build_sales_records(df)
+            records = records.drop_duplicates(subset=self.SALES_KEY_COLUMNS, keep="first")
+
+            missing_district = records["district_name"].isna()
+            if missing_district.any():
+                logger.warning(f"자치구 매핑이 없는 매출 데이터 {int(missing_district.sum())}건 제외")
+                records = records[~missing_district]
+
+            db = mariadb.pre_session()
+            try:
+                # 기존 DB에서 (year, quarter, region_name, industry_name) 조합 - 수집된 분기만 조회
+                quarters = list(records[["year", "quarter"]].drop_duplicates().itertuples(index=False, name=None))
                 existing_rows = db.query(
                     SalesData.year,
                     SalesData.quarter,
                     SalesData.region_name,
                     SalesData.industry_name
-                ).distinct().all()
-                existing_set = set((y, q, r, i) for y, q, r, i in existing_rows)
-
-
-                for _, row in df.iterrows():
-                    year = row["year"]
-                    quarter = row["quarter"]
-                    region_name = row["region_name"]
-                    district_name = row["district_name"]
-                    industry_name = row["industry_name"]
-                    main_category = row["main_category"]
-                    sales_amount = row["sales_amount"]
-                    sales_count = row["sales_count"]
-
-                    # 이미 저장된 조합이면 스킵
-                    if (year, quarter, region_name, industry_name) in existing_set:
-                        continue
-                    
-                    try:
-                        
-                        sales_record = SalesData(
-                            year=year,
-                            quarter=quarter,
-                            district_name=district_name,
-                            region_name=region_name,
-                            industry_name=industry_name,
-                            main_category=main_category,
-
-                            sales_amount=sales_amount,
-                            sales_count=sales_count,
-
-                            weekday_sales_amount=self.safe_get(row, "MDWK_SELNG_AMT"),
-                            weekend_sales_amount=self.safe_get(row, "WKEND_SELNG_AMT"),
-                            mon_sales_amount=self.safe_get(row, "MON_SELNG_AMT"),
-                            tues_sales_amount=self.safe_get(row, "TUES_SELNG_AMT"),
-                            wed_sales_amount=self.safe_get(row, "WED_SELNG_AMT"),
-                            thur_sales_amount=self.safe_get(row, "THUR_SELNG_AMT"),
-                            fri_sales_amount=self.safe_get(row, "FRI_SELNG_AMT"),
-                            sat_sales_amount=self.safe_get(row, "SAT_SELNG_AMT"),
-                            sun_sales_amount=self.safe_get(row, "SUN_SELNG_AMT"),
-                            
-                            time_00_06_sales_amount=self.safe_get(row, "TMZON_00_06_SELNG_AMT"),
-                            time_06_11_sales_amount=self.safe_get(row, "TMZON_06_11_SELNG_AMT"),
-                            time_11_14_sales_amount=self.safe_get(row, "TMZON_11_14_SELNG_AMT"),
-                            time_14_17_sales_amount=self.safe_get(row, "TMZON_14_17_SELNG_AMT"),
-                            time_17_21_sales_amount=self.safe_get(row, "TMZON_17_21_SELNG_AMT"),
-                            time_21_24_sales_amount=self.safe_get(row, "TMZON_21_24_SELNG_AMT"),
-
-                            male_sales_amount=self.safe_get(row, "ML_SELNG_AMT"),
-                            female_sales_amount=self.safe_get(row, "FML_SELNG_AMT"),
-                            age_10_sales_amount=self.safe_get(row, "AGRDE_10_SELNG_AMT"),
-                            age_20_sales_amount=self.safe_get(row, "AGRDE_20_SELNG_AMT"),
-                            age_30_sales_amount=self.safe_get(row, "AGRDE_30_SELNG_AMT"),
-                            age_40_sales_amount=self.safe_get(row, "AGRDE_40_SELNG_AMT"),
-                            age_50_sales_amount=self.safe_get(row, "AGRDE_50_SELNG_AMT"),
-                            age_60_sales_amount=self.safe_get(row, "AGRDE_60_ABOVE_SELNG_AMT"),
-
-                            weekday_sales_count=self.safe_get(row, "MDWK_SELNG_CO"),
-                            weekend_sales_count=self.safe_get(row, "WKEND_SELNG_CO"),
-                            mon_sales_count=self.safe_get(row, "MON_SELNG_CO"),
-                            tues_sales_count=self.safe_get(row, "TUES_SELNG_CO"),
-                            wed_sales_count=self.safe_get(row, "WED_SELNG_CO"),
-                            thur_sales_count=self.safe_get(row, "THUR_SELNG_CO"),
-                            fri_sales_count=self.safe_get(row, "FRI_SELNG_CO"),
-                            sat_sales_count=self.safe_get(row, "SAT_SELNG_CO"),
-                            sun_sales_count=self.safe_get(row, "SUN_SELNG_CO"),
-
-                            time_00_06_sales_count=self.safe_get(row, "TMZON_00_06_SELNG_CO"),
-                            time_06_11_sales_count=self.safe_get(row, "TMZON_06_11_SELNG_CO"),
-                            time_11_14_sales_count=self.safe_get(row, "TMZON_11_14_SELNG_CO"),
-                            time_14_17_sales_count=self.safe_get(row, "TMZON_14_17_SELNG_CO"),
-                            time_17_21_sales_count=self.safe_get(row, "TMZON_17_21_SELNG_CO"),
-                            time_21_24_sales_count=self.safe_get(row, "TMZON_21_24_SELNG_CO"),
-
-                            male_sales_count=self.safe_get(row, "ML_SELNG_CO"),
-                            female_sales_count=self.safe_get(row, "FML_SELNG_CO"),
-                            age_10_sales_count=self.safe_get(row, "AGRDE_10_SELNG_CO"),
-                            age_20_sales_count=self.safe_get(row, "AGRDE_20_SELNG_CO"),
-                            age_30_sales_count=self.safe_get(row, "AGRDE_30_SELNG_CO"),
-                            age_40_sales_count=self.safe_get(row, "AGRDE_40_SELNG_CO"),
-                            age_50_sales_count=self.safe_get(row, "AGRDE_50_SELNG_CO"),
-                            age_60_sales_count=self.safe_get(row, "AGRDE_60_ABOVE_SELNG_CO"),
-                        )
-
-                        db.add(sales_record)
-
-                    except Exception as e:
-                        logger.error(f"매출 데이터 저장 중 오류 발생: {e}")
-
+                ).filter(tuple_(SalesData.year, SalesData.quarter).in_(quarters)).distinct().all()
+                existing_df = pd.DataFrame(existing_rows, columns=self.SALES_KEY_COLUMNS)
+
+                # 이미 저장된 조합 제외 (anti-join)
+                merged = records.merge(existing_df, on=self.SALES_KEY_COLUMNS, how="left", indicator=True)
+                new_records = merged[merged["_merge"] == "left_only"].drop(columns="_merge")
+                logger.info(f"매출 데이터 {len(records)}건 중 신규 {len(new_records)}건 저장 시작")
+
+                # 청크 단위 executemany + 커밋 (트랜잭션을 짧게 유지)
+                insert_stmt = insert(SalesData)
+                for start in range(0, len(new_records), chunk_size):
+                    chunk = new_records.iloc[start:start + chunk_size].to_dict(orient="records")
+                    db.execute(insert_stmt, chunk)
+                    db.commit()
+
+                aggregate_cache_service.bump_version(db, aggregate_cache_service.SALES_DATA)
                 db.commit()
-                logger.info(f"매출 데이터 저장 완료")
-                return 
+                logger.info(f"매출 데이터 저장 완료 - 신규 {len(new_records)}건")
+                ingestion_checkpoint_service.mark_completed(self.sales_service_name, quarter)
+                return ingestion_checkpoint_service.UPDATED
+
+            except Exception as e:
+                db.rollback()
+                logger.error(f"매출 데이터 저장 중 오류 발생: {e}")
+                return ingestion_checkpoint_service.FAILED
+            finally:
+                db.close()
 
         except Exception as e:
-            db.rollback()
             logger.error(f"매출 데이터 처리 중 예외 발생: {e}")
-        finally:
-            db.close()
+            return ingestion_checkpoint_service.FAILED
 
 sales_service = SalesService()
 
@@ -0,0 +1,78 @@
+# services/sentiment_matcher.py
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+class SentimentMatcher:
+    """감성 사전 다중 패턴 매칭기 (Aho-Corasick 오토마톤)
+
+    형태소 하나에 포함된 감성 사전 단어를 한 번의 순회로 모두 찾는다.
+    "사전 단어 in 형태소" 를 사전 전체에 대해 반복하던 방식과 같은 결과
+    (포함된 사전 단어들의 점수 합)를 돌려준다.
+    """
+
+    def __init__(self, sentiment_dict: Dict[str, float], cache_size: int = 4096):
+        # 사전 등록 순서를 패턴 번호로 사용 (점수 합산 순서를 기존과 동일하게 유지)
+        self.patterns: List[str] = [word for word in sentiment_dict if word]
+        self.scores: List[float] = [sentiment_dict[word] for word in self.patterns]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        self._build()
+
+        # 자주 나오는 형태소 결과 캐시 (인스턴스별로 두어 인스턴스와 함께 해제되도록)
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _build(self):
+        """트라이 구성 후 BFS로 실패 링크와 출력 집합 계산"""
+        outputs: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[child] = fail_target if fail_target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._output = [tuple(sorted(set(out))) for out in outputs]
+
+    def _match(self, word: str) -> Tuple[float, int]:
+        """형태소에 포함된 사전 단어들의 (점수 합, 매칭된 사전 단어 수)"""
+        found = set()
+        node = 0
+        for char in word:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                found.update(self._output[node])
+
+        if not found:
+            return 0.0, 0
+
+        score = 0.0
+        for index in sorted(found):
+            score += self.scores[index]
+        return score, len(found)
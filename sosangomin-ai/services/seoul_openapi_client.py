@@ -0,0 +1,177 @@
+# services/seoul_openapi_client.py
+
+import os
+import time
+import math
+import logging
+import asyncio
+import aiohttp
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+class SeoulOpenApiError(Exception):
+    """서울 열린데이터 API 오류 응답 (재시도 후에도 실패한 경우 포함)"""
+
+class SeoulOpenApiClient:
+    """서울 열린데이터 광장(openapi.seoul.go.kr) 병렬 페이지 수집기
+
+    첫 페이지에서 list_total_count를 읽은 뒤 나머지 페이지를 동시 요청 수 제한과
+    초당 요청 수 제한 안에서 병렬로 가져온다. 페이지마다 재시도하고, on_page 콜백으로
+    페이지 단위 체크포인트를 남길 수 있으며 completed_pages로 이미 받은 페이지는 건너뛴다.
+    """
+
+    PAGE_SIZE = 1000  # 서울 열린데이터 API 1회 최대 조회 건수
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        # 로컬 스텁 서버로 테스트할 수 있도록 기본 URL을 환경 변수로 변경 가능
+        self.base_url = os.getenv("SEOUL_OPENAPI_BASE_URL", "http://openapi.seoul.go.kr:8088").rstrip("/")
+        self.concurrency = int(os.getenv("SEOUL_OPENAPI_CONCURRENCY", 4))
+        self.rate_limit = float(os.getenv("SEOUL_OPENAPI_RATE_LIMIT", 10))  # 초당 최대 요청 수
+        self.max_retries = int(os.getenv("SEOUL_OPENAPI_MAX_RETRIES", 3))
+        self.timeout = aiohttp.ClientTimeout(total=30)
+
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+        logger.info("SeoulOpenApiClient 초기화 완료")
+
+    # =====================
+    #  단일 페이지 요청
+    # =====================
+
+    def build_url(self, api_key: str, service_name: str, start: int, end: int) -> str:
+        """페이지 요청 URL"""
+        return f"{self.base_url}/{api_key}/json/{service_name}/{start}/{end}/"
+
+    async def _wait_rate_limit(self):
+        """초당 요청 수 제한 (요청 시작 시각을 1/rate_limit 초 간격으로 배치)"""
+        if self.rate_limit <= 0:
+            return
+
+        interval = 1.0 / self.rate_limit
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + interval
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def fetch_page(self, session, api_key: str, service_name: str, start: int, end: int) -> Dict[str, Any]:
+        """한 페이지 요청 ({"rows", "total_count"}), 실패 시 지수 백오프로 재시도"""
+        url = self.build_url(api_key, service_name, start, end)
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 1):
+            await self._wait_rate_limit()
+            try:
+                async with session.get(url, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+
+                body = data.get(service_name)
+                if body is None:
+                    # 데이터가 없으면 {"RESULT": {"CODE": "INFO-200"}} 형태로 응답
+                    result = data.get("RESULT", {})
+                    if result.get("CODE") == "INFO-200":
+                        return {"rows": [], "total_count": 0}
+                    raise SeoulOpenApiError(f"{result.get('CODE')} {result.get('MESSAGE')}")
+
+                return {
+                    "rows": body.get("row", []),
+                    "total_count": int(body.get("list_total_count") or 0)
+                }
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, SeoulOpenApiError, ValueError) as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    backoff = 2 ** (attempt - 1)
+                    logger.warning(f"{service_name} {start}~{end} 요청 실패 ({attempt}/{self.max_retries}), {backoff}초 후 재시도 : {e}")
+                    await asyncio.sleep(backoff)
+
+        raise SeoulOpenApiError(f"{service_name} {start}~{end} 요청 실패 : {last_error}")
+
+    # =====================
+    #  전체 페이지 수집
+    # =====================
+
+    async def fetch_all(
+        self,
+        session,
+        api_key: str,
+        service_name: str,
+        max_rows: Optional[int] = None,
+        completed_pages: Optional[Iterable[int]] = None,
+        on_page: Optional[Callable[[int, List[Dict[str, Any]]], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """서비스의 전체(또는 max_rows까지) 행 수집
+
+        Returns:
+            {"rows": 받은 행(페이지 순서), "total_count": list_total_count,
+             "page_count": 전체 페이지 수, "failed_pages": 재시도 후에도 실패한 페이지 번호}
+        """
+        page_size = self.PAGE_SIZE
+        completed = set(completed_pages or [])
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+
+        # 첫 페이지로 전체 건수 확인 (체크포인트에 있더라도 건수 확인을 위해 요청)
+        first = await self.fetch_page(session, api_key, service_name, 1, page_size)
+        total_count = first["total_count"]
+        if max_rows is not None:
+            total_count = min(total_count, max_rows)
+
+        page_count = math.ceil(total_count / page_size) if total_count else 0
+        if page_count == 0:
+            return {"rows": [], "total_count": 0, "page_count": 0, "failed_pages": []}
+
+        if 0 not in completed:
+            pages[0] = first["rows"][:total_count]
+            if on_page:
+                await on_page(0, pages[0])
+
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        failed_pages: List[int] = []
+
+        async def fetch(page: int):
+            start = page * page_size + 1
+            end = min(start + page_size - 1, total_count)
+            async with semaphore:
+                try:
+                    result = await self.fetch_page(session, api_key, service_name, start, end)
+                except SeoulOpenApiError as e:
+                    logger.error(str(e))
+                    failed_pages.append(page)
+                    return
+
+            pages[page] = result["rows"]
+            if on_page:
+                await on_page(page, result["rows"])
+
+        remaining = [page for page in range(1, page_count) if page not in completed]
+        await asyncio.gather(*(fetch(page) for page in remaining))
+
+        rows = [row for page in sorted(pages) for row in pages[page]]
+        logger.info(
+            f"{service_name} 수집 완료 - {len(rows)}/{total_count}건, "
+            f"{len(remaining) + 1}/{page_count} 페이지 요청, 실패 {len(failed_pages)} 페이지"
+        )
+
+        return {
+            "rows": rows,
+            "total_count": total_count,
+            "page_count": page_count,
+            "failed_pages": sorted(failed_pages)
+        }
+
+    async def fetch_rows(self, session, api_key: str, service_name: str, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+        """전체 행 수집, 실패한 페이지가 있으면 SeoulOpenApiError"""
+        result = await self.fetch_all(session, api_key, service_name, max_rows=max_rows)
+        if result["failed_pages"]:
+            raise SeoulOpenApiError(f"{service_name} 페이지 수집 실패 : {result['failed_pages']}")
+        return result["rows"]
+
+seoul_openapi_client = SeoulOpenApiClient()
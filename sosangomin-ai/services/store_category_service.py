@@ -8,6 +8,9 @@ import aiohttp
 from datetime import datetime
 from dotenv import load_dotenv
 from db_models import StoreCategories  
+from services.aggregate_cache_service import aggregate_cache_service
+from services.seoul_openapi_client import seoul_openapi_client
+from services.ingestion_checkpoint_service import ingestion_checkpoint_service
 import json
 import pandas as pd
 from sqlalchemy.orm import Session
@@ -53,26 +56,25 @@ class StoreCategoryService:
         val = row.get(key)
         return None if pd.isna(val) else val
     
-    async def fetch_store_data(self, session) -> dict:
-        """상권 점포 데이터 API 호출"""
+    def get_stored_quarter(self) -> Optional[str]:
+        """DB에 저장된 점포 데이터의 최신 분기 (STDR_YYQU_CD 형식)"""
+        from database.connector import database_instance as mariadb
+        db = mariadb.pre_session()
+        try:
+            latest = aggregate_cache_service.get_latest_quarter(db, StoreCategories)
+            return f"{latest[0]}{latest[1]}" if latest else None
+        finally:
+            db.close()
+
+    async def fetch_store_data(self, session, quarter: Optional[str] = None) -> dict:
+        """상권 점포 데이터 API 호출 (quarter를 주면 체크포인트에서 이어서 수집)"""
         try:
-            all_data = []
-            start = 1
-            limit = 1000  # 페이지당 수
-            while True:
-                end = start + limit - 1
-                url = f"{self.base_url}/{self.store_api_key}/json/{self.store_service_name}/{start}/{end}/"
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    rows = data[self.store_service_name].get("row", [])
-                    if not rows:
-                        break
-                    all_data.extend(rows)
-                    if len(rows) < limit:
-                        break
-                    start += limit
-                    await asyncio.sleep(0.2)
+            if quarter:
+                all_data = await ingestion_checkpoint_service.fetch_rows(
+                    session, self.store_service_name, self.store_api_key, self.store_service_name, quarter
+                )
+            else:
+                all_data = await seoul_openapi_client.fetch_rows(session, self.store_api_key, self.store_service_name)
             df = pd.DataFrame(all_data)
             if df.empty:
                 return pd.DataFrame()
@@ -98,27 +100,15 @@ class StoreCategoryService:
             logger.error(f"상권 점포 API 오류: {e}")
             return pd.DataFrame()
         
-    async def fetch_change_data(self, session) -> dict:
-        """상권 변화 지표 데이터 API 호출"""
+    async def fetch_change_data(self, session, quarter: Optional[str] = None) -> dict:
+        """상권 변화 지표 데이터 API 호출 (quarter를 주면 체크포인트에서 이어서 수집)"""
         try:
-            all_data = []
-            start = 1
-            limit = 1000  # 페이지당 수
-            while True:
-                end = start + limit - 1
-                url = f"{self.base_url}/{self.change_api_key}/json/{self.change_service_name}/{start}/{end}/"
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    rows = data[self.change_service_name].get("row", [])
-                    if not rows:
-                        break
-                    all_data.extend(rows)
-                    if len(rows) < limit:
-                        break
-                    start += limit
-                    await asyncio.sleep(0.2)
-                
+            if quarter:
+                all_data = await ingestion_checkpoint_service.fetch_rows(
+                    session, self.change_service_name, self.change_api_key, self.change_service_name, quarter
+                )
+            else:
+                all_data = await seoul_openapi_client.fetch_rows(session, self.change_api_key, self.change_service_name)
             df = pd.DataFrame(all_data)
             if df.empty:
                 return pd.DataFrame()
@@ -290,15 +280,27 @@ class StoreCategoryService:
             timeout = aiohttp.ClientTimeout(total=30)
 
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                store_df = await self.fetch_store_data(session)
+                # 점포 데이터 최신 분기가 이미 수집되어 있으면 수집 생략
+                store_quarter = await ingestion_checkpoint_service.get_pending_quarter(
+                    session, self.store_service_name, self.store_api_key, self.store_service_name,
+                    stored_quarter=self.get_stored_quarter()
+                )
+                if store_quarter is None:
+                    return ingestion_checkpoint_service.SKIPPED
+
+                change_quarter = await ingestion_checkpoint_service.fetch_latest_quarter(
+                    session, self.change_api_key, self.change_service_name
+                ) or store_quarter
+
+                store_df = await self.fetch_store_data(session, store_quarter)
                 logger.info(f"점포 데이터 수집 완료: {len(store_df)} rows")
 
-                change_df = await self.fetch_change_data(session)
+                change_df = await self.fetch_change_data(session, change_quarter)
                 logger.info(f"상권 변화 지표 수집 완료: {len(change_df)} rows")
 
                 if store_df.empty or change_df.empty:
                     logger.warning("점포 및 상권 변화 지표에서 수집된 데이터가 없음")
-                    return
+                    return ingestion_checkpoint_service.FAILED
 
                 # 상권 변화 지표 병합
                 merged_df = pd.merge(store_df, change_df, on=["year", "quarter", "region_name"], how="left")
@@ -357,12 +359,18 @@ class StoreCategoryService:
                 if update_list:
                     db.bulk_update_mappings(StoreCategories, update_list)
 
+                aggregate_cache_service.bump_version(db, aggregate_cache_service.STORE_CATEGORIES)
                 db.commit()
                 logger.error(f"상권 분석 : 업종 데이터 저장 완료 - 신규 {total_saved}건, 수정 {total_updated}건")
 
+                ingestion_checkpoint_service.mark_completed(self.store_service_name, store_quarter)
+                ingestion_checkpoint_service.mark_completed(self.change_service_name, change_quarter)
+                return ingestion_checkpoint_service.UPDATED
+
         except Exception as e:
             db.rollback()
             logger.error(f"업종 데이터 처리 중 예외 발생: {e}")
+            return ingestion_checkpoint_service.FAILED
         finally:
             db.close()
 
@@ -1,10 +1,8 @@
 # services/store_service.py
 import os
 import re
-import time
 import logging
 import requests
-import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
@@ -13,18 +11,22 @@ from bs4 import BeautifulSoup
 from urllib.parse import urlencode, quote_plus
 from db_models import Store
 from sqlalchemy import or_
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import tempfile
-import shutil
-import uuid
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from services.webdriver_pool_service import webdriver_pool_service
 
 logger = logging.getLogger(__name__)
 
 class SimpleStoreService:
+    PLACE_URL_PATTERN = r'/place/\d+|place=\d+'
+
     def __init__(self):
         load_dotenv("./config/.env")
+
+        # place_id 검색 1건당 전체 시간 예산(초)
+        self.place_scrape_budget = float(os.getenv("PLACE_SCRAPE_TIME_BUDGET", 20))
         
         self.naver_client_id = os.getenv("NAVER_CLIENT_ID")
         self.naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
@@ -167,29 +169,36 @@ class SimpleStoreService:
     
     
     async def _get_place_id_with_selenium(self, query: str) -> Optional[str]:
-        driver = None
+        """검색 결과에서 place_id 추출 (스크래핑 전용 실행기에서 실행, 시간 예산 초과 시 None)"""
         try:
             logger.info(f"'{query}' 검색하여 place_id 추출 중...")
+            return await webdriver_pool_service.run_with_driver(
+                self._find_place_id, query, time_budget=self.place_scrape_budget
+            )
+        except Exception as e:
+            logger.error(f"Selenium으로 place_id 추출 중 오류 발생: {e}")
+            return None
 
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36")
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    def _find_place_id(self, driver, deadline: Optional[float], query: str) -> Optional[str]:
+        """검색 페이지에서 place_id 추출 (고정 sleep 대신 URL/iframe 조건 대기)"""
+        time_left = webdriver_pool_service.time_left
+        place_loaded = EC.any_of(
+            EC.url_matches(self.PLACE_URL_PATTERN),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "iframe#entryIframe"))
+        )
 
+        try:
             search_url = f"https://map.naver.com/p/search/{quote_plus(query)}"
-            driver.get(search_url)
+            webdriver_pool_service.load_page(driver, search_url, deadline)
 
-            time.sleep(6)
+            # 상세 페이지로 바로 이동하거나 검색 결과 iframe이 뜰 때까지 대기
+            try:
+                WebDriverWait(driver, time_left(deadline, 10)).until(EC.any_of(
+                    place_loaded,
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "iframe#searchIframe"))
+                ))
+            except TimeoutException:
+                logger.warning("검색 페이지 로딩 대기 시간 초과")
             
             current_url = driver.current_url
             logger.info(f"현재 URL: {current_url}")
@@ -216,18 +225,16 @@ class SimpleStoreService:
                 logger.warning(f"Entry iframe 확인 중 오류: {iframe_error}")
                 
             try:
-                time.sleep(2)
-                
-                search_iframe = None
+                search_iframe = False
                 try:
-                    search_iframe = driver.find_element("css selector", "iframe#searchIframe")
+                    search_iframe = WebDriverWait(driver, time_left(deadline, 5)).until(
+                        EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#searchIframe"))
+                    )
                     logger.info("검색 iframe 발견")
-                except Exception as e:
+                except TimeoutException as e:
                     logger.warning(f"검색 iframe 찾기 실패: {e}")
                     
                 if search_iframe:
-                    driver.switch_to.frame(search_iframe)
-                    
                     selectors = [
                         "li.UEzoS.rTjJo", 
                         "li.VLTHu", 
@@ -240,6 +247,15 @@ class SimpleStoreService:
                         "li.sc-ebcc9e2e-0",
                         "li:first-child",  
                     ]
+
+                    # 검색 결과 목록이 렌더링될 때까지 대기
+                    try:
+                        WebDriverWait(driver, time_left(deadline, 5)).until(EC.any_of(*[
+                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                            for selector in selectors
+                        ]))
+                    except TimeoutException:
+                        logger.warning("검색 결과 목록 대기 시간 초과")
                     
                     for selector in selectors:
                         try:
@@ -253,8 +269,13 @@ class SimpleStoreService:
                                     logger.info(f"첫 번째 검색 결과 href: {href}")
                                     if href and '/place/' in href:
                                         driver.switch_to.default_content()
-                                        driver.get(href)
-                                        time.sleep(3)
+                                        webdriver_pool_service.load_page(driver, href, deadline)
+                                        try:
+                                            WebDriverWait(driver, time_left(deadline, 5)).until(
+                                                EC.url_matches(self.PLACE_URL_PATTERN)
+                                            )
+                                        except TimeoutException:
+                                            pass
                                         new_url = driver.current_url
                                         logger.info(f"href 이동 후 URL: {new_url}")
                                         match = re.search(r'/place/(\d+)', new_url)
@@ -269,15 +290,19 @@ class SimpleStoreService:
                             logger.warning(f"선택자 '{selector}' 시도 실패: {e}")
                     
                     driver.switch_to.default_content()
+
+                    # 클릭 후 상세 페이지(URL 또는 entry iframe)가 뜰 때까지 대기
+                    try:
+                        WebDriverWait(driver, time_left(deadline, 5)).until(place_loaded)
+                    except TimeoutException:
+                        logger.warning("검색 결과 클릭 후 상세 페이지 대기 시간 초과")
+
                     iframes = driver.find_elements("tag name", "iframe")
                     logger.info(f"현재 페이지 iframe 수: {len(iframes)}")
                     for i, frame in enumerate(iframes):
                         logger.info(f"iframe[{i}] - id: {frame.get_attribute('id')}, src: {frame.get_attribute('src')}")
 
                     
-                    # 클릭 후 추가 로딩 시간
-                    time.sleep(3)
-                    
                     # 현재 URL 다시 확인
                     current_url = driver.current_url
                     place_id_match = re.search(r'/place/(\d+)', current_url)
@@ -358,15 +383,6 @@ class SimpleStoreService:
             logger.error(f"Selenium으로 place_id 추출 중 오류 발생: {e}")
             return None
 
-        finally:
-            if driver:
-                try:
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(None, driver.quit)
-                except RuntimeError:
-                    driver.quit()
-            logger.info("WebDriver 종료됨")
-
     def _clean_text(self, text: str) -> str:
         """HTML 태그 및 특수문자 제거"""
         if not text:
@@ -3,9 +3,11 @@ import logging
 import asyncio
 import aiohttp
 from datetime import datetime
+from typing import Dict, List, Any
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 from db_models import SubwayStation  # 지하철역 정보 테이블
+from services.seoul_openapi_client import seoul_openapi_client, SeoulOpenApiError
 
 logger = logging.getLogger(__name__)
 
@@ -14,90 +16,122 @@ class SubwayStationService:
         load_dotenv("./config/.env")
         
         self.subway_api_key = os.getenv("SUBWAY_API_KEY")
-        self.base_url = "http://openapi.seoul.go.kr:8088"
         self.service_name = "subwayStationMaster"
 
         if not self.subway_api_key:
             logger.error("지하철역 인증키가 없습니다. 환경 변수를 확인하세요.")
 
-    async def fetch_station_data(self, session) -> dict:
-        """지하철역 데이터 API 호출"""
+    async def fetch_all_stations(self, session) -> Dict[str, Any]:
+        """지하철역 전체 페이지 수집 (공용 클라이언트 - 재시도/백오프/요청 수 제한 적용)"""
         try:
-            url = f"{self.base_url}/{self.subway_api_key}/json/{self.service_name}/1/1000/"
-            logger.info(f"지하철역 API 호출 URL: {url}")
-            
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                response.raise_for_status()
-                return await response.json()
-        except Exception as e:
-            import traceback
-            error_traceback = traceback.format_exc()
-            logger.error(f"API 호출 중 오류 발생: {str(e)}\n{error_traceback}")
+            return await seoul_openapi_client.fetch_all(session, self.subway_api_key, self.service_name)
+        except SeoulOpenApiError as e:
+            logger.error(f"지하철역 API 호출 중 오류 발생 : {e}")
             return {"error": str(e)}
 
-    async def update_station_data(self):
+    def reconcile_stations(self, db: Session, rows: List[Dict[str, Any]], allow_delete: bool = True) -> Dict[str, int]:
+        """API 지하철역 목록과 DB를 bldn_id 기준 집합 연산으로 동기화 (단일 트랜잭션)"""
+        now = datetime.now()
+
+        # API 데이터 → bldn_id 키 맵 (중복 역사 ID는 마지막 값 사용)
+        # feed_keys는 좌표 변환 실패 행도 포함 - 피드에 남아 있는 역은 삭제하지 않음
+        incoming: Dict[str, Dict[str, Any]] = {}
+        feed_keys = set()
+        for row in rows:
+            bldn_id = row.get("BLDN_ID")  # 역사 ID
+            if not bldn_id:
+                continue
+            feed_keys.add(bldn_id)
+            try:
+                incoming[bldn_id] = {
+                    "bldn_id": bldn_id,
+                    "station_name": row.get("BLDN_NM"),  # 역사명
+                    "route": row.get("ROUTE"),  # 호선
+                    "latitude": float(row.get("LAT")),  # 위도
+                    "longitude": float(row.get("LOT"))  # 경도
+                }
+            except (TypeError, ValueError) as e:
+                logger.warning(f"지하철역 좌표 변환 실패 ({bldn_id}) : {e}")
+
+        # 기존 데이터 한 번에 조회
+        existing = {
+            r.bldn_id: r
+            for r in db.query(
+                SubwayStation.station_id,
+                SubwayStation.bldn_id,
+                SubwayStation.latitude,
+                SubwayStation.longitude
+            ).all()
+        }
+
+        new_keys = incoming.keys() - existing.keys()
+        common_keys = incoming.keys() & existing.keys()
+        removed_keys = existing.keys() - feed_keys if allow_delete else set()
+
+        insert_list = [{**incoming[key], "created_at": now} for key in new_keys]
+
+        # 위치 정보가 변경된 경우에만 업데이트
+        update_list = [
+            {
+                "station_id": existing[key].station_id,
+                "latitude": incoming[key]["latitude"],
+                "longitude": incoming[key]["longitude"]
+            }
+            for key in common_keys
+            if existing[key].latitude != incoming[key]["latitude"]
+            or existing[key].longitude != incoming[key]["longitude"]
+        ]
+
+        delete_ids = [existing[key].station_id for key in removed_keys]
+
+        if insert_list:
+            db.bulk_insert_mappings(SubwayStation, insert_list)
+        if update_list:
+            db.bulk_update_mappings(SubwayStation, update_list)
+        if delete_ids:
+            db.query(SubwayStation).filter(SubwayStation.station_id.in_(delete_ids)).delete(synchronize_session=False)
+
+        return {"saved": len(insert_list), "updated": len(update_list), "deleted": len(delete_ids)}
+
+    EMPTY_RESULT = {"saved": 0, "updated": 0, "deleted": 0}
+
+    async def update_station_data(self) -> Dict[str, int]:
         """지하철역 데이터 수집 및 DB 저장"""
         from database.connector import database_instance as mariadb
         db = mariadb.pre_session()
-        total_updated = 0
-        total_saved = 0 
 
         try:
             logger.info("지하철역 데이터 업데이트 시작")
 
             async with aiohttp.ClientSession() as session:
-                data = await self.fetch_station_data(session)
-
-                if 'error' in data:
-                    return 0
-                
-                rows = data[self.service_name].get("row", [])
-                if not rows:
-                    logger.warning("가져올 데이터가 없습니다.")
-                    return 0
-                
-                for row in rows:
-                    try:
-                        bldn_id = row.get("BLDN_ID")  # 역사 ID
-                        station_name = row.get("BLDN_NM")  # 역사명
-                        route = row.get("ROUTE")  # 호선
-                        latitude = row.get("LAT")  # 위도
-                        longitude = row.get("LOT")  # 경도
-
-                        # 기존 데이터 조회
-                        existing_station = db.query(SubwayStation).filter_by(bldn_id=bldn_id).first()
-
-                        if existing_station:
-                            # 위치 정보가 변경된 경우에만 업데이트
-                            if existing_station.latitude != latitude or existing_station.longitude != longitude:
-                                existing_station.latitude = latitude
-                                existing_station.longitude = longitude
-                                db.commit()
-                                total_updated += 1
-                        else:
-                            # 신규 데이터 추가
-                            new_station = SubwayStation(
-                                bldn_id=bldn_id,
-                                station_name=station_name,
-                                route=route,
-                                latitude=latitude,
-                                longitude=longitude,
-                                created_at=datetime.now()
-                            )
-                            db.add(new_station)
-                            total_saved += 1
-
-                    except Exception as e:
-                        logger.warning(f"지하철역 데이터 저장 실패 : {e}")
-
-                db.commit()
-                logger.info(f"지하철역 데이터 저장 완료 : 신규 {total_saved}건, 수정 {total_updated}건")
-                return 
+                data = await self.fetch_all_stations(session)
+
+            if 'error' in data:
+                return dict(self.EMPTY_RESULT)
+            
+            rows = data["rows"]
+            if not rows:
+                logger.warning("가져올 데이터가 없습니다.")
+                return dict(self.EMPTY_RESULT)
+
+            # 전체 건수를 다 받지 못한 경우 삭제는 건너뜀 (부분 수집으로 역이 지워지는 것 방지)
+            total_count = data.get("total_count")
+            allow_delete = not data["failed_pages"] and bool(total_count) and len(rows) >= total_count
+            if not allow_delete:
+                logger.warning(f"지하철역 전체 건수 불일치 ({len(rows)}/{total_count}) - 삭제 생략")
+
+            result = self.reconcile_stations(db, rows, allow_delete)
+            db.commit()
+            logger.info(
+                f"지하철역 데이터 저장 완료 : 신규 {result['saved']}건, "
+                f"수정 {result['updated']}건, 삭제 {result['deleted']}건"
+            )
+            return result
 
         except Exception as e:
             db.rollback()
             logger.error(f"지하철역 데이터 호출 및 저장 실패 : {e}")
-            return 
+            return dict(self.EMPTY_RESULT)
         finally:
             db.close()
 
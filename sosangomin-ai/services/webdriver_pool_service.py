@@ -0,0 +1,280 @@
+# services/webdriver_pool_service.py
+
+import os
+import time
+import logging
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Callable, Dict, List, Optional
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+class PooledDriver:
+    """풀에서 관리하는 드라이버와 생성 시각/사용 횟수"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+class WebDriverPoolService:
+    """헤드리스 Chrome 드라이버 풀
+
+    - 최대 pool_size개의 브라우저만 동시에 사용 (초과 요청은 대기)
+    - 반납된 드라이버는 쿠키/스토리지/창을 정리한 뒤 재사용
+    - 대여 시 상태 확인, 사용 횟수(max_uses) 또는 수명(max_age) 초과 시 새 드라이버로 교체
+    """
+
+    # 반납 시 저장소(localStorage/IndexedDB/캐시 등)를 지우는 네이버 출처 - 지도/플레이스 iframe 포함
+    CLEAR_ORIGINS = [
+        "https://map.naver.com",
+        "https://pcmap.place.naver.com",
+        "https://m.place.naver.com",
+        "https://m.map.naver.com",
+        "https://www.naver.com",
+        "https://nid.naver.com"
+    ]
+
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36"
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.pool_size = int(os.getenv("CHROME_POOL_SIZE", 2))
+        self.max_uses = int(os.getenv("CHROME_DRIVER_MAX_USES", 20))
+        self.max_age = int(os.getenv("CHROME_DRIVER_MAX_AGE", 60 * 30))
+        self.acquire_timeout = int(os.getenv("CHROME_POOL_ACQUIRE_TIMEOUT", 60))
+
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._lock = threading.Lock()
+        self._idle: List[PooledDriver] = []
+        self._in_use: Dict[int, PooledDriver] = {}
+        self._closed = False
+
+        # 스크래핑 전용 실행기 - Selenium 동기 호출이 이벤트 루프/기본 실행기를 막지 않도록 분리
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.pool_size,
+            thread_name_prefix="webdriver"
+        )
+
+        if os.getenv("CHROME_POOL_PREWARM", "false").lower() == "true":
+            threading.Thread(target=self.warm_up, daemon=True).start()
+
+        logger.info(f"WebDriverPoolService 초기화 완료 (최대 {self.pool_size}개)")
+
+    # =====================
+    #  드라이버 생성/정리
+    # =====================
+
+    def _build_options(self) -> Options:
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--incognito")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+        chrome_options.add_argument(f"user-agent={self.USER_AGENT}")
+        return chrome_options
+
+    def _create_driver(self) -> PooledDriver:
+        driver = webdriver.Chrome(service=Service(), options=self._build_options())
+        try:
+            # 이후 열리는 모든 페이지에서 navigator.webdriver 숨김
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
+            )
+        except Exception as e:
+            logger.debug(f"webdriver 속성 숨김 스크립트 등록 실패: {e}")
+        logger.info("Chrome WebDriver 생성됨")
+        return PooledDriver(driver=driver)
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+            logger.info("Chrome WebDriver 종료됨")
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 중 오류: {e}")
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """수명/사용 횟수 제한 및 브라우저 응답 확인"""
+        if pooled.uses >= self.max_uses or time.monotonic() - pooled.created_at > self.max_age:
+            return False
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """다음 사용을 위해 브라우저 상태 초기화 (실패 시 False)"""
+        driver = pooled.driver
+        try:
+            driver.switch_to.default_content()
+
+            # 추가로 열린 창/탭 정리
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # delete_all_cookies/localStorage.clear()는 현재 페이지 출처만 지우므로
+            # CDP로 브라우저 전체 쿠키/캐시와 네이버 출처별 저장소를 정리
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in self.CLEAR_ORIGINS:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"WebDriver 상태 초기화 실패, 폐기합니다: {e}")
+            return False
+
+    # =====================
+    #  대여/반납
+    # =====================
+
+    def acquire(self) -> webdriver.Chrome:
+        """드라이버 대여 (풀이 가득 차면 acquire_timeout초까지 대기)"""
+        if self._closed:
+            raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError("사용 가능한 WebDriver가 없습니다.")
+
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+
+                if pooled is None:
+                    pooled = self._create_driver()
+                elif not self._is_healthy(pooled):
+                    self._quit(pooled)
+                    continue
+
+                pooled.uses += 1
+                with self._lock:
+                    self._in_use[id(pooled.driver)] = pooled
+                return pooled.driver
+
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver: Optional[webdriver.Chrome]):
+        """드라이버 반납 - 상태 초기화 후 유휴 목록으로, 초기화 실패/제한 초과 시 폐기"""
+        if driver is None:
+            return
+
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        try:
+            reusable = (
+                not self._closed
+                and pooled.uses < self.max_uses
+                and time.monotonic() - pooled.created_at <= self.max_age
+                and self._reset(pooled)
+            )
+            if reusable:
+                with self._lock:
+                    self._idle.append(pooled)
+            else:
+                self._quit(pooled)
+        finally:
+            self._slots.release()
+
+    async def acquire_async(self) -> webdriver.Chrome:
+        """이벤트 루프를 막지 않고 드라이버 대여"""
+        return await asyncio.to_thread(self.acquire)
+
+    async def release_async(self, driver: Optional[webdriver.Chrome]):
+        """이벤트 루프를 막지 않고 드라이버 반납"""
+        await asyncio.to_thread(self.release, driver)
+
+    # =====================
+    #  스크래핑 실행
+    # =====================
+
+    @staticmethod
+    def time_left(deadline: Optional[float], cap: float) -> float:
+        """남은 시간 예산 (cap초 이내, 0 이상)"""
+        if deadline is None:
+            return cap
+        return max(0.0, min(cap, deadline - time.monotonic()))
+
+    def load_page(self, driver: webdriver.Chrome, url: str, deadline: Optional[float], cap: float = 30) -> bool:
+        """남은 예산 안에서 페이지 로드 - 시간 초과 시 로딩을 멈추고 이미 로드된 내용으로 계속 (False 반환)"""
+        driver.set_page_load_timeout(max(1, self.time_left(deadline, cap)))
+        try:
+            driver.get(url)
+            return True
+        except TimeoutException:
+            logger.warning(f"페이지 로드 시간 초과, 로드된 내용으로 계속합니다: {url}")
+            try:
+                driver.execute_script("window.stop();")
+            except Exception:
+                pass
+            return False
+
+    def _run_with_driver(self, func: Callable[..., Any], args: tuple, time_budget: Optional[float]) -> Any:
+        # 시간 예산은 드라이버를 받은 뒤부터 계산 (대여 대기는 acquire_timeout으로 별도 제한)
+        driver = self.acquire()
+        deadline = time.monotonic() + time_budget if time_budget else None
+        try:
+            return func(driver, deadline, *args)
+        finally:
+            self.release(driver)
+
+    async def run_with_driver(self, func: Callable[..., Any], *args, time_budget: Optional[float] = None) -> Any:
+        """드라이버를 대여해 func(driver, deadline, *args)를 스크래핑 전용 실행기에서 실행
+
+        deadline은 time.monotonic() 기준 마감 시각이며, func는 대기 시간을 time_left()로
+        제한해 예산을 넘기면 그때까지 모은 결과를 반환해야 한다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run_with_driver, func, args, time_budget)
+
+    # =====================
+    #  풀 관리
+    # =====================
+
+    def warm_up(self, count: Optional[int] = None):
+        """드라이버를 미리 생성해 유휴 목록에 보관"""
+        count = min(count or self.pool_size, self.pool_size)
+        drivers = []
+        try:
+            for _ in range(count):
+                drivers.append(self.acquire())
+        except Exception as e:
+            logger.warning(f"WebDriver 미리 생성 실패: {e}")
+        finally:
+            for driver in drivers:
+                self.release(driver)
+
+    def shutdown(self):
+        """유휴 드라이버 모두 종료 (사용 중인 드라이버는 반납 시 종료)"""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+        self._executor.shutdown(wait=False)
+
+webdriver_pool_service = WebDriverPoolService()
@@ -10,6 +10,8 @@ from sqlalchemy import func
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 from db_models import Population  # 가상의 Population 테이블 (행정동, 인구, 가구 수 저장용)
+from services.aggregate_cache_service import aggregate_cache_service
+from services.ingestion_checkpoint_service import ingestion_checkpoint_service
 
 logger = logging.getLogger(__name__)
 
@@ -47,21 +49,28 @@ class WorkingPopulationService:
             # logger.info("직장인구 데이터 업데이트 시작")
 
             async with aiohttp.ClientSession() as session:
+                # 최신 분기가 이미 반영되어 있으면 수집 생략
+                pending_quarter = await ingestion_checkpoint_service.get_pending_quarter(
+                    session, self.working_pop_service, self.working_pop_api_key, self.working_pop_service
+                )
+                if pending_quarter is None:
+                    return ingestion_checkpoint_service.SKIPPED
+
                 data = await self.fetch_population_data(session, start_index, end_index)
                 # logger.error(f"API 응답 데이터 예시: {data}")
 
                 if 'error' in data:
-                    return 0
+                    return ingestion_checkpoint_service.FAILED
                 
                 rows = data[self.working_pop_service].get("row", [])
                 if not rows:
                     logger.warning("가져올 직장 인구 데이터가 없습니다.")
-                    return 0
+                    return ingestion_checkpoint_service.FAILED
                 
                 # 최신 분기만 필터링
-                # 모든 row의 STDR_YYQU_CD를 비교해서 가장 큰 값만 남김
-                latest_quarter = max(row.get("STDR_YYQU_CD") for row in rows if row.get("STDR_YYQU_CD"))
-                rows = [row for row in rows if row.get("STDR_YYQU_CD") == latest_quarter]
+                # 수집 여부를 판단한 분기(첫 페이지 최댓값)를 그대로 저장/완료 처리에 사용
+                latest_quarter = pending_quarter
+                rows = [row for row in rows if str(row.get("STDR_YYQU_CD")) == latest_quarter]
                 logger.info(f"{latest_quarter} 직장 인구 데이터 저장 중...")
                 
                 for row in rows:
@@ -132,14 +141,16 @@ class WorkingPopulationService:
                     except Exception as e:
                         logger.warning(f"직장 인구 업데이트 실패: {e}")
 
+                aggregate_cache_service.bump_version(db, aggregate_cache_service.POPULATION)
                 db.commit()
                 logger.info(f"직장 인구 데이터 저장 완료")
-                return
+                ingestion_checkpoint_service.mark_completed(self.working_pop_service, latest_quarter)
+                return ingestion_checkpoint_service.UPDATED
 
         except Exception as e:
             db.rollback()
             logger.error(f"직장 인구 데이터 호출 및 저장 실패 : {e}")
-            return 
+            return ingestion_checkpoint_service.FAILED
         finally:
             db.close()
 
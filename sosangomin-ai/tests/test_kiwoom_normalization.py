@@ -0,0 +1,112 @@
+# tests/test_kiwoom_normalization.py
+"""키움 POS 정규화가 이전 구현(df.T.drop_duplicates().T, 행 단위 apply)과 같은 결과를 내는지 확인"""
+
+import glob
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.kiwoom_normalizer import kiwoom_normalizer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "kiwoom")
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.xlsx")))
+
+
+def normalize_kiwoom_legacy(df: pd.DataFrame) -> pd.DataFrame:
+    """최적화 이전 AutoAnalysisService._normalize_kiwoom (비교 기준)"""
+    header_values = set(df.columns.tolist())
+    columns_to_drop = [col for col in df.columns if any(df[col].astype(str).isin(header_values))]
+    df = df.drop(columns=columns_to_drop)
+
+    if df.empty:
+        raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
+
+    df = df.dropna(axis=0, how='all')
+    df = df.dropna(axis=1, how='all')
+    df = df.loc[:, df.nunique() > 1]
+    df = df.T.drop_duplicates().T
+
+    if df.empty:
+        raise ValueError("전처리 결과가 비어 있습니다. 엑셀 파일의 구조가 예상과 다를 수 있습니다.")
+
+    cols_to_fill = [col for col in df.columns if 'Unnamed' not in str(col)]
+    df[cols_to_fill] = df[cols_to_fill].ffill()
+
+    dup_val = ['단가', '수량', '원가', '거스름']
+    for val in dup_val:
+        columns = [col for col in df.columns if df[col].astype(str).str.contains(val, na=False).any()]
+        if columns:
+            df[val] = df[columns].bfill(axis=1).iloc[:, 0]
+            df = df.drop(columns=columns)
+    if "거스름" in df.columns:
+        df.drop(columns=['거스름'], inplace=True)
+    if "원가" in df.columns:
+        df.drop(columns=['원가'], inplace=True)
+
+    df = df.dropna(axis=0, how='any')
+
+    if df.shape[0] == 0:
+        raise ValueError("컬럼명 처리 전에 데이터가 존재하지 않습니다.")
+
+    new_columns = [df.iloc[0, i] if 'Unnamed' in str(col) else col for i, col in enumerate(df.columns)]
+    df.columns = new_columns
+    df = df[~df.apply(lambda row: any(row.astype(str).isin(new_columns)), axis=1)]
+
+    if df.empty:
+        raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
+
+    df = df.loc[:, df.nunique() > 1]
+
+    if df.empty:
+        raise ValueError("컬럼명 처리 후 데이터프레임이 비어 있습니다. 데이터 구조를 확인하세요.")
+
+    df = df.drop(columns=['총매출', '실매출'], errors='ignore')
+    df['매출'] = (df['단가'] * df['수량']).astype(int)
+    return df
+
+
+def assert_same_frame(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(actual.columns) == list(expected.columns)
+    assert list(actual.dtypes) == list(expected.dtypes)
+    assert actual.index.equals(expected.index)
+    assert pickle.dumps(actual) == pickle.dumps(expected)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_normalize_kiwoom_matches_legacy(path):
+    df = pd.read_excel(path, header=2)
+    assert_same_frame(normalize_kiwoom_legacy(df.copy()), kiwoom_normalizer.normalize(df.copy()))
+
+
+def test_drop_duplicate_columns_missing_values_match_drop_duplicates():
+    # None/NaN만 다른 열의 처리도 전치 + drop_duplicates와 같아야 함
+    df = pd.DataFrame({
+        "a": ["x", None, "y"],
+        "b": ["x", np.nan, "y"],
+        "c": ["x", None, "y"],
+        "d": [1.0, np.nan, 2.0],
+        "e": ["x", pd.NaT, "y"],
+    }, dtype=object)
+    assert_same_frame(df.T.drop_duplicates().T, kiwoom_normalizer.drop_duplicate_columns(df))
+
+
+def test_drop_duplicate_columns_mixed_types():
+    df = pd.DataFrame({
+        "a": [1, 2, 3],
+        "b": ["1", "2", "3"],
+        "c": [1, 2, 3],
+        "d": [1.0, 2.0, 3.0],
+        "e": [pd.Timestamp("2024-01-01"), pd.NaT, pd.Timestamp("2024-01-02")],
+    })
+    assert_same_frame(df.T.drop_duplicates().T, kiwoom_normalizer.drop_duplicate_columns(df))
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_header_row_mask_matches_row_apply(path):
+    df = pd.read_excel(path, header=2)
+    header_names = ["상품 명칭", "단가", "수량", "결제 수단"]
+    expected = df.apply(lambda row: any(row.astype(str).isin(header_names)), axis=1).to_numpy()
+    np.testing.assert_array_equal(kiwoom_normalizer.header_row_mask(df, header_names), expected)